@@ -0,0 +1,141 @@
+""" Measures how long EdgeSimPy takes to load a synthetic dataset and to look up components by ID.
+
+Usage:
+    python benchmarks/dataset_loading.py --grid-size 30 --users 20000 --repetitions 3
+
+The dataset (a hexagonal grid of base stations and network switches, edge servers, container registries, services, and users) is
+built with the dataset generator helpers and kept in memory, so only the "Simulator.initialize()" method is timed. Run the script
+on two revisions of the repository to compare them.
+"""
+# EdgeSimPy components
+from edge_sim_py import *
+from edge_sim_py.dataset_generator.network_topologies.partially_connected_hexagonal_mesh import find_neighbors_hexagonal_grid
+
+# Python libraries
+import argparse
+import copy
+import os
+import random
+import tempfile
+import time
+
+
+def build_dataset(grid_size: int, users: int, servers: int, seed: int) -> dict:
+    """Builds a synthetic dataset.
+
+    Args:
+        grid_size (int): Number of rows and columns of the hexagonal grid of base stations.
+        users (int): Number of users.
+        servers (int): Number of edge servers.
+        seed (int): Seed of the random number generator.
+
+    Returns:
+        dict: Dataset.
+    """
+    random.seed(seed)
+
+    # Creating base stations and network switches
+    map_coordinates = hexagonal_grid(x_size=grid_size, y_size=grid_size)
+    for coordinates in map_coordinates:
+        base_station = BaseStation()
+        base_station.wireless_delay = 0
+        base_station.coordinates = coordinates
+        base_station._connect_to_network_switch(network_switch=sample_switch())
+
+    # Creating network links
+    links = set()
+    for switch in NetworkSwitch.all():
+        for neighbor in find_neighbors_hexagonal_grid(map_coordinates=map_coordinates, current_position=switch.coordinates):
+            links.add(frozenset([switch.coordinates, neighbor]))
+    partially_connected_hexagonal_mesh(
+        network_nodes=NetworkSwitch.all(),
+        link_specifications=[{"number_of_objects": len(links), "delay": 1, "bandwidth": 12.5}],
+    )
+
+    # Creating edge servers
+    for index, base_station in enumerate(random.sample(BaseStation.all(), servers)):
+        edge_server = [e5430, jetson_nano, raspberry_pi4][index % 3]()
+        edge_server.power_model = LinearServerPowerModel
+        base_station._connect_to_edge_server(edge_server=edge_server)
+
+    # Creating container images and registries
+    images = [
+        {
+            "name": f"app{index}",
+            "tag": "latest",
+            "digest": f"sha256:app{index}",
+            "layers": [
+                {"digest": "sha256:base", "size": 3, "instruction": "ADD base"},
+                {"digest": f"sha256:app{index}", "size": 5 + index, "instruction": f"RUN app{index}"},
+            ],
+        }
+        for index in range(4)
+    ]
+    registries = create_container_registries(
+        container_image_specifications=images,
+        container_registry_specifications=[
+            {"number_of_objects": 2, "cpu_demand": 0, "memory_demand": 0, "images": [{"name": image["name"], "tag": "latest"} for image in images]}
+        ],
+    )
+    random_fit_registries(container_registry_specifications=registries, servers=EdgeServer.all())
+
+    # Creating applications, services, and users
+    for index in range(servers):
+        application = Application()
+        service = Service(image_digest=f"sha256:app{index % 4}", cpu_demand=1, memory_demand=512, state=0)
+        application.connect_to_service(service)
+
+    for _ in range(users):
+        user = User()
+        user.mobility_model = random_mobility
+        user._set_initial_position(coordinates=random.choice(map_coordinates), number_of_replicates=2)
+        application = random.choice(Application.all())
+        user._connect_to_application(app=application, delay_sla=random.randint(3, 8))
+        CircularDurationAndIntervalAccessPattern(user=user, app=application, start=1, duration_values=[3, 5, 8], interval_values=[2, 6])
+
+    random_fit_services()
+
+    return ComponentManager.export_scenario(save_to_file=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures how long EdgeSimPy takes to load a synthetic dataset.")
+    parser.add_argument("--grid-size", type=int, default=30, help="Number of rows and columns of the grid of base stations.")
+    parser.add_argument("--users", type=int, default=20000, help="Number of users.")
+    parser.add_argument("--servers", type=int, default=40, help="Number of edge servers.")
+    parser.add_argument("--repetitions", type=int, default=3, help="Number of times the dataset is loaded.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the random number generator.")
+    arguments = parser.parse_args()
+
+    # Building the dataset inside a temporary directory, as exporting scenarios creates a "datasets" directory
+    working_directory = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    try:
+        dataset = build_dataset(grid_size=arguments.grid_size, users=arguments.users, servers=arguments.servers, seed=arguments.seed)
+    finally:
+        os.chdir(working_directory)
+
+    print(f"Dataset: {', '.join(f'{len(components)} {name}' for name, components in dataset.items() if len(components) > 0)}")
+
+    for repetition in range(arguments.repetitions):
+        # Each simulator adopts the objects of the dataset it loads, so every repetition loads a fresh copy
+        simulator = Simulator()
+        data = copy.deepcopy(dataset)
+
+        start = time.perf_counter()
+        simulator.initialize(input_file=data)
+        initialize_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        lookups = 0
+        for component_class in [BaseStation, NetworkSwitch, NetworkLink, EdgeServer, User]:
+            for obj_id in range(1, component_class.count() + 1):
+                component_class.find_by_id(obj_id)
+                lookups += 1
+        lookup_time = time.perf_counter() - start
+
+        print(f"Repetition {repetition + 1}: initialize() {initialize_time:.2f}s, {lookups} find_by_id() calls {lookup_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
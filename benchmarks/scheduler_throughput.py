@@ -0,0 +1,80 @@
+""" Measures how many time steps per second EdgeSimPy's activation schedulers run as the number of agents grows.
+
+Usage:
+    python benchmarks/scheduler_throughput.py --agents 10000 100000 1000000 --steps 5
+
+Agents do nothing when activated, except for one in every 1000 agents, which adds a new agent to the schedule at each step
+(similarly to the network flows and container layers created during simulations). Hence, the measured throughput reflects the
+cost of the schedulers themselves. Run the script on two revisions of the repository to compare them.
+"""
+# EdgeSimPy components
+from edge_sim_py.activation_schedulers import BaseScheduler, RandomScheduler
+
+# Mesa modules
+from mesa import Agent, Model
+
+# Python libraries
+import argparse
+import time
+
+
+class IdleAgent(Agent):
+    """Agent that does nothing when activated."""
+
+    def step(self):
+        """Method that executes the events involving the object at each time step."""
+        pass
+
+
+class SpawningAgent(Agent):
+    """Agent that adds a new agent to the schedule whenever it is activated."""
+
+    def step(self):
+        """Method that executes the events involving the object at each time step."""
+        self.model.last_agent_id += 1
+        self.model.schedule.add(IdleAgent(unique_id=self.model.last_agent_id, model=self.model))
+
+
+def measure_throughput(scheduler_class: type, agents: int, steps: int) -> float:
+    """Measures how many time steps per second a scheduler runs.
+
+    Args:
+        scheduler_class (type): Activation scheduler class.
+        agents (int): Initial number of agents.
+        steps (int): Number of time steps executed.
+
+    Returns:
+        float: Time steps per second.
+    """
+    model = Model()
+    model.schedule = scheduler_class(model)
+    model.last_agent_id = 0
+
+    for index in range(agents):
+        model.last_agent_id += 1
+        agent_class = SpawningAgent if index % 1000 == 0 else IdleAgent
+        model.schedule.add(agent_class(unique_id=model.last_agent_id, model=model))
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        model.schedule.step()
+
+    return steps / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures the throughput of EdgeSimPy's activation schedulers.")
+    parser.add_argument("--agents", type=int, nargs="+", default=[10000, 100000, 1000000], help="Initial numbers of agents.")
+    parser.add_argument("--steps", type=int, default=5, help="Number of time steps executed per measurement.")
+    parser.add_argument("--schedulers", nargs="+", default=["BaseScheduler", "RandomScheduler"], help="Activation schedulers.")
+    arguments = parser.parse_args()
+
+    schedulers = {"BaseScheduler": BaseScheduler, "RandomScheduler": RandomScheduler}
+    for agents in arguments.agents:
+        for scheduler_name in arguments.schedulers:
+            throughput = measure_throughput(scheduler_class=schedulers[scheduler_name], agents=agents, steps=arguments.steps)
+            print(f"{scheduler_name} with {agents} agents: {throughput:.3f} ticks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,9 @@ __version__ = "1.1.0"
 # Main simulation component
 from .simulator import Simulator
 
+# Parallel execution of simulation replicates
+from .replicates import run_replicates
+
 # Misc components
 from .component_manager import ComponentManager
 
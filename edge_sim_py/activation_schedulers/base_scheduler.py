@@ -15,13 +15,44 @@ class BaseScheduler(MesaBaseScheduler):
     is based on Mesa's BaseScheduler. It activates agents one at a time, in the order they were added. This is explicitly
     meant to replicate the scheduler in MASON"""
 
+    def __init__(self, model: object) -> object:
+        """Creates a BaseScheduler object.
+
+        Args:
+            model (object): Simulator object.
+
+        Returns:
+            object: Created BaseScheduler object.
+        """
+        MesaBaseScheduler.__init__(self, model=model)
+
+        # Agents waiting to be activated in the current step (agents added during the step are appended to it)
+        self._activation_queue = None
+
+    def add(self, agent: object) -> None:
+        """Adds an agent to the schedule.
+
+        Args:
+            agent (object): Agent object.
+        """
+        MesaBaseScheduler.add(self, agent=agent)
+
+        # Agents added in the middle of a step are activated after the agents that were already in the schedule
+        if self._activation_queue is not None:
+            self._activation_queue.append(agent)
+
     def step(self) -> None:
         """Defines what happens at each step of the simulation model."""
-        while any([not was_activated(agent, self.steps) for agent in list(self._agents.values())]):
-            agent = next((agent for agent in list(self._agents.values()) if not was_activated(agent, self.steps)), None)
-            agent.last_activation = self.steps
+        self._activation_queue = list(self._agents.values())
+
+        # Agents removed from the schedule or already activated in the current step are skipped
+        for agent in self._activation_queue:
+            if self._agents.get(agent.unique_id) is agent and not was_activated(agent, self.steps):
+                agent.last_activation = self.steps
+
+                agent.step()
 
-            agent.step()
+        self._activation_queue = None
 
         # Advancing simulation
         self.steps += 1
@@ -9,8 +9,109 @@ from mesa.time import BaseScheduler as MesaBaseScheduler
 class DefaultScheduler(MesaBaseScheduler):
     """Class responsible for scheduling the events that take place at each step of the simulation model."""
 
+    # Classes whose agents are only activated while they have events to process (e.g., services with ongoing migrations)
+    tracked_classes = [Service, NetworkFlow, ContainerRegistry]
+
+    # Classes whose built-in activation procedures do nothing. Their agents are only activated if they override such procedures
+    passive_classes = [NetworkSwitch, BaseStation, ContainerLayer, ContainerImage, Application]
+
+    def __init__(self, model: object) -> object:
+        """Creates a DefaultScheduler object.
+
+        Args:
+            model (object): Simulator object.
+
+        Returns:
+            object: Created DefaultScheduler object.
+        """
+        MesaBaseScheduler.__init__(self, model=model)
+
+        # Agents that must be activated, indexed by class. Dictionaries are used as ordered sets
+        self._active_agents = {component_class: {} for component_class in self.tracked_classes + self.passive_classes}
+
+        # Network flows and links that override the built-in activation procedure (activated on their own when flows are stored in a
+        # flow table)
+        self._custom_network_flows = {}
+        self._custom_network_links = {}
+
+    def add(self, agent: object) -> None:
+        """Adds an agent to the schedule.
+
+        Args:
+            agent (object): Agent object.
+        """
+        MesaBaseScheduler.add(self, agent=agent)
+
+        # Network flows and container registries are tracked from their creation until their provisioning finishes
+        if isinstance(agent, (NetworkFlow, ContainerRegistry)):
+            self.register_active_agent(agent=agent)
+
+            if isinstance(agent, NetworkFlow) and type(agent).step is not NetworkFlow.step:
+                self._custom_network_flows[agent] = None
+
+        # Services are tracked while they have an ongoing migration
+        elif isinstance(agent, Service) and len(agent._Service__migrations) > 0 and agent._Service__migrations[-1]["end"] == None:
+            self.register_active_agent(agent=agent)
+
+        elif isinstance(agent, NetworkLink):
+            if type(agent).step is not NetworkLink.step:
+                self._custom_network_links[agent] = None
+
+        # Agents from passive classes are only tracked if they override their class' activation procedure
+        else:
+            for component_class in self.passive_classes:
+                if isinstance(agent, component_class) and type(agent).step is not component_class.step:
+                    self.register_active_agent(agent=agent)
+
+    def remove(self, agent: object) -> None:
+        """Removes an agent from the schedule.
+
+        Args:
+            agent (object): Agent object.
+        """
+        MesaBaseScheduler.remove(self, agent=agent)
+        self.unregister_active_agent(agent=agent)
+        self._custom_network_flows.pop(agent, None)
+        self._custom_network_links.pop(agent, None)
+
+    def register_active_agent(self, agent: object) -> None:
+        """Tells the scheduler that an agent has events to process and thus must be activated at the next time steps.
+
+        Args:
+            agent (object): Agent object.
+        """
+        for component_class, active_agents in self._active_agents.items():
+            if isinstance(agent, component_class):
+                active_agents[agent] = None
+
+    def unregister_active_agent(self, agent: object) -> None:
+        """Tells the scheduler that an agent has no events to process and thus does not need to be activated anymore.
+
+        Args:
+            agent (object): Agent object.
+        """
+        for active_agents in self._active_agents.values():
+            active_agents.pop(agent, None)
+
+    def _activate_tracked_agents(self, component_class: type, is_idle: object) -> None:
+        """Activates the tracked agents of a given class in the order they were created, unregistering those that have no
+        events left to process.
+
+        Args:
+            component_class (type): Class whose tracked agents will be activated.
+            is_idle (object): Function that checks whether an agent has no events left to process.
+        """
+        active_agents = self._active_agents[component_class]
+
+        for agent in sorted(active_agents, key=lambda agent: agent.unique_id):
+            agent.step()
+
+            if is_idle(agent):
+                active_agents.pop(agent, None)
+
     def step(self) -> None:
-        """Defines what happens at each step of the simulation model.
+        """Defines what happens at each step of the simulation model. Services, network flows, and container registries are
+        only activated while they have events to process, and agents whose activation procedures do nothing are skipped.
 
         Activation Order:
             - Edge Servers
@@ -18,7 +119,7 @@ class DefaultScheduler(MesaBaseScheduler):
                 - Useless container layers
 
             - Network Flows
-                - Progress and status update
+                - Progress and status update (batched when flows are stored in a flow table)
 
             - Services
                 - Migration status update
@@ -42,31 +143,47 @@ class DefaultScheduler(MesaBaseScheduler):
         for agent in EdgeServer.all():
             agent.step()
 
-        for agent in Service.all():
-            agent.step()
+        self._activate_tracked_agents(
+            component_class=Service,
+            is_idle=lambda service: len(service._Service__migrations) == 0 or service._Service__migrations[-1]["end"] != None,
+        )
 
         for agent in Topology.all():
             agent.step()
 
-        for agent in NetworkFlow.all():
-            agent.step()
+        if self.model.flow_table is not None:
+            # Flows stored in a flow table progress in a single batched operation, except for those that override the built-in activation
+            # procedure, which are activated on their own
+            for flow in self.model.flow_table.step():
+                self._active_agents[NetworkFlow].pop(flow, None)
+
+            for flow in sorted(self._custom_network_flows, key=lambda flow: flow.unique_id):
+                flow.step()
+
+                if flow.status != "active":
+                    self._custom_network_flows.pop(flow, None)
+                    self._active_agents[NetworkFlow].pop(flow, None)
+        else:
+            self._activate_tracked_agents(component_class=NetworkFlow, is_idle=lambda flow: flow.status != "active")
 
         for agent in User.all():
             agent.step()
 
-        for agent in ContainerRegistry.all():
-            agent.step()
+        self._activate_tracked_agents(component_class=ContainerRegistry, is_idle=lambda registry: registry.available)
 
-        other_agents = (
-            NetworkSwitch.all()
-            + NetworkLink.all()
-            + BaseStation.all()
-            + ContainerLayer.all()
-            + ContainerImage.all()
-            + Application.all()
-        )
-        for agent in other_agents:
-            agent.step()
+        self._activate_tracked_agents(component_class=NetworkSwitch, is_idle=lambda agent: False)
+
+        if self.model.flow_table is not None:
+            # The bandwidth demand of links is updated in a single batched operation
+            self.model.flow_table.update_link_demands()
+            for agent in self._custom_network_links:
+                agent.step()
+        else:
+            for agent in NetworkLink.all():
+                agent.step()
+
+        for component_class in [BaseStation, ContainerLayer, ContainerImage, Application]:
+            self._activate_tracked_agents(component_class=component_class, is_idle=lambda agent: False)
 
         # Advancing simulation
         self.steps += 1
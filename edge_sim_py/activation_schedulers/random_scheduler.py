@@ -19,19 +19,51 @@ class RandomScheduler(MesaBaseScheduler):
     is equivalent to the NetLogo 'ask agents...' and is generally the default behavior for an ABM.
     """
 
+    def __init__(self, model: object) -> object:
+        """Creates a RandomScheduler object.
+
+        Args:
+            model (object): Simulator object.
+
+        Returns:
+            object: Created RandomScheduler object.
+        """
+        MesaBaseScheduler.__init__(self, model=model)
+
+        # Agents waiting to be activated in the current step (agents added during the step are appended to it)
+        self._activation_queue = None
+
+    def add(self, agent: object) -> None:
+        """Adds an agent to the schedule.
+
+        Args:
+            agent (object): Agent object.
+        """
+        MesaBaseScheduler.add(self, agent=agent)
+
+        # Agents added in the middle of a step compete for activation with the agents that were not activated yet
+        if self._activation_queue is not None:
+            self._activation_queue.append(agent)
+
     def step(self) -> None:
-        """Defines what happens at each step of the simulation model."""
-        agents = list(self._agents.values())
-        agents = random.sample(agents, len(agents))
+        """Defines what happens at each step of the simulation model. At each activation, the next agent is drawn uniformly
+        at random from the agents that were not activated in the current step yet, including agents added during the step.
+        """
+        self._activation_queue = list(self._agents.values())
+
+        while len(self._activation_queue) > 0:
+            # Drawing the next agent and moving the last agent in the queue to its position
+            index = random.randrange(len(self._activation_queue))
+            self._activation_queue[index], self._activation_queue[-1] = self._activation_queue[-1], self._activation_queue[index]
+            agent = self._activation_queue.pop()
 
-        while any([not was_activated(agent, self.steps) for agent in agents]):
-            agent = next((agent for agent in agents if not was_activated(agent, self.steps)), None)
-            agent.last_activation = self.steps
+            # Agents removed from the schedule or already activated in the current step are skipped
+            if self._agents.get(agent.unique_id) is agent and not was_activated(agent, self.steps):
+                agent.last_activation = self.steps
 
-            agent.step()
+                agent.step()
 
-            agents = list(self._agents.values())
-            agents = random.sample(agents, len(agents))
+        self._activation_queue = None
 
         # Advancing simulation
         self.steps += 1
@@ -4,16 +4,418 @@ Example:
     'Application.first()' allows you to get the first instance from Application class.
     'User.count()' allows you to get the number of created instances from class User.
     'Service.find_by_id(3)' allows you to find the Service object that has id attribute = 3
+    'BaseStation.find_by("coordinates", (0, 0))' allows you to find the BaseStation object located at coordinates (0, 0)
+    'NetworkFlow.archived()' allows you to get the final records of the NetworkFlow objects that finished and were archived
+
+Component registries (i.e., the lists of instances, object counters and indexes of each class) are scoped to the simulator that
+is active in the calling thread. Hence, multiple simulators can be kept in memory (or executed in separate threads) at once.
 """
 # Python libraries
 import os
 import json
+import threading
+
+# Thread-local reference to the simulator that is active in each thread
+_active_context = threading.local()
+
+# Registries that store components created while no simulator is active (e.g., when creating datasets)
+_unscoped_registries = {}
+_unscoped_registries_lock = threading.Lock()
+
+# Registries of component classes that are shared by all simulators in the process (i.e., classes that declare a
+# "_process_wide_registry" attribute, such as the Simulator class itself)
+_process_registries = {}
+_process_registries_lock = threading.Lock()
+
+
+def _get_active_model() -> object:
+    """Gets the simulator that is active in the calling thread.
+
+    Returns:
+        object: Active simulator (or None if no simulator is active).
+    """
+    return getattr(_active_context, "model", None)
+
+
+def _set_active_model(model: object):
+    """Sets the simulator that is active in the calling thread.
+
+    Args:
+        model (object): Simulator that will be activated.
+    """
+    _active_context.model = model
+
+
+def _adopt_unscoped_registries() -> dict:
+    """Transfers the registries of components created while no simulator was active to the caller.
+
+    Returns:
+        registries (dict): Registries of components created while no simulator was active.
+    """
+    with _unscoped_registries_lock:
+        registries = dict(_unscoped_registries)
+        _unscoped_registries.clear()
+
+    return registries
+
+
+class InstanceList(list):
+    """List of instances of a component class, which keeps track of the objects it holds (indexed by their identity, i.e., by
+    "id(obj)") so that checking if an object is inside the list takes constant time. Objects must not be added to the list twice.
+    """
+
+    def __init__(self, items: list = None) -> object:
+        """Creates an InstanceList object.
+
+        Args:
+            items (list, optional): Initial items. Defaults to None (empty list).
+
+        Returns:
+            object: Created InstanceList object.
+        """
+        list.__init__(self, items if items is not None else [])
+        self.members = {id(obj): obj for obj in self}
+
+    def __contains__(self, obj: object) -> bool:
+        """Checks if an object is inside the list.
+
+        Args:
+            obj (object): Object.
+
+        Returns:
+            bool: Whether the object is inside the list.
+        """
+        return id(obj) in self.members
+
+    def append(self, obj: object):
+        """Adds an object to the end of the list.
+
+        Args:
+            obj (object): Object to be added.
+        """
+        list.append(self, obj)
+        self.members[id(obj)] = obj
+
+    def extend(self, items: list):
+        """Adds the objects of an iterable to the end of the list.
+
+        Args:
+            items (list): Objects to be added.
+        """
+        items = list(items)
+        list.extend(self, items)
+        self.members.update((id(obj), obj) for obj in items)
+
+    def insert(self, index: int, obj: object):
+        """Adds an object before a given position of the list.
+
+        Args:
+            index (int): Position where the object will be added.
+            obj (object): Object to be added.
+        """
+        list.insert(self, index, obj)
+        self.members[id(obj)] = obj
+
+    def remove(self, obj: object):
+        """Removes an object from the list.
+
+        Args:
+            obj (object): Object to be removed.
+        """
+        list.remove(self, obj)
+        self.members.pop(id(obj), None)
+
+    def pop(self, index: int = -1) -> object:
+        """Removes and returns the object at a given position of the list.
+
+        Args:
+            index (int, optional): Position of the object. Defaults to -1 (last object).
+
+        Returns:
+            obj (object): Removed object.
+        """
+        obj = list.pop(self, index)
+        self.members.pop(id(obj), None)
+        return obj
+
+    def clear(self):
+        """Removes all objects from the list."""
+        list.clear(self)
+        self.members.clear()
+
+    def __setitem__(self, index: object, value: object):
+        """Replaces the object at a given position (or the objects within a given slice) of the list.
+
+        Args:
+            index (object): Position (int) or slice of the objects to be replaced.
+            value (object): New object (or iterable of new objects if "index" is a slice).
+        """
+        list.__setitem__(self, index, list(value) if isinstance(index, slice) else value)
+        self.members = {id(obj): obj for obj in self}
+
+    def __delitem__(self, index: object):
+        """Removes the object at a given position (or the objects within a given slice) of the list.
+
+        Args:
+            index (object): Position (int) or slice of the objects to be removed.
+        """
+        list.__delitem__(self, index)
+        self.members = {id(obj): obj for obj in self}
+
+    def __iadd__(self, items: list) -> object:
+        """Adds the objects of an iterable to the end of the list (i.e., the "+=" operator).
+
+        Args:
+            items (list): Objects to be added.
+
+        Returns:
+            object: The InstanceList object itself.
+        """
+        self.extend(items)
+        return self
+
+
+def _get_registry(cls: type) -> dict:
+    """Gets the registry of a given component class within the simulator that is active in the calling thread.
+
+    Args:
+        cls (type): Component class.
+
+    Returns:
+        registry (dict): Class registry.
+    """
+    if getattr(cls._registry_owner, "_process_wide_registry", False):
+        registries = _process_registries
+    else:
+        model = getattr(_active_context, "model", None)
+        registries = model._component_registries if model is not None else _unscoped_registries
+
+    registry = registries.get(cls._registry_owner)
+    if registry is None:
+        registry = {
+            "_instances": InstanceList(),
+            "_removed_instances": {},
+            "_object_count": 0,
+            "_instances_by_id": {},
+            "_indexes": {},
+            "_archive": [],
+            "_catalog": {},
+        }
+        registries[cls._registry_owner] = registry
+
+    return registry
+
+
+class RegistryAttribute:
+    """Descriptor that resolves a class-level registry attribute (e.g., "_instances") within the active simulator."""
+
+    def __init__(self, name: str, value_type: type = None):
+        """Creates a RegistryAttribute descriptor.
+
+        Args:
+            name (str): Name of the registry attribute.
+            value_type (type, optional): Type the values assigned to the registry attribute are converted to (e.g., the InstanceList
+                class for the lists of instances). Defaults to None (values are stored as they are).
+        """
+        self.name = name
+        self.value_type = value_type
+
+    def __get__(self, cls: type, metaclass: type = None) -> object:
+        """Retrieves the registry attribute of a given class.
+
+        Args:
+            cls (type): Component class.
+            metaclass (type, optional): Component class' metaclass. Defaults to None.
+
+        Returns:
+            object: Registry attribute value.
+        """
+        if cls is None:
+            return self
+
+        return _get_registry(cls)[self.name]
+
+    def __set__(self, cls: type, value: object):
+        """Overrides the registry attribute of a given class.
+
+        Args:
+            cls (type): Component class.
+            value (object): Value for the registry attribute.
+        """
+        if self.value_type is not None and type(value) is not self.value_type:
+            value = self.value_type(value)
+
+        _get_registry(cls)[self.name] = value
+
+
+class ComponentManagerMeta(type):
+    """Metaclass that scopes the lists of instances, object counters and indexes of component classes to the active simulator."""
+
+    _instances = RegistryAttribute(name="_instances", value_type=InstanceList)
+    _removed_instances = RegistryAttribute(name="_removed_instances")
+    _object_count = RegistryAttribute(name="_object_count")
+    _instances_by_id = RegistryAttribute(name="_instances_by_id")
+    _indexes = RegistryAttribute(name="_indexes")
+    _archive = RegistryAttribute(name="_archive")
+    _catalog = RegistryAttribute(name="_catalog")
+
+    def __init__(cls, name: str, bases: tuple, namespace: dict, **kwargs):
+        """Initializes a component class, defining which class owns the registry its objects are stored in. Direct subclasses of
+        ComponentManager own their registries, whereas their subclasses share their parents' registries (unless they explicitly
+        declare an "_instances" class attribute).
+
+        Args:
+            name (str): Class name.
+            bases (tuple): Base classes.
+            namespace (dict): Class namespace.
+        """
+        super().__init__(name, bases, namespace, **kwargs)
+
+        # Component classes within the class hierarchy (the last one is ComponentManager itself)
+        component_classes = [base for base in cls.__mro__ if isinstance(base, ComponentManagerMeta)]
+        default_owner = component_classes[-2] if len(component_classes) > 1 else cls
+
+        cls._registry_owner = next((base for base in component_classes if "_instances" in base.__dict__), default_owner)
+
+    @property
+    def _ComponentManager__model(cls) -> object:
+        """Simulator that is active in the calling thread.
+
+        Returns:
+            object: Active simulator.
+        """
+        return _get_active_model()
 
+    @_ComponentManager__model.setter
+    def _ComponentManager__model(cls, model: object):
+        """Activates a simulator in the calling thread.
 
-class ComponentManager:
+        Args:
+            model (object): Simulator that will be activated.
+        """
+        _set_active_model(model=model)
+
+
+def _index_key(value: object) -> object:
+    """Converts an attribute value into a hashable key that can be used inside secondary indexes.
+
+    Args:
+        value (object): Attribute value.
+
+    Returns:
+        key (object): Hashable representation of the value (or None if the value cannot be hashed).
+    """
+    if type(value) is list or type(value) is tuple:
+        value = tuple(_index_key(item) for item in value)
+
+    try:
+        hash(value)
+    except TypeError:
+        return None
+
+    return value
+
+
+class IndexedAttribute:
+    """Descriptor that keeps the secondary index of a component class up to date whenever an indexed attribute is assigned."""
+
+    def __init__(self, name: str):
+        """Creates an IndexedAttribute descriptor.
+
+        Args:
+            name (str): Name of the indexed attribute.
+        """
+        self.name = name
+
+    def __get__(self, obj: object, objtype: type = None) -> object:
+        """Retrieves the attribute value from the object.
+
+        Args:
+            obj (object): Object whose attribute will be retrieved.
+            objtype (type, optional): Object class. Defaults to None.
+
+        Returns:
+            object: Attribute value.
+        """
+        if obj is None:
+            return self
+
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(f"Object {obj} has no such attribute '{self.name}'.")
+
+    def __set__(self, obj: object, value: object):
+        """Overrides the attribute value and moves the object to the matching entry of its class' secondary index.
+
+        Args:
+            obj (object): Object whose attribute will be changed.
+            value (object): Value for the attribute.
+        """
+        if self.name in obj.__dict__:
+            obj.__class__._remove_from_index(obj=obj, attribute_name=self.name, attribute_value=obj.__dict__[self.name])
+
+        obj.__dict__[self.name] = value
+        obj.__class__._add_to_index(obj=obj, attribute_name=self.name, attribute_value=value)
+
+
+class TrackedAttribute:
+    """Descriptor that reports the new state of an object to the model-level metrics of its simulator whenever a tracked attribute
+    is assigned. As the descriptor does not define "__get__", reading the attribute is as fast as reading a regular attribute.
+    """
+
+    def __init__(self, name: str):
+        """Creates a TrackedAttribute descriptor.
+
+        Args:
+            name (str): Name of the tracked attribute.
+        """
+        self.name = name
+
+    def __set__(self, obj: object, value: object):
+        """Overrides the attribute value and reports the object's new state to the model-level metrics of its simulator.
+
+        Args:
+            obj (object): Object whose attribute will be changed.
+            value (object): Value for the attribute.
+        """
+        obj.__dict__[self.name] = value
+        obj._update_kpis()
+
+
+class ComponentManager(metaclass=ComponentManagerMeta):
     """This class provides auxiliary methods that facilitate object manipulation."""
 
-    __model = None
+    # List of attributes whose values are indexed to speed up "find_by" and "find_all_by" queries. Indexed attributes must
+    # be reassigned (rather than modified in place) so that the index is kept up to date
+    _indexed_attributes = []
+
+    # List of attributes whose changes affect model-level metrics (e.g., the server attributes used to compute power consumption).
+    # Tracked attributes must be reassigned (rather than modified in place) so that model-level metrics are kept up to date
+    _tracked_attributes = []
+
+    def __init_subclass__(cls, **kwargs):
+        """Installs IndexedAttribute and TrackedAttribute descriptors for the attributes declared inside the "_indexed_attributes"
+        and "_tracked_attributes" class attributes.
+
+        Args:
+            cls (type): Component class being declared.
+        """
+        super().__init_subclass__(**kwargs)
+
+        for attribute_name in cls.__dict__.get("_indexed_attributes", []):
+            setattr(cls, attribute_name, IndexedAttribute(name=attribute_name))
+
+        for attribute_name in cls.__dict__.get("_tracked_attributes", []):
+            setattr(cls, attribute_name, TrackedAttribute(name=attribute_name))
+
+    def _update_kpis(self):
+        """Reports the object's current state to the model-level metrics maintained by its simulator (if the object was already
+        added to a simulator and its class contributes to model-level metrics through the "update_kpis()" method).
+        """
+        model = self.__dict__.get("model")
+        if model is not None and getattr(model, "kpis", None) is not None and hasattr(self, "update_kpis"):
+            self.update_kpis(kpis=model.kpis)
 
     def __str__(self) -> str:
         """Defines how the object is represented inside print statements.
@@ -54,7 +456,7 @@ class ComponentManager:
 
         for component in ComponentManager.__subclasses__():
             if component.__name__ not in ignore_list:
-                scenario[component.__name__] = [instance._to_dict() for instance in component._instances]
+                scenario[component.__name__] = [instance._to_dict() for instance in component.all()]
                 with open(f"datasets/{file_name}.json", "w", encoding="UTF-8") as output_file:
                     json.dump(scenario, output_file, indent=4)
 
@@ -71,9 +473,16 @@ class ComponentManager:
             created_object (object): Object created from the dictionary specification.
         """
         created_object = cls()
+        original_id = created_object.id
+
         for attribute, value in dictionary.items():
             setattr(created_object, attribute, value)
 
+        # Updating the ID index in case the dictionary specification overrides the object's ID
+        if created_object.id != original_id:
+            cls._unindex_instance(obj=created_object, obj_id=original_id)
+            cls._instances_by_id.setdefault(created_object.id, created_object)
+
         return created_object
 
     @classmethod
@@ -87,9 +496,77 @@ class ComponentManager:
         Returns:
             object: Class object.
         """
-        class_object = next((obj for obj in cls._instances if getattr(obj, attribute_name) == attribute_value), None)
+        candidates = cls._get_index_candidates(attribute_name=attribute_name, attribute_value=attribute_value)
+        class_object = next((obj for obj in candidates if getattr(obj, attribute_name) == attribute_value), None)
         return class_object
 
+    @classmethod
+    def find_all_by(cls, attribute_name: str, attribute_value: object) -> list:
+        """Finds all objects from a given class that share a given value for an user-specified attribute.
+
+        Args:
+            attribute_name (str): Attribute name.
+            attribute_value (object): Attribute value.
+
+        Returns:
+            list: Class objects.
+        """
+        candidates = cls._get_index_candidates(attribute_name=attribute_name, attribute_value=attribute_value)
+        class_objects = [obj for obj in candidates if getattr(obj, attribute_name) == attribute_value]
+        return class_objects
+
+    @classmethod
+    def _get_index_candidates(cls, attribute_name: str, attribute_value: object) -> list:
+        """Gets the objects that might have a given attribute value. Indexed attributes are resolved through the class' secondary
+        index, whereas the remaining attributes are resolved by scanning the list of instances of the class.
+
+        Args:
+            attribute_name (str): Attribute name.
+            attribute_value (object): Attribute value.
+
+        Returns:
+            list: Candidate objects.
+        """
+        key = _index_key(attribute_value)
+        if attribute_name not in cls._indexed_attributes or key is None:
+            return cls.all()
+
+        return cls._indexes.get(attribute_name, {}).get(key, [])
+
+    @classmethod
+    def _add_to_index(cls, obj: object, attribute_name: str, attribute_value: object):
+        """Adds an object to the secondary index of one of its attributes.
+
+        Args:
+            obj (object): Object to be indexed.
+            attribute_name (str): Attribute name.
+            attribute_value (object): Attribute value.
+        """
+        key = _index_key(attribute_value)
+        if key is not None:
+            cls._indexes.setdefault(attribute_name, {}).setdefault(key, []).append(obj)
+
+    @classmethod
+    def _remove_from_index(cls, obj: object, attribute_name: str, attribute_value: object):
+        """Removes an object from the secondary index of one of its attributes.
+
+        Args:
+            obj (object): Object to be removed from the index.
+            attribute_name (str): Attribute name.
+            attribute_value (object): Attribute value.
+        """
+        index = cls._indexes.get(attribute_name, {})
+        key = _index_key(attribute_value)
+        objects = index.get(key, [])
+
+        for position, indexed_object in enumerate(objects):
+            if indexed_object is obj:
+                del objects[position]
+                break
+
+        if len(objects) == 0 and key in index:
+            del index[key]
+
     @classmethod
     def find_by_id(cls, obj_id: int) -> object:
         """Finds a class object based on its ID attribute.
@@ -100,7 +577,14 @@ class ComponentManager:
         Returns:
             class_object (object): Class object found.
         """
-        class_object = next((obj for obj in cls._instances if obj.id == obj_id), None)
+        class_object = cls._instances_by_id.get(obj_id)
+
+        # Falling back to a linear search in case the index is outdated (e.g., the object ID was changed after its creation)
+        if class_object is None or class_object.id != obj_id:
+            class_object = next((obj for obj in cls.all() if obj.id == obj_id), None)
+            if class_object is not None:
+                cls._instances_by_id[obj_id] = class_object
+
         return class_object
 
     @classmethod
@@ -110,6 +594,12 @@ class ComponentManager:
         Returns:
             list: List of objects from a given class.
         """
+        # Applying pending removals (see the "remove()" method) to the list of instances
+        if len(cls._removed_instances) > 0:
+            removed_instances = cls._removed_instances
+            cls._instances[:] = [obj for obj in cls._instances if id(obj) not in removed_instances]
+            removed_instances.clear()
+
         return cls._instances
 
     @classmethod
@@ -119,10 +609,11 @@ class ComponentManager:
         Returns:
             object: Class object.
         """
-        if len(cls._instances) == 0:
+        instances = cls.all()
+        if len(instances) == 0:
             return None
 
-        return cls._instances[0]
+        return instances[0]
 
     @classmethod
     def last(cls) -> object:
@@ -131,7 +622,7 @@ class ComponentManager:
         Returns:
             object: Class object.
         """
-        return cls._instances[-1]
+        return cls.all()[-1]
 
     @classmethod
     def count(cls) -> int:
@@ -140,16 +631,55 @@ class ComponentManager:
         Returns:
             int: Number of instances from a given class.
         """
-        return len(cls._instances)
+        return len(cls._instances) - len(cls._removed_instances)
 
     @classmethod
     def remove(cls, obj: object):
-        """Removes an object from the list of instances of a given class.
+        """Removes an object from the list of instances of a given class. Objects are only dropped from the list the next time it
+        is read (e.g., through the "all()" method), so that removing many objects (e.g., archiving the network flows that finished
+        in a time step) takes a single pass over the list instead of one pass per object.
 
         Args:
             obj (object): Object to be removed.
         """
-        if obj not in cls._instances:
+        if obj not in cls._instances or id(obj) in cls._removed_instances:
             raise Exception(f"Object {obj} is not in the list of instances of the '{cls.__name__}' class.")
 
-        cls._instances.remove(obj)
+        cls._removed_instances[id(obj)] = obj
+        cls._unindex_instance(obj=obj, obj_id=obj.id)
+
+        for attribute_name in cls._indexed_attributes:
+            if attribute_name in obj.__dict__:
+                cls._remove_from_index(obj=obj, attribute_name=attribute_name, attribute_value=obj.__dict__[attribute_name])
+
+    @classmethod
+    def archive(cls, obj: object):
+        """Removes an object from the list of instances of a given class, keeping a compact record of its final state (i.e., the
+        metrics reported by its "collect()" method) so that it can still be queried after the simulation.
+
+        Args:
+            obj (object): Object to be archived.
+        """
+        record = {**{"Object": f"{obj}"}, **obj.collect()}
+        cls.remove(obj)
+        cls._archive.append(record)
+
+    @classmethod
+    def archived(cls) -> list:
+        """Returns the records of the archived objects of a given class.
+
+        Returns:
+            list: Records of the archived objects from a given class.
+        """
+        return cls._archive
+
+    @classmethod
+    def _unindex_instance(cls, obj: object, obj_id: int):
+        """Removes an object from the ID index of a given class.
+
+        Args:
+            obj (object): Object to be removed from the index.
+            obj_id (int): ID under which the object is indexed.
+        """
+        if cls._instances_by_id.get(obj_id) is obj:
+            del cls._instances_by_id[obj_id]
@@ -14,6 +14,7 @@ from .network_flow import NetworkFlow
 from .application import Application
 from .service import Service
 from .edge_server import EdgeServer
+from .flow_table import FlowTable
 
 # Network flow scheduling algorithms
 from .flow_scheduling import *
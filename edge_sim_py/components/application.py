@@ -9,10 +9,6 @@ from mesa import Agent
 class Application(ComponentManager, Agent):
     """Class that represents an application."""
 
-    # Class attributes that allow this class to use helper methods from the ComponentManager
-    _instances = []
-    _object_count = 0
-
     def __init__(self, obj_id: int = None, label: str = "") -> object:
         """Creates an Application object.
 
@@ -32,6 +28,9 @@ class Application(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
         # Application label
         self.label = label
 
@@ -63,9 +62,12 @@ class Application(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
@@ -76,6 +78,14 @@ class Application(ComponentManager, Agent):
         """Method that executes the events involving the object at each time step."""
         ...
 
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the object has events to process.
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the next event takes place.
+        """
+        return float("inf")
+
     def connect_to_service(self, service: object) -> object:
         """Creates a relationship between the application and a given Service object.
 
@@ -9,9 +9,8 @@ from mesa import Agent
 class BaseStation(ComponentManager, Agent):
     """Class that represents a base station."""
 
-    # Class attributes that allow this class to use helper methods from ComponentManager
-    _instances = []
-    _object_count = 0
+    # Attributes indexed to speed up lookups based on the 'find_by' helper method
+    _indexed_attributes = ["coordinates"]
 
     def __init__(self, obj_id: int = None) -> object:
         """Creates a BaseStation object.
@@ -31,6 +30,9 @@ class BaseStation(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
         # Base station coordinates
         self.coordinates = None
 
@@ -70,9 +72,12 @@ class BaseStation(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
@@ -83,6 +88,14 @@ class BaseStation(ComponentManager, Agent):
         """Method that executes the events involving the object at each time step."""
         ...
 
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the object has events to process.
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the next event takes place.
+        """
+        return float("inf")
+
     def _connect_to_network_switch(self, network_switch: object) -> object:
         """Creates a relationship between the base station and a given networkSwitch object.
 
@@ -0,0 +1,349 @@
+""" Contains a compiled (CSR-based) representation of network topologies used to speed up shortest path queries."""
+# Python libraries
+import heapq
+import networkx as nx
+import numpy as np
+
+# SciPy is an optional dependency, only required by the "scipy" solver
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra
+except ImportError:
+    csr_matrix = None
+    dijkstra = None
+
+
+SUPPORTED_SOLVERS = ["python", "scipy"]
+
+
+class CompiledGraph:
+    """Class that represents a snapshot of a NetworkX graph as Compressed Sparse Row (CSR) arrays, used to answer shortest path
+    queries. Two solvers are available:
+
+    - "python": pure-Python searches over the CSR arrays that visit neighbors in the same order as NetworkX and break ties the same
+      way, so that paths are identical to those returned by "nx.shortest_path()". Paths are found by a bidirectional breadth-first
+      search (unweighted queries) or a bidirectional Dijkstra's algorithm (weighted queries), while distances are found by Dijkstra's
+      algorithm, whose shortest path tree is cached for each source.
+    - "scipy": SciPy's Dijkstra implementation (requires SciPy), whose shortest path trees are cached for each source. Paths have the
+      same lengths as those found by NetworkX, but ties between equally short paths may be broken differently.
+    """
+
+    # Maximum number of shortest path trees kept in the cache (the cache is emptied once it reaches such size)
+    max_cached_trees = 512
+
+    # Edge attributes that can be used as path weights (None means all edges have weight 1)
+    supported_weights = [None, "delay"]
+
+    def __init__(self, graph: nx.Graph, solver: str = "python") -> object:
+        """Creates a CompiledGraph object.
+
+        Args:
+            graph (nx.Graph): Graph to be compiled.
+            solver (str, optional): Shortest path solver ("python" or "scipy"). Defaults to "python".
+
+        Returns:
+            object: Created CompiledGraph object.
+        """
+        if solver not in SUPPORTED_SOLVERS:
+            raise Exception(f"Unsupported shortest path solver {solver}. Supported solvers are {SUPPORTED_SOLVERS}.")
+        if solver == "scipy" and dijkstra is None:
+            raise Exception("The 'scipy' shortest path solver requires SciPy, which is not installed.")
+        self.solver = solver
+
+        self.nodes = list(graph.nodes)
+        self.node_indexes = {node: index for index, node in enumerate(self.nodes)}
+
+        # Gathering the neighbors of each node (in NetworkX's adjacency order) and the edge attributes that can be used as weights
+        indptr = [0]
+        indices = []
+        delays = []
+        for node in self.nodes:
+            for neighbor, edge in graph._adj[node].items():
+                indices.append(self.node_indexes[neighbor])
+                delays.append(edge.get("delay", 1))
+            indptr.append(len(indices))
+
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.indices = np.array(indices, dtype=np.int64)
+        self.weights = {None: np.ones(len(indices)), "delay": np.array(delays, dtype=np.float64)}
+
+        # Python lists with the same contents as the CSR arrays (used by the pure-Python solvers) and SciPy matrices of each weight
+        self._indptr_list = indptr
+        self._indices_list = indices
+        self._weight_lists = {None: [1] * len(indices), "delay": delays}
+        self._matrices = {}
+
+        # Shortest path trees (distances and predecessors), indexed by source node index and weight
+        self.trees = {}
+
+    def get_shortest_path(self, source: object, target: object, weight: str = None) -> list:
+        """Gets the shortest path between two nodes.
+
+        Args:
+            source (object): Node where the path starts.
+            target (object): Node where the path ends.
+            weight (str, optional): Edge attribute used as the path weight ("delay" or None). Defaults to None (all edges have weight 1).
+
+        Returns:
+            path (list): Shortest path.
+        """
+        if weight not in self.supported_weights:
+            raise Exception(f"Unsupported path weight {weight}. Supported weights are {self.supported_weights}.")
+
+        if source not in self.node_indexes or target not in self.node_indexes:
+            raise nx.NodeNotFound(f"Either source {source} or target {target} is not in the graph.")
+
+        source_index = self.node_indexes[source]
+        target_index = self.node_indexes[target]
+        if self.solver == "python" and weight is None:
+            path_indexes = self._get_path_with_bidirectional_search(source_index=source_index, target_index=target_index)
+        elif self.solver == "python":
+            path_indexes = self._get_path_with_bidirectional_dijkstra(source_index=source_index, target_index=target_index, weight=weight)
+        else:
+            path_indexes = self._get_path_from_tree(source_index=source_index, target_index=target_index, weight=weight)
+
+        if path_indexes is None:
+            raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+
+        return [self.nodes[node_index] for node_index in path_indexes]
+
+    def _get_path_from_tree(self, source_index: int, target_index: int, weight: str) -> list:
+        """Gets the shortest path between two nodes by walking the shortest path tree rooted at the source back from the target.
+
+        Args:
+            source_index (int): Index of the node where the path starts.
+            target_index (int): Index of the node where the path ends.
+            weight (str): Edge attribute used as the path weight ("delay" or None).
+
+        Returns:
+            path (list): Indexes of the nodes in the path (None if there is no path between the nodes).
+        """
+        _, predecessors = self._get_tree(source_index=source_index, weight=weight)
+
+        node_index = target_index
+        path = [target_index]
+        while node_index != source_index:
+            node_index = predecessors[node_index]
+            if node_index < 0:
+                return None
+            path.append(node_index)
+
+        path.reverse()
+        return path
+
+    def _get_path_with_bidirectional_search(self, source_index: int, target_index: int) -> list:
+        """Gets the shortest path between two nodes when all edges have the same weight using a bidirectional breadth-first search,
+        which expands the smallest fringe at each level and visits neighbors in the same order as NetworkX's "shortest_path()".
+
+        Args:
+            source_index (int): Index of the node where the path starts.
+            target_index (int): Index of the node where the path ends.
+
+        Returns:
+            path (list): Indexes of the nodes in the path (None if there is no path between the nodes).
+        """
+        if source_index == target_index:
+            return [source_index]
+
+        indptr = self._indptr_list
+        indices = self._indices_list
+
+        # Predecessors found by the forward search and successors found by the reverse search
+        predecessors = {source_index: None}
+        successors = {target_index: None}
+        forward_fringe = [source_index]
+        reverse_fringe = [target_index]
+
+        meeting_node = None
+        while meeting_node is None and len(forward_fringe) > 0 and len(reverse_fringe) > 0:
+            if len(forward_fringe) <= len(reverse_fringe):
+                this_level, forward_fringe = forward_fringe, []
+                visited, other_side, fringe = predecessors, successors, forward_fringe
+            else:
+                this_level, reverse_fringe = reverse_fringe, []
+                visited, other_side, fringe = successors, predecessors, reverse_fringe
+
+            for node_index in this_level:
+                for neighbor_index in indices[indptr[node_index] : indptr[node_index + 1]]:
+                    if neighbor_index not in visited:
+                        visited[neighbor_index] = node_index
+                        fringe.append(neighbor_index)
+                    if neighbor_index in other_side:
+                        meeting_node = neighbor_index
+                        break
+                if meeting_node is not None:
+                    break
+
+        if meeting_node is None:
+            return None
+
+        # Joining the path from the source to the meeting node with the path from the meeting node to the target
+        path = []
+        node_index = meeting_node
+        while node_index is not None:
+            path.append(node_index)
+            node_index = predecessors[node_index]
+        path.reverse()
+
+        node_index = successors[meeting_node]
+        while node_index is not None:
+            path.append(node_index)
+            node_index = successors[node_index]
+
+        return path
+
+    def _get_path_with_bidirectional_dijkstra(self, source_index: int, target_index: int, weight: str) -> list:
+        """Gets the shortest path between two nodes using a bidirectional Dijkstra's algorithm, which alternates between searches
+        from both nodes and breaks ties the same way as NetworkX's "shortest_path()" (i.e., by the order in which nodes were reached).
+
+        Args:
+            source_index (int): Index of the node where the path starts.
+            target_index (int): Index of the node where the path ends.
+            weight (str): Edge attribute used as the path weight ("delay").
+
+        Returns:
+            path (list): Indexes of the nodes in the path (None if there is no path between the nodes).
+        """
+        if source_index == target_index:
+            return [source_index]
+
+        indptr = self._indptr_list
+        indices = self._indices_list
+        weights = self._weight_lists[weight]
+
+        # Final distances, paths, tentative distances, and heaps of nodes to expand of the forward (0) and reverse (1) searches
+        distances = [{}, {}]
+        paths = [{source_index: [source_index]}, {target_index: [target_index]}]
+        seen = [{source_index: 0}, {target_index: 0}]
+        fringes = [[(0, 0, source_index)], [(0, 1, target_index)]]
+        counter = 1
+
+        shortest_distance = None
+        shortest_path = None
+        direction = 1
+        while len(fringes[0]) > 0 and len(fringes[1]) > 0:
+            direction = 1 - direction
+            distance, _, node_index = heapq.heappop(fringes[direction])
+            if node_index in distances[direction]:
+                continue
+
+            distances[direction][node_index] = distance
+            if node_index in distances[1 - direction]:
+                return shortest_path
+
+            for position in range(indptr[node_index], indptr[node_index + 1]):
+                neighbor_index = indices[position]
+                neighbor_distance = distance + weights[position]
+                if neighbor_index in distances[direction]:
+                    continue
+
+                if neighbor_index not in seen[direction] or neighbor_distance < seen[direction][neighbor_index]:
+                    seen[direction][neighbor_index] = neighbor_distance
+                    counter += 1
+                    heapq.heappush(fringes[direction], (neighbor_distance, counter, neighbor_index))
+                    paths[direction][neighbor_index] = paths[direction][node_index] + [neighbor_index]
+
+                    # Checking whether the node connects both searches through a path shorter than the shortest one found so far
+                    if neighbor_index in seen[0] and neighbor_index in seen[1]:
+                        total_distance = seen[0][neighbor_index] + seen[1][neighbor_index]
+                        if shortest_path is None or shortest_distance > total_distance:
+                            shortest_distance = total_distance
+                            shortest_path = paths[0][neighbor_index] + paths[1][neighbor_index][-2::-1]
+
+        return None
+
+    def get_distance(self, source: object, target: object, weight: str = None) -> float:
+        """Gets the length of the shortest path between two nodes.
+
+        Args:
+            source (object): Node where the path starts.
+            target (object): Node where the path ends.
+            weight (str, optional): Edge attribute used as the path weight ("delay" or None). Defaults to None (all edges have weight 1).
+
+        Returns:
+            float: Shortest path length (infinity if there is no path between the nodes).
+        """
+        if weight not in self.supported_weights:
+            raise Exception(f"Unsupported path weight {weight}. Supported weights are {self.supported_weights}.")
+
+        distances, _ = self._get_tree(source_index=self.node_indexes[source], weight=weight)
+        return distances[self.node_indexes[target]]
+
+    def _get_tree(self, source_index: int, weight: str) -> tuple:
+        """Gets the shortest path tree rooted at a given node.
+
+        Args:
+            source_index (int): Index of the root node.
+            weight (str): Edge attribute used as the path weight ("delay" or None).
+
+        Returns:
+            tree (tuple): Distances from the root node and the predecessor of each node (-1 for unreachable nodes) in the tree.
+        """
+        key = (source_index, weight)
+        if key not in self.trees:
+            if len(self.trees) >= self.max_cached_trees:
+                self.trees.clear()
+
+            if self.solver == "scipy":
+                self.trees[key] = self._solve_with_scipy(source_index=source_index, weight=weight)
+            else:
+                self.trees[key] = self._solve_with_dijkstra(source_index=source_index, weight=weight)
+
+        return self.trees[key]
+
+    def _solve_with_scipy(self, source_index: int, weight: str) -> tuple:
+        """Computes the shortest path tree rooted at a given node using SciPy.
+
+        Args:
+            source_index (int): Index of the root node.
+            weight (str): Edge attribute used as the path weight ("delay" or None).
+
+        Returns:
+            tuple: Distances from the root node and the predecessor of each node in the tree.
+        """
+        if weight not in self._matrices:
+            self._matrices[weight] = csr_matrix((self.weights[weight], self.indices, self.indptr), shape=(len(self.nodes), len(self.nodes)))
+
+        matrix = self._matrices[weight]
+        distances, predecessors = dijkstra(csgraph=matrix, directed=True, indices=source_index, unweighted=weight is None, return_predecessors=True)
+        return distances.tolist(), predecessors.tolist()
+
+    def _solve_with_dijkstra(self, source_index: int, weight: str) -> tuple:
+        """Computes the shortest path tree rooted at a given node using Dijkstra's algorithm. As in NetworkX, ties between nodes with
+        the same distance are broken by the order in which they were reached, and a node's predecessor only changes when a strictly
+        shorter path to it is found.
+
+        Args:
+            source_index (int): Index of the root node.
+            weight (str): Edge attribute used as the path weight ("delay" or None).
+
+        Returns:
+            tuple: Distances from the root node and the predecessor of each node in the tree.
+        """
+        indptr = self._indptr_list
+        indices = self._indices_list
+        weights = self._weight_lists[weight]
+
+        distances = [float("inf")] * len(self.nodes)
+        predecessors = [-1] * len(self.nodes)
+        finished = [False] * len(self.nodes)
+        distances[source_index] = 0
+
+        counter = 0
+        heap = [(0, counter, source_index)]
+        while len(heap) > 0:
+            distance, _, node_index = heapq.heappop(heap)
+            if finished[node_index]:
+                continue
+            finished[node_index] = True
+
+            for position in range(indptr[node_index], indptr[node_index + 1]):
+                neighbor_index = indices[position]
+                neighbor_distance = distance + weights[position]
+                if not finished[neighbor_index] and neighbor_distance < distances[neighbor_index]:
+                    distances[neighbor_index] = neighbor_distance
+                    predecessors[neighbor_index] = node_index
+                    counter += 1
+                    heapq.heappush(heap, (neighbor_distance, counter, neighbor_index))
+
+        return distances, predecessors
@@ -0,0 +1,22 @@
+""" Contains the read-only records that describe container images and layers inside the catalogs of the ContainerImage and
+ContainerLayer classes (see the "get_metadata()" method of both classes)."""
+# Python libraries
+import typing
+
+
+class ContainerImageMetadata(typing.NamedTuple):
+    """Read-only metadata shared by all the copies of a container image (i.e., the ContainerImage objects hosted by each server)."""
+
+    digest: str
+    name: str
+    tag: str
+    architecture: str
+    layers_digests: tuple
+
+
+class ContainerLayerMetadata(typing.NamedTuple):
+    """Read-only metadata shared by all the copies of a container layer (i.e., the ContainerLayer objects hosted by each server)."""
+
+    digest: str
+    size: int
+    instruction: str
@@ -1,6 +1,7 @@
 """ Contains container-image-related functionality."""
 # EdgeSimPy components
 from edge_sim_py.component_manager import ComponentManager
+from edge_sim_py.components.container_catalog import ContainerImageMetadata
 
 # Mesa modules
 from mesa import Agent
@@ -9,9 +10,8 @@ from mesa import Agent
 class ContainerImage(ComponentManager, Agent):
     """Class that represents a container image."""
 
-    # Class attributes that allow this class to use helper methods from the ComponentManager
-    _instances = []
-    _object_count = 0
+    # Attributes indexed to speed up lookups based on the 'find_by' helper method
+    _indexed_attributes = ["name", "digest"]
 
     def __init__(
         self,
@@ -44,6 +44,9 @@ class ContainerImage(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
         # Image metadata
         self.name = name
         self.digest = digest
@@ -60,6 +63,35 @@ class ContainerImage(ComponentManager, Agent):
         self.model = None
         self.unique_id = None
 
+    @classmethod
+    def get_metadata(cls, digest: str) -> object:
+        """Gets the metadata of the container image with a given digest from the catalog of images. The catalog stores one read-only
+        record per digest, which is taken from the first image with such digest (e.g., the images loaded from the dataset) once the
+        digest is first looked up. Hence, looking up metadata does not depend on how many copies of the image servers host.
+
+        Args:
+            digest (str): Image digest.
+
+        Returns:
+            object: ContainerImageMetadata object (or None if there is no image with the digest).
+        """
+        metadata = cls._catalog.get(digest)
+        if metadata is None:
+            image = cls.find_by(attribute_name="digest", attribute_value=digest)
+            if image is None:
+                return None
+
+            metadata = ContainerImageMetadata(
+                digest=image.digest,
+                name=image.name,
+                tag=image.tag,
+                architecture=image.architecture,
+                layers_digests=tuple(image.layers_digests),
+            )
+            cls._catalog[digest] = metadata
+
+        return metadata
+
     def _to_dict(self) -> dict:
         """Method that overrides the way the object is formatted to JSON."
 
@@ -81,9 +113,12 @@ class ContainerImage(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
@@ -93,3 +128,11 @@ class ContainerImage(ComponentManager, Agent):
     def step(self):
         """Method that executes the events involving the object at each time step."""
         ...
+
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the object has events to process.
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the next event takes place.
+        """
+        return float("inf")
@@ -1,6 +1,7 @@
 """ Contains container-layer-related functionality."""
 # EdgeSimPy components
 from edge_sim_py.component_manager import ComponentManager
+from edge_sim_py.components.container_catalog import ContainerLayerMetadata
 
 # Mesa modules
 from mesa import Agent
@@ -9,9 +10,8 @@ from mesa import Agent
 class ContainerLayer(ComponentManager, Agent):
     """Class that represents a container layer."""
 
-    # Class attributes that allow this class to use helper methods from the ComponentManager
-    _instances = []
-    _object_count = 0
+    # Attributes indexed to speed up lookups based on the 'find_by' helper method
+    _indexed_attributes = ["digest"]
 
     def __init__(self, obj_id: int = None, digest: str = "", size: int = 0, instruction: str = "") -> object:
         """Creates an User object.
@@ -34,6 +34,9 @@ class ContainerLayer(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
         # Layer's metadata
         self.digest = digest
         self.size = size
@@ -46,6 +49,29 @@ class ContainerLayer(ComponentManager, Agent):
         self.model = None
         self.unique_id = None
 
+    @classmethod
+    def get_metadata(cls, digest: str) -> object:
+        """Gets the metadata of the container layer with a given digest from the catalog of layers. The catalog stores one read-only
+        record per digest, which is taken from the first layer with such digest (e.g., the layers loaded from the dataset) once the
+        digest is first looked up. Hence, looking up metadata does not depend on how many copies of the layer servers host.
+
+        Args:
+            digest (str): Layer digest.
+
+        Returns:
+            object: ContainerLayerMetadata object (or None if there is no layer with the digest).
+        """
+        metadata = cls._catalog.get(digest)
+        if metadata is None:
+            layer = cls.find_by(attribute_name="digest", attribute_value=digest)
+            if layer is None:
+                return None
+
+            metadata = ContainerLayerMetadata(digest=layer.digest, size=layer.size, instruction=layer.instruction)
+            cls._catalog[digest] = metadata
+
+        return metadata
+
     def _to_dict(self) -> dict:
         """Method that overrides the way the object is formatted to JSON."
 
@@ -65,9 +91,12 @@ class ContainerLayer(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
@@ -77,3 +106,11 @@ class ContainerLayer(ComponentManager, Agent):
     def step(self):
         """Method that executes the events involving the object at each time step."""
         ...
+
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the object has events to process.
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the next event takes place.
+        """
+        return float("inf")
@@ -16,9 +16,22 @@ from random import choice
 class ContainerRegistry(ComponentManager, Agent):
     """Class that represents a container registry."""
 
-    # Class attributes that allow this class to use helper methods from the ComponentManager
-    _instances = []
-    _object_count = 0
+    # Types of the metrics collected by the "collect()" method (used when metrics are stored in a columnar format)
+    metrics_schema = {
+        "Available": "bool",
+        "CPU Demand": "number",
+        "RAM Demand": "number",
+        "Server": "int",
+        "Images": "list[int]",
+        "Layers": "list[int]",
+    }
+
+    # List of attributes whose values are indexed to speed up "find_by" and "find_all_by" queries (e.g., finding the registries
+    # hosted by an edge server whenever its layers change)
+    _indexed_attributes = ["server"]
+
+    # Attributes that affect the registries selected to pull container layers, which are cached by the network topology
+    routing_attributes = ["available", "server", "model"]
 
     def __init__(self, obj_id: int = None, cpu_demand: int = 0, memory_demand: int = 0) -> object:
         """Creates a ContainerRegistry object.
@@ -40,6 +53,15 @@ class ContainerRegistry(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
+        # Position of the registry in the creation order, which breaks ties between registries that are equally close to a server
+        self._creation_order = self.__class__._object_count
+
+        # Layer digests under which the registry is listed in its class' catalog (i.e., the layers it can provide)
+        self._catalog_digests = set()
+
         # Registry's CPU and memory demand
         self.cpu_demand = cpu_demand
         self.memory_demand = memory_demand
@@ -57,6 +79,86 @@ class ContainerRegistry(ComponentManager, Agent):
         self.model = None
         self.unique_id = None
 
+    def __setattr__(self, attribute_name: str, attribute_value: object):
+        """Overrides the value of an object attribute, updating the registry's catalog entries (and discarding the registry
+        selections cached by the network topology for the layers they refer to) if the attribute affects them.
+
+        Args:
+            attribute_name (str): Name of the attribute to be changed.
+            attribute_value (object): Value for the attribute.
+        """
+        previous_server = self.__dict__.get("server")
+        super().__setattr__(attribute_name, attribute_value)
+
+        if attribute_name in self.routing_attributes:
+            # Layers the registry could provide before the change, and layers it may provide after it
+            digests = set(self.__dict__.get("_catalog_digests", ()))
+            if previous_server is not None:
+                digests.update(previous_server.container_layers.digests)
+            if self.__dict__.get("server") is not None:
+                digests.update(self.server.container_layers.digests)
+
+            self._update_catalog(digests=digests)
+
+            # Selections cached by the topology of a simulator the registry has just been added to may not consider the registry
+            if attribute_name == "model":
+                self._invalidate_registry_routes(digests=self._catalog_digests)
+
+    @classmethod
+    def find_by_layer(cls, digest: str) -> list:
+        """Finds the registries that can provide a given container layer (i.e., available registries hosted by edge servers that
+        have the layer), as listed by the class' catalog.
+
+        Args:
+            digest (str): Layer digest.
+
+        Returns:
+            list: Container registries.
+        """
+        return list(cls._catalog.get(digest, {}))
+
+    def _update_catalog(self, digests: set):
+        """Updates whether the registry is listed under given layer digests inside its class' catalog (i.e., whether the registry
+        is available and hosted by an edge server that has the layers), discarding the registry selections cached by the network
+        topology for the layers whose entries changed.
+
+        Args:
+            digests (set): Digests of the layers to be checked.
+        """
+        server = self.__dict__.get("server")
+        available = self.__dict__.get("available", False) and server is not None
+
+        changed_digests = []
+        for digest in digests:
+            provides_layer = available and server.container_layers.has_digest(digest=digest)
+            if provides_layer == (digest in self._catalog_digests):
+                continue
+
+            if provides_layer:
+                self._catalog_digests.add(digest)
+                self.__class__._catalog.setdefault(digest, {})[self] = None
+            else:
+                self._catalog_digests.discard(digest)
+                registries = self.__class__._catalog.get(digest, {})
+                registries.pop(self, None)
+                if len(registries) == 0:
+                    self.__class__._catalog.pop(digest, None)
+
+            changed_digests.append(digest)
+
+        self._invalidate_registry_routes(digests=changed_digests)
+
+    def _invalidate_registry_routes(self, digests: list):
+        """Discards the registry selections cached by the network topology for given layer digests.
+
+        Args:
+            digests (list): Layer digests.
+        """
+        topology = getattr(self.__dict__.get("model"), "topology", None)
+        if topology is not None:
+            for digest in digests:
+                topology.invalidate_registry_routes(digest=digest)
+
     def _to_dict(self) -> dict:
         """Method that overrides the way the object is formatted to JSON."
 
@@ -75,20 +177,26 @@ class ContainerRegistry(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
         metrics = {
-            "Available": self.available,
-            "CPU Demand": self.cpu_demand,
-            "RAM Demand": self.memory_demand,
-            "Server": self.server.id if self.server else None,
-            "Images": [image.id for image in self.server.container_images] if self.server else [],
-            "Layers": [layer.id for layer in self.server.container_layers] if self.server else [],
+            "Available": lambda: self.available,
+            "CPU Demand": lambda: self.cpu_demand,
+            "RAM Demand": lambda: self.memory_demand,
+            "Server": lambda: self.server.id if self.server else None,
+            "Images": lambda: [image.id for image in self.server.container_images] if self.server else [],
+            "Layers": lambda: [layer.id for layer in self.server.container_layers] if self.server else [],
         }
+
+        # Only the requested metrics are computed
+        metrics = {name: metric() for name, metric in metrics.items() if fields is None or name in fields}
         return metrics
 
     def step(self):
@@ -100,21 +208,31 @@ class ContainerRegistry(ComponentManager, Agent):
             # Checking if the host has the container layers that compose the container registry image
             layers_hosted_by_server = 0
             for layer_digest in registry_image.layers_digests:
-                if any([layer_digest == layer.digest for layer in self.server.container_layers]):
+                if self.server.container_layers.has_digest(digest=layer_digest):
                     layers_hosted_by_server += 1
 
             # Checking if the host has the container registry image
-            server_images_digests = [image.digest for image in self.server.container_images]
             if (
                 layers_hosted_by_server == len(registry_image.layers_digests)
-                and registry_image.digest not in server_images_digests
+                and not self.server.container_images.has_digest(digest=registry_image.digest)
             ):
                 self.server._add_container_image(template_container_image=registry_image)
 
             # Updating registry's availability status if its provisioning process has ended
-            if not self.available and registry_image.digest in [image.digest for image in self.server.container_images]:
+            if not self.available and self.server.container_images.has_digest(digest=registry_image.digest):
                 self.available = True
 
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the container registry has events to process (i.e., its provisioning status update).
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the next event takes place.
+        """
+        if not self.available:
+            return self.model.schedule.steps
+
+        return float("inf")
+
     @classmethod
     def provision(cls, target_server: object, registry_cpu_demand: int = None, registry_memory_demand: int = None) -> object:
         """Provisions a new container registry on a given server.
@@ -152,19 +270,13 @@ class ContainerRegistry(ComponentManager, Agent):
         registry_image = ContainerImage.find_by(attribute_name="name", attribute_value="registry")
 
         # Checking if the target server already has a registry container image on it
-        if registry_image.digest not in [image.digest for image in target_server.container_images]:
-            # Gathering layers present in the target server (layers, download_queue, waiting_queue)
-            layers_downloaded = [layer for layer in target_server.container_layers]
-            layers_on_download_queue = [flow.metadata["object"] for flow in target_server.download_queue]
-            layers_on_waiting_queue = [layer for layer in target_server.waiting_queue]
-
-            layers_on_target_server = layers_downloaded + layers_on_download_queue + layers_on_waiting_queue
-
+        if not target_server.container_images.has_digest(digest=registry_image.digest):
             # Adding the registry's container image layers into the target server's waiting queue if they are not cached in there
+            # (i.e., if they are not in the target server's layers, download_queue, or waiting_queue)
             for layer_digest in registry_image.layers_digests:
-                if not any(layer.digest == layer_digest for layer in layers_on_target_server):
+                if not target_server.has_layer(digest=layer_digest):
                     # Creating a new layer object that will be pulled to the target server
-                    layer_template = ContainerLayer.find_by(attribute_name="digest", attribute_value=layer_digest)
+                    layer_template = ContainerLayer.get_metadata(digest=layer_digest)
                     layer = ContainerLayer(
                         digest=layer_template.digest,
                         size=layer_template.size,
@@ -216,7 +328,7 @@ class ContainerRegistry(ComponentManager, Agent):
 
                     # Removing the unused image from the simulator's agent list and from its class instance list
                     image.model.schedule.remove(image)
-                    image.__class__._instances.remove(image)
+                    image.__class__.remove(image)
 
                 # Removing unused layers
                 for layer in unused_layers:
@@ -227,7 +339,7 @@ class ContainerRegistry(ComponentManager, Agent):
 
                     # Removing the unused layer from the simulator's agent list and from its class instance list
                     layer.model.schedule.remove(layer)
-                    layer.__class__._instances.remove(layer)
+                    layer.__class__.remove(layer)
 
             # Removing relationship between the registry and its server
             self.server.container_registries.remove(self)
@@ -237,4 +349,4 @@ class ContainerRegistry(ComponentManager, Agent):
 
             # Removing the registry
             self.model.schedule.remove(self)
-            self.__class__._instances.remove(self)
+            self.__class__.remove(self)
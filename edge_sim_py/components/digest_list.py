@@ -0,0 +1,235 @@
+""" Contains a list that indexes container layers, container images, and layer flows by digest."""
+
+
+class DigestList(list):
+    """List of container layers, container images, or network flows that transfer container layers, which keeps track of the digests
+    of its items (i.e., the number of items with each digest) so that checking if the list has an item with a given digest takes
+    constant time. The digest of each item is read once it is added to the list, so items must not have their digests changed while
+    inside the list. An optional "on_change" callback is notified of the digests that the list gains or loses.
+    """
+
+    def __init__(self, items: list = None) -> object:
+        """Creates a DigestList object.
+
+        Args:
+            items (list, optional): Initial items. Defaults to None (empty list).
+
+        Returns:
+            object: Created DigestList object.
+        """
+        list.__init__(self, items if items is not None else [])
+        self.digests = {}
+        self.on_change = None
+        self._count(items=self, increment=1)
+
+    @staticmethod
+    def _get_digest(item: object) -> str:
+        """Gets the digest of an item (network flows are identified by the digest of the layer they transfer).
+
+        Args:
+            item (object): List item.
+
+        Returns:
+            str: Item digest.
+        """
+        if hasattr(item, "metadata"):
+            return item.metadata["object"].digest
+
+        return item.digest
+
+    def _count(self, items: list, increment: int):
+        """Updates the number of items with each digest, notifying the "on_change" callback (if any) about the digests the list
+        gained (i.e., its first item with the digest was added) or lost (i.e., its last item with the digest was removed).
+
+        Args:
+            items (list): Items added to or removed from the list.
+            increment (int): 1 if the items were added or -1 if they were removed.
+        """
+        changed_digests = []
+        for item in items:
+            digest = self._get_digest(item=item)
+            count = self.digests.get(digest, 0) + increment
+            if count > 0:
+                self.digests[digest] = count
+            else:
+                del self.digests[digest]
+
+            if count == 0 or (count == 1 and increment == 1):
+                changed_digests.append(digest)
+
+        if self.on_change is not None and len(changed_digests) > 0:
+            self.on_change(digests=changed_digests)
+
+    def has_digest(self, digest: str) -> bool:
+        """Checks if the list has an item with a given digest.
+
+        Args:
+            digest (str): Digest.
+
+        Returns:
+            bool: Whether the list has an item with the digest.
+        """
+        return digest in self.digests
+
+    def append(self, item: object):
+        """Adds an item to the end of the list.
+
+        Args:
+            item (object): Item to be added.
+        """
+        list.append(self, item)
+        self._count(items=[item], increment=1)
+
+    def extend(self, items: list):
+        """Adds the items of an iterable to the end of the list.
+
+        Args:
+            items (list): Items to be added.
+        """
+        items = list(items)
+        list.extend(self, items)
+        self._count(items=items, increment=1)
+
+    def insert(self, index: int, item: object):
+        """Adds an item before a given position of the list.
+
+        Args:
+            index (int): Position where the item will be added.
+            item (object): Item to be added.
+        """
+        list.insert(self, index, item)
+        self._count(items=[item], increment=1)
+
+    def remove(self, item: object):
+        """Removes the first occurrence of an item from the list.
+
+        Args:
+            item (object): Item to be removed.
+        """
+        list.remove(self, item)
+        self._count(items=[item], increment=-1)
+
+    def pop(self, index: int = -1) -> object:
+        """Removes and returns the item at a given position of the list.
+
+        Args:
+            index (int, optional): Position of the item. Defaults to -1 (last item).
+
+        Returns:
+            item (object): Removed item.
+        """
+        item = list.pop(self, index)
+        self._count(items=[item], increment=-1)
+        return item
+
+    def clear(self):
+        """Removes all items from the list."""
+        removed_items = list(self)
+        list.clear(self)
+        self._count(items=removed_items, increment=-1)
+
+    def __setitem__(self, index: object, value: object):
+        """Replaces the item at a given position (or the items within a given slice) of the list.
+
+        Args:
+            index (object): Position (int) or slice of the items to be replaced.
+            value (object): New item (or iterable of new items if "index" is a slice).
+        """
+        removed_items = self[index] if isinstance(index, slice) else [self[index]]
+        value = list(value) if isinstance(index, slice) else value
+        list.__setitem__(self, index, value)
+        self._count(items=removed_items, increment=-1)
+        self._count(items=value if isinstance(index, slice) else [value], increment=1)
+
+    def __delitem__(self, index: object):
+        """Removes the item at a given position (or the items within a given slice) of the list.
+
+        Args:
+            index (object): Position (int) or slice of the items to be removed.
+        """
+        removed_items = self[index] if isinstance(index, slice) else [self[index]]
+        list.__delitem__(self, index)
+        self._count(items=removed_items, increment=-1)
+
+    def __iadd__(self, items: list) -> object:
+        """Adds the items of an iterable to the end of the list (i.e., the "+=" operator).
+
+        Args:
+            items (list): Items to be added.
+
+        Returns:
+            object: The DigestList object itself.
+        """
+        self.extend(items)
+        return self
+
+    def __imul__(self, times: int) -> object:
+        """Repeats the items of the list a given number of times (i.e., the "*=" operator).
+
+        Args:
+            times (int): Number of repetitions (the list is emptied if it is not positive).
+
+        Returns:
+            object: The DigestList object itself.
+        """
+        if times <= 0:
+            self.clear()
+        else:
+            added_items = list(self) * (times - 1)
+            list.__imul__(self, times)
+            self._count(items=added_items, increment=1)
+        return self
+
+
+class DigestListAttribute:
+    """Descriptor that stores an object attribute as a DigestList. Regular lists assigned to the attribute are replaced by
+    DigestList objects holding their items (hence, later changes to the assigned list are not reflected in the attribute).
+    """
+
+    def __init__(self, name: str, on_change: str = None):
+        """Creates a DigestListAttribute descriptor.
+
+        Args:
+            name (str): Name of the attribute.
+            on_change (str, optional): Name of the object method notified about the digests the attribute gains or loses (either
+                through changes to the list or through assignments). Defaults to None.
+        """
+        self.name = name
+        self.on_change = on_change
+
+    def __get__(self, obj: object, objtype: type = None) -> object:
+        """Retrieves the attribute value from the object.
+
+        Args:
+            obj (object): Object whose attribute will be retrieved.
+            objtype (type, optional): Object class. Defaults to None.
+
+        Returns:
+            object: Attribute value.
+        """
+        if obj is None:
+            return self
+
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(f"Object {obj} has no such attribute '{self.name}'.")
+
+    def __set__(self, obj: object, value: list):
+        """Overrides the attribute value with a DigestList holding the items of a given list.
+
+        Args:
+            obj (object): Object whose attribute will be changed.
+            value (list): Value for the attribute.
+        """
+        previous_digests = set(obj.__dict__[self.name].digests) if self.name in obj.__dict__ else set()
+
+        digest_list = value if type(value) is DigestList else DigestList(items=value)
+        obj.__dict__[self.name] = digest_list
+
+        if self.on_change is not None:
+            digest_list.on_change = getattr(obj, self.on_change)
+
+            changed_digests = previous_digests.symmetric_difference(digest_list.digests)
+            if len(changed_digests) > 0:
+                digest_list.on_change(digests=list(changed_digests))
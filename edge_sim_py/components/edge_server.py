@@ -5,21 +5,55 @@ from edge_sim_py.components.network_flow import NetworkFlow
 from edge_sim_py.components.container_registry import ContainerRegistry
 from edge_sim_py.components.container_image import ContainerImage
 from edge_sim_py.components.container_layer import ContainerLayer
+from edge_sim_py.components.digest_list import DigestListAttribute
 
 # Mesa modules
 from mesa import Agent
 
 # Python libraries
-import networkx as nx
 import typing
 
 
 class EdgeServer(ComponentManager, Agent):
-    """Class that represents an edge server."""
-
-    # Class attributes that allow this class to use helper methods from the ComponentManager
-    _instances = []
-    _object_count = 0
+    """Class that represents an edge server.
+
+    The "container_images", "container_layers", "waiting_queue", and "download_queue" attributes are DigestList objects. Assigning a
+    regular list to any of them (e.g., "server.container_layers = layers") stores a copy of the list, so later changes to "layers"
+    are not reflected in the edge server. Please change the attributes themselves (e.g., "server.container_layers.append(layer)")
+    or assign them again instead.
+    """
+
+    # Attributes whose changes affect model-level metrics (see the "update_kpis()" method)
+    _tracked_attributes = ["active", "cpu", "cpu_demand", "power_model", "power_model_parameters"]
+
+    # Types of the metrics collected by the "collect()" method (used when metrics are stored in a columnar format)
+    metrics_schema = {
+        "Instance ID": "int",
+        "Coordinates": "list[number]",
+        "Available": "bool",
+        "CPU": "number",
+        "RAM": "number",
+        "Disk": "number",
+        "CPU Demand": "number",
+        "RAM Demand": "number",
+        "Disk Demand": "number",
+        "Ongoing Migrations": "int",
+        "Services": "list[int]",
+        "Registries": "list[int]",
+        "Layers": "list[str]",
+        "Images": "list[str]",
+        "Download Queue": "list[str]",
+        "Waiting Queue": "list[str]",
+        "Max. Concurrent Layer Downloads": "int",
+        "Power Consumption": "number",
+    }
+
+    # Lists that keep track of the digests of their items, so that checking if the edge server has (or is pulling) a given container
+    # image or layer takes constant time (see "DigestList")
+    container_images = DigestListAttribute(name="container_images")
+    container_layers = DigestListAttribute(name="container_layers", on_change="_update_registry_catalog")
+    waiting_queue = DigestListAttribute(name="waiting_queue")
+    download_queue = DigestListAttribute(name="download_queue")
 
     def __init__(
         self,
@@ -54,6 +88,9 @@ class EdgeServer(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
         # Edge server model name
         self.model_name = model_name
 
@@ -144,57 +181,70 @@ class EdgeServer(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
         metrics = {
-            "Instance ID": self.id,
-            "Coordinates": self.coordinates,
-            "Available": self.available,
-            "CPU": self.cpu,
-            "RAM": self.memory,
-            "Disk": self.disk,
-            "CPU Demand": self.cpu_demand,
-            "RAM Demand": self.memory_demand,
-            "Disk Demand": self.disk_demand,
-            "Ongoing Migrations": self.ongoing_migrations,
-            "Services": [service.id for service in self.services],
-            "Registries": [registry.id for registry in self.container_registries],
-            "Layers": [layer.instruction for layer in self.container_layers],
-            "Images": [image.name for image in self.container_images],
-            "Download Queue": [f.metadata["object"].instruction for f in self.download_queue],
-            "Waiting Queue": [layer.instruction for layer in self.waiting_queue],
-            "Max. Concurrent Layer Downloads": self.max_concurrent_layer_downloads,
-            "Power Consumption": self.get_power_consumption(),
+            "Instance ID": lambda: self.id,
+            "Coordinates": lambda: self.coordinates,
+            "Available": lambda: self.available,
+            "CPU": lambda: self.cpu,
+            "RAM": lambda: self.memory,
+            "Disk": lambda: self.disk,
+            "CPU Demand": lambda: self.cpu_demand,
+            "RAM Demand": lambda: self.memory_demand,
+            "Disk Demand": lambda: self.disk_demand,
+            "Ongoing Migrations": lambda: self.ongoing_migrations,
+            "Services": lambda: [service.id for service in self.services],
+            "Registries": lambda: [registry.id for registry in self.container_registries],
+            "Layers": lambda: [layer.instruction for layer in self.container_layers],
+            "Images": lambda: [image.name for image in self.container_images],
+            "Download Queue": lambda: [f.metadata["object"].instruction for f in self.download_queue],
+            "Waiting Queue": lambda: [layer.instruction for layer in self.waiting_queue],
+            "Max. Concurrent Layer Downloads": lambda: self.max_concurrent_layer_downloads,
+            "Power Consumption": lambda: self.get_power_consumption(),
         }
+
+        # Only the requested metrics are computed
+        metrics = {name: metric() for name, metric in metrics.items() if fields is None or name in fields}
         return metrics
 
+    def update_statistics(self, statistics: object):
+        """Updates the online statistics about the server's resource utilization.
+
+        Args:
+            statistics (object): OnlineStatistics object.
+        """
+        if self.cpu:
+            statistics.update(name="CPU Utilization", value=self.cpu_demand / self.cpu, group=self.id)
+        if self.memory:
+            statistics.update(name="RAM Utilization", value=self.memory_demand / self.memory, group=self.id)
+        if self.disk:
+            statistics.update(name="Disk Utilization", value=self.disk_demand / self.disk, group=self.id)
+
+    def update_kpis(self, kpis: object):
+        """Reports the server's current state to the model-level metrics maintained incrementally by the simulator.
+
+        Args:
+            kpis (object): IncrementalMetrics object.
+        """
+        kpis.invalidate_value(name="Power Consumption", obj=self, get_value=self.get_power_consumption)
+
     def step(self):
         """Method that executes the events involving the object at each time step."""
         while len(self.waiting_queue) > 0 and len(self.download_queue) < self.max_concurrent_layer_downloads:
             layer = self.waiting_queue.pop(0)
 
-            # Gathering the list of registries that have the layer
-            registries_with_layer = []
-            for registry in [reg for reg in ContainerRegistry.all() if reg.available]:
-                # Checking if the registry is hosted on a valid host in the infrastructure and if it has the layer we need to pull
-                if registry.server and any(layer.digest == l.digest for l in registry.server.container_layers):
-                    # Selecting a network path to be used to pull the layer from the registry
-                    path = nx.shortest_path(
-                        G=self.model.topology,
-                        source=registry.server.base_station.network_switch,
-                        target=self.base_station.network_switch,
-                    )
-
-                    registries_with_layer.append({"object": registry, "path": path})
-
             # Selecting the registry from which the layer will be pulled to the (target) edge server
-            registries_with_layer = sorted(registries_with_layer, key=lambda r: len(r["path"]))
-            registry = registries_with_layer[0]["object"]
-            path = registries_with_layer[0]["path"]
+            registry, path = self._select_container_registry(layer=layer)
+            if registry is None:
+                raise Exception(f"Could not find any container registry with layer {layer.digest}")
 
             # Creating the flow object
             flow = NetworkFlow(
@@ -211,6 +261,61 @@ class EdgeServer(ComponentManager, Agent):
             # Adding the created flow to the edge server's download queue
             self.download_queue.append(flow)
 
+    def _select_container_registry(self, layer: object) -> tuple:
+        """Selects the container registry from which a container layer would be pulled to the edge server (i.e., the available
+        registry that has the layer and is the closest to the edge server in number of hops). Selections are cached by the network
+        topology for each layer digest and network switch until the topology or the registries change.
+
+        Args:
+            layer (object): Container layer to be pulled.
+
+        Returns:
+            tuple: Selected registry and network path used to pull the layer (None and None if no registry has the layer).
+        """
+        topology = self.model.topology
+        switch = self.base_station.network_switch
+        registry_routes = topology._registry_routes.setdefault(layer.digest, {})
+
+        if switch not in registry_routes:
+            # Selecting, among the registries that can provide the layer, the one whose path to the edge server is the shortest
+            # (ties are broken by the registries' creation order)
+            selection = (None, None)
+            for registry in ContainerRegistry.find_by_layer(digest=layer.digest):
+                path = topology.get_shortest_path(source=registry.server.base_station.network_switch, target=switch)
+                if (
+                    selection[1] is None
+                    or len(path) < len(selection[1])
+                    or (len(path) == len(selection[1]) and registry._creation_order < selection[0]._creation_order)
+                ):
+                    selection = (registry, path)
+
+            registry_routes[switch] = selection
+
+        # Returning a copy of the cached path, as callers may modify it
+        registry, path = registry_routes[switch]
+        return registry, list(path) if path is not None else None
+
+    def _update_registry_catalog(self, digests: list):
+        """Updates the catalog entries of the container registries hosted by the edge server for layers added to or removed from
+        the edge server, as they change which registries can provide such layers.
+
+        Args:
+            digests (list): Digests of the layers added to or removed from the edge server.
+        """
+        for registry in ContainerRegistry.find_all_by(attribute_name="server", attribute_value=self):
+            registry._update_catalog(digests=digests)
+
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the edge server has events to process (i.e., layers to start pulling).
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the next event takes place.
+        """
+        if len(self.waiting_queue) > 0 and len(self.download_queue) < self.max_concurrent_layer_downloads:
+            return self.model.schedule.steps
+
+        return float("inf")
+
     def get_power_consumption(self) -> float:
         """Gets the edge server's power consumption.
 
@@ -251,12 +356,12 @@ class EdgeServer(ComponentManager, Agent):
         """
         # Checking if the edge server has no existing instance representing the same container image
         digest = template_container_image.digest
-        if digest in [image.digest for image in self.container_images]:
+        if self.container_images.has_digest(digest=digest):
             raise Exception(f"Failed in adding an image to {self} as it already hosts a image with the same digest ({digest}).")
 
         # Checking if the edge server has all the container layers that compose the container image
         for layer_digest in template_container_image.layers_digests:
-            if not any([layer_digest == layer.digest for layer in self.container_layers]):
+            if not self.container_layers.has_digest(digest=layer_digest):
                 raise Exception(
                     f"Failed in adding an image to {self} as it does not hosts all the layers necessary ({layer_digest})."
                 )
@@ -278,6 +383,21 @@ class EdgeServer(ComponentManager, Agent):
 
         return image
 
+    def has_layer(self, digest: str) -> bool:
+        """Checks if the edge server has a given container layer, either cached or being pulled (i.e., on its download or waiting queues).
+
+        Args:
+            digest (str): Layer digest.
+
+        Returns:
+            bool: Whether the edge server has the layer.
+        """
+        return (
+            self.container_layers.has_digest(digest=digest)
+            or self.download_queue.has_digest(digest=digest)
+            or self.waiting_queue.has_digest(digest=digest)
+        )
+
     def _get_uncached_layers(self, service: object) -> list:
         """Gets the list of container layers from a given service that are not present in the edge server's layers cache list.
 
@@ -285,22 +405,17 @@ class EdgeServer(ComponentManager, Agent):
             service (object): Service whose disk demand delta will be calculated.
 
         Returns:
-            uncached_layers (float): List of layers from service's image not present in the edge server's layers cache list.
+            uncached_layers (list): Metadata of the layers from service's image not present in the edge server's layers cache list
+                (see "ContainerLayer.get_metadata()").
         """
-        # Gathering layers present in the target server (layers, download_queue, waiting_queue)
-        layers_downloaded = [layer for layer in self.container_layers]
-        layers_on_download_queue = [flow.metadata["object"] for flow in self.download_queue if flow.metadata["object"] == "layer"]
-        layers_on_waiting_queue = [layer for layer in self.waiting_queue]
-        layers = layers_downloaded + layers_on_download_queue + layers_on_waiting_queue
-
         # Gathering the service's container image
-        service_image = ContainerImage.find_by(attribute_name="digest", attribute_value=service.image_digest)
+        service_image = ContainerImage.get_metadata(digest=service.image_digest)
 
-        # Gathering the list of uncached layers
+        # Gathering the list of layers not present in the edge server (layers, download_queue, waiting_queue)
         uncached_layers = []
         for layer_digest in service_image.layers_digests:
-            if not any(layer_digest == layer.digest for layer in layers):
-                layer = ContainerLayer.find_by(attribute_name="digest", attribute_value=layer_digest)
+            if not self.has_layer(digest=layer_digest):
+                layer = ContainerLayer.get_metadata(digest=layer_digest)
                 if layer not in uncached_layers:
                     uncached_layers.append(layer)
 
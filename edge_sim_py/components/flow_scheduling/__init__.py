@@ -4,3 +4,7 @@ __version__ = "1.1.0"
 # Network flow scheduling algorithms
 from .max_min_fairness import max_min_fairness
 from .equal_share import equal_share
+from .progressive_filling import progressive_filling
+
+# Flow completion time estimation
+from .completion_time_estimation import estimate_completion_times
@@ -0,0 +1,210 @@
+""" Contains functionality used to estimate when network flows would finish without simulating them."""
+# EdgeSimPy components
+from edge_sim_py.components.flow_scheduling.equal_share import equal_share
+from edge_sim_py.components.flow_scheduling.max_min_fairness import max_min_fairness
+from edge_sim_py.components.flow_scheduling.progressive_filling import progressive_filling, calculate_progressive_filling
+
+# Python libraries
+import numpy as np
+
+
+def estimate_completion_times(topology: object, flows: list, algorithm: object = max_min_fairness) -> list:
+    """Estimates how many time steps a set of hypothetical network flows would take to finish if they were created now, considering
+    the flows that are currently active and the bandwidth sharing policy of a flow scheduling algorithm. The estimation does not
+    change the state of the simulation. It follows a fluid model in which bandwidth shares are recalculated whenever a flow starts
+    or finishes (and, as in the flow scheduling algorithms, when a flow needs less than its share), and flows progress according
+    to their shares in between. Only active flows that share links, directly or indirectly, with the hypothetical flows are
+    considered, as other flows do not affect their shares.
+
+    Args:
+        topology (object): Network topology object.
+        flows (list): Hypothetical flows. Each flow is a dictionary with the "path" (list of network nodes) and "data_to_transfer"
+            keys and, optionally, an "after" key listing the indices of hypothetical flows that must finish before it starts (e.g.,
+            a service state transfer only starts once the service layers are pulled).
+        algorithm (object, optional): Flow scheduling algorithm whose sharing policy is considered (equal_share, max_min_fairness, or
+            progressive_filling). Defaults to max_min_fairness.
+
+    Returns:
+        completion_times (list): Number of time steps each hypothetical flow would take to finish (infinity if it would never finish).
+    """
+    if algorithm not in RATE_FUNCTIONS:
+        raise Exception(f"Unsupported flow scheduling algorithm {algorithm}. Supported algorithms are {list(RATE_FUNCTIONS)}.")
+
+    # Gathering the links of the hypothetical flows
+    links_of_flows = []
+    for flow in flows:
+        links = {}
+        for i in range(0, len(flow["path"]) - 1):
+            link = topology[flow["path"][i]][flow["path"][i + 1]]
+            links[link["id"]] = link
+        links_of_flows.append(list(links.values()))
+
+    # Gathering the active flows that share links, directly or indirectly, with the hypothetical flows
+    links_to_visit = [link for links in links_of_flows for link in links]
+    visited_links = {link["id"] for link in links_to_visit}
+    active_flows = {}
+    while len(links_to_visit) > 0:
+        for flow in links_to_visit.pop()["active_flows"]:
+            if flow not in active_flows:
+                active_flows[flow] = None
+                for link in flow.links:
+                    if link["id"] not in visited_links:
+                        visited_links.add(link["id"])
+                        links_to_visit.append(link)
+
+    # Building the flow-link incidence matrix (active flows come first, followed by the hypothetical flows)
+    links_of_flows = [flow.links for flow in active_flows] + links_of_flows
+    link_indexes = {}
+    capacities = []
+    entry_flows = []
+    entry_links = []
+    for flow_index, links in enumerate(links_of_flows):
+        for link in links:
+            if link["id"] not in link_indexes:
+                link_indexes[link["id"]] = len(capacities)
+                capacities.append(link["bandwidth"])
+
+            entry_flows.append(flow_index)
+            entry_links.append(link_indexes[link["id"]])
+
+    capacities = np.array(capacities, dtype=np.float64)
+    entry_flows = np.array(entry_flows, dtype=np.int64)
+    entry_links = np.array(entry_links, dtype=np.int64)
+
+    first_hypothetical_flow = len(active_flows)
+    remaining_data = np.array([flow.data_to_transfer for flow in active_flows] + [flow["data_to_transfer"] for flow in flows], dtype=np.float64)
+    prerequisites = [[]] * first_hypothetical_flow + [[first_hypothetical_flow + index for index in flow.get("after", [])] for flow in flows]
+
+    started = np.array([len(flow_prerequisites) == 0 for flow_prerequisites in prerequisites], dtype=bool)
+    finished = np.zeros(len(remaining_data), dtype=bool)
+    completion_times = np.full(len(remaining_data), np.inf)
+    time = 0
+
+    while not finished[first_hypothetical_flow:].all():
+        running = np.flatnonzero(started & ~finished)
+        if len(running) == 0:
+            break
+
+        # Calculating the rates of running flows according to the sharing policy of the flow scheduling algorithm
+        flow_indexes = np.full(len(remaining_data), -1, dtype=np.int64)
+        flow_indexes[running] = np.arange(len(running))
+        running_entries = flow_indexes[entry_flows] >= 0
+        rates = RATE_FUNCTIONS[algorithm](
+            capacities=capacities,
+            demands=remaining_data[running],
+            entry_flows=flow_indexes[entry_flows[running_entries]],
+            entry_links=entry_links[running_entries],
+        )
+
+        # Advancing to the time step in which the next flow finishes (each flow takes at least one time step to finish)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            steps_to_finish = np.maximum(np.ceil(remaining_data[running] / rates), 1)
+        steps_to_finish[rates <= 0] = np.inf
+        steps_to_finish[remaining_data[running] <= 0] = 1
+        elapsed_steps = steps_to_finish.min()
+
+        # Shares are also recalculated once the remaining data of a flow falls below its rate (except in equal_share), so the
+        # rates are only kept until the time step in which that happens
+        if algorithm is not equal_share:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                steps_to_recalculate = np.floor(remaining_data[running] / rates)
+            steps_to_recalculate = steps_to_recalculate[(steps_to_recalculate >= 1) & (steps_to_recalculate < steps_to_finish)]
+            if len(steps_to_recalculate) > 0:
+                elapsed_steps = min(elapsed_steps, steps_to_recalculate.min())
+
+        if elapsed_steps == np.inf:
+            break
+
+        time += elapsed_steps
+        finishing = steps_to_finish == elapsed_steps
+        remaining_data[running] -= np.where(np.isinf(rates), remaining_data[running], rates * elapsed_steps)
+        finished[running[finishing]] = True
+        completion_times[running[finishing]] = time
+
+        # Starting flows whose prerequisites have finished
+        for index in np.flatnonzero(~started).tolist():
+            if all(finished[prerequisite] for prerequisite in prerequisites[index]):
+                started[index] = True
+
+    return [float(completion_time) if np.isinf(completion_time) else int(completion_time) for completion_time in completion_times[first_hypothetical_flow:]]
+
+
+def _get_equal_share_rates(capacities: np.ndarray, demands: np.ndarray, entry_flows: np.ndarray, entry_links: np.ndarray) -> np.ndarray:
+    """Calculates the rates of flows when each link is equally shared among the flows that cross it (see "equal_share").
+
+    Args:
+        capacities (np.ndarray): Bandwidth of each link.
+        demands (np.ndarray): Remaining data of each flow.
+        entry_flows (np.ndarray): Flow index of each entry of the flow-link incidence matrix.
+        entry_links (np.ndarray): Link index of each entry of the flow-link incidence matrix.
+
+    Returns:
+        rates (np.ndarray): Rate of each flow (the smallest share among the links it uses).
+    """
+    flows_per_link = np.bincount(entry_links, minlength=len(capacities))
+    rates = np.full(len(demands), np.inf)
+    np.minimum.at(rates, entry_flows, capacities[entry_links] / flows_per_link[entry_links])
+    return rates
+
+
+def _get_max_min_fairness_rates(capacities: np.ndarray, demands: np.ndarray, entry_flows: np.ndarray, entry_links: np.ndarray) -> np.ndarray:
+    """Calculates the rates of flows when each link is shared among the flows that cross it according to the Max-Min Fairness
+    criterion (see "max_min_fairness"). Shares of all links are calculated at once: the demands in each link are sorted, and the
+    fair share of a link is defined by the smallest demand that cannot be satisfied once the smaller demands are.
+
+    Args:
+        capacities (np.ndarray): Bandwidth of each link.
+        demands (np.ndarray): Remaining data of each flow.
+        entry_flows (np.ndarray): Flow index of each entry of the flow-link incidence matrix.
+        entry_links (np.ndarray): Link index of each entry of the flow-link incidence matrix.
+
+    Returns:
+        rates (np.ndarray): Rate of each flow (the smallest share among the links it uses).
+    """
+    entry_demands = demands[entry_flows]
+    order = np.lexsort((entry_demands, entry_links))
+    sorted_links = entry_links[order]
+    sorted_demands = entry_demands[order]
+
+    # Position of each entry among the entries of its link, and sum of the smaller demands in the same link
+    flows_per_link = np.bincount(entry_links, minlength=len(capacities))
+    first_positions = np.cumsum(flows_per_link) - flows_per_link
+    positions = np.arange(len(order)) - first_positions[sorted_links]
+    demand_sums = np.cumsum(sorted_demands)
+    smaller_demands = demand_sums - sorted_demands - (demand_sums[first_positions[sorted_links]] - sorted_demands[first_positions[sorted_links]])
+
+    # The fair share of each link is given by the first demand larger than an equal split of the capacity left by smaller demands
+    levels = (capacities[sorted_links] - smaller_demands) / (flows_per_link[sorted_links] - positions)
+    unsatisfied = sorted_demands >= levels
+    first_unsatisfied = np.full(len(capacities), len(order), dtype=np.int64)
+    np.minimum.at(first_unsatisfied, sorted_links[unsatisfied], np.flatnonzero(unsatisfied))
+    fair_shares = np.full(len(capacities), np.inf)
+    links_with_unsatisfied_flows = np.flatnonzero(first_unsatisfied < len(order))
+    fair_shares[links_with_unsatisfied_flows] = levels[first_unsatisfied[links_with_unsatisfied_flows]]
+
+    rates = np.full(len(demands), np.inf)
+    np.minimum.at(rates, entry_flows, np.minimum(entry_demands, fair_shares[entry_links]))
+    return rates
+
+
+def _get_progressive_filling_rates(capacities: np.ndarray, demands: np.ndarray, entry_flows: np.ndarray, entry_links: np.ndarray) -> np.ndarray:
+    """Calculates the rates of flows according to network-wide Max-Min Fairness (see "progressive_filling").
+
+    Args:
+        capacities (np.ndarray): Bandwidth of each link.
+        demands (np.ndarray): Remaining data of each flow.
+        entry_flows (np.ndarray): Flow index of each entry of the flow-link incidence matrix.
+        entry_links (np.ndarray): Link index of each entry of the flow-link incidence matrix.
+
+    Returns:
+        np.ndarray: Rate of each flow.
+    """
+    return np.array(calculate_progressive_filling(capacities=capacities, demands=demands, entry_flows=entry_flows, entry_links=entry_links))
+
+
+# Functions that calculate the rates of flows according to the sharing policy of each flow scheduling algorithm
+RATE_FUNCTIONS = {
+    equal_share: _get_equal_share_rates,
+    max_min_fairness: _get_max_min_fairness_rates,
+    progressive_filling: _get_progressive_filling_rates,
+}
@@ -3,27 +3,14 @@ def equal_share(topology: object, flows: list):
 
     Args:
         topology (object): Network topology object.
-        flows (list): List of flows in the topology.
+        flows (list): Ignored (deprecated). Kept for compatibility with the signature shared by bandwidth sharing algorithms, as the
+            links whose shares must be recalculated (and their flows) are gathered from the links marked dirty in the topology.
     """
-    # Gathering the links of used by flows that either started or finished or that have more bandwidth than needed
-    links_to_recalculate_bandwidth = []
-    for flow in flows:
-        flow_just_started = len([bw for bw in flow.bandwidth.values() if bw == None]) > 0
-        flow_just_ended = flow.data_to_transfer == 0
-
-        if flow_just_started or flow_just_ended:
-            for i in range(0, len(flow.path) - 1):
-                # Gathering link nodes
-                link = (flow.path[i], flow.path[i + 1])
-
-                # Checking if the link is not already included in "links_to_recalculate_bandwidth"
-                if link not in links_to_recalculate_bandwidth:
-                    links_to_recalculate_bandwidth.append(link)
+    # Gathering the links used by flows that either started or finished (links are marked as dirty by the flows themselves)
+    links_to_recalculate_bandwidth = topology.pop_dirty_links(events=["flow_started", "flow_finished"])
 
     # Calculating the bandwidth shares for the active flows
-    for link_nodes in links_to_recalculate_bandwidth:
-        link = topology[link_nodes[0]][link_nodes[1]]
-
+    for link in links_to_recalculate_bandwidth:
         # Recalculating bandwidth shares for the flows as some of them have changed
         flow_demands = [f.data_to_transfer for f in link["active_flows"]]
         if sum(flow_demands) > 0:
@@ -22,30 +22,16 @@ def max_min_fairness(topology: object, flows: list):
 
     Args:
         topology (object): Network topology object.
-        flows (list): List of flows in the topology.
+        flows (list): Ignored (deprecated). Kept for compatibility with the signature shared by bandwidth sharing algorithms, as the
+            links whose shares must be recalculated (and their flows) are gathered from the links marked dirty in the topology.
     """
-    # Gathering the links of used by flows that either started or finished or that have more bandwidth than needed
-    links_to_recalculate_bandwidth = []
-    for flow in flows:
-        flow_just_started = len([bw for bw in flow.bandwidth.values() if bw == None]) > 0
-        flow_just_ended = flow.data_to_transfer == 0
-        flow_wasting_bandwidth = (
-            False if flow_just_started else any([flow.data_to_transfer < bw for bw in flow.bandwidth.values()])
-        )
-
-        if flow_just_started or flow_just_ended or flow_wasting_bandwidth:
-            for i in range(0, len(flow.path) - 1):
-                # Gathering link nodes
-                link = (flow.path[i], flow.path[i + 1])
-
-                # Checking if the link is not already included in "links_to_recalculate_bandwidth"
-                if link not in links_to_recalculate_bandwidth:
-                    links_to_recalculate_bandwidth.append(link)
+    # Gathering the links used by flows that either started or finished or that have more bandwidth than needed (links are marked
+    # as dirty by the flows themselves)
+    links_to_recalculate_bandwidth = topology.pop_dirty_links(events=["flow_started", "flow_finished", "demand_below_share"])
 
     # Calculating the bandwidth shares for the active flows
-    for link_nodes in links_to_recalculate_bandwidth:
-        link = topology[link_nodes[0]][link_nodes[1]]
-
+    affected_flows = {}
+    for link in links_to_recalculate_bandwidth:
         # Recalculating bandwidth shares for the flows as some of them have changed
         flow_demands = [f.data_to_transfer for f in link["active_flows"]]
         if sum(flow_demands) > 0:
@@ -53,6 +39,11 @@ def max_min_fairness(topology: object, flows: list):
 
             for index, affected_flow in enumerate(link["active_flows"]):
                 affected_flow.bandwidth[link["id"]] = bw_shares[index]
+                affected_flows[affected_flow] = None
+
+    # Flows whose new shares exceed their demands have their links recalculated again in the next time step
+    for flow in affected_flows:
+        flow.report_bandwidth_events()
 
 
 def calculate_fair_allocation(capacity: int, demands: list) -> list:
@@ -0,0 +1,139 @@
+""" Contains a network-wide Max-Min Fairness algorithm based on progressive filling."""
+# Python libraries
+import numpy as np
+
+
+def progressive_filling(topology: object, flows: list):
+    """Manages the execution of the progressive filling algorithm, which shares the bandwidth of links among network flows according to
+    the Max-Min Fairness criterion considering the whole network at once [1]. Unlike "max_min_fairness", which computes a fair share
+    in each link independently and lets each flow use the smallest of its shares, progressive filling gives the same rate to every flow
+    along its path, and the capacity a flow cannot use at its bottleneck link is redistributed to the other flows sharing its links.
+
+    [1] Bertsekas, D., & Gallager, R. (1992). Data Networks (2nd ed.), Section 6.5.2. Prentice-Hall.
+
+    Args:
+        topology (object): Network topology object.
+        flows (list): Ignored (deprecated). Kept for compatibility with the signature shared by bandwidth sharing algorithms, as the
+            links whose shares must be recalculated (and their flows) are gathered from the links marked dirty in the topology.
+    """
+    # Gathering the flows that share links, directly or indirectly, with flows that either started or finished or that have more
+    # bandwidth than needed. Flows outside such connected component keep their rates, as the links they use were not affected
+    links_to_visit = topology.pop_dirty_links(events=["flow_started", "flow_finished", "demand_below_share"])
+    link_indexes = {link["id"]: index for index, link in enumerate(links_to_visit)}
+    capacities = [link["bandwidth"] for link in links_to_visit]
+
+    # While traversing the component, the flow-link incidence matrix is built as a list of (flow index, link index) entries
+    affected_flows = {}
+    entry_flows = []
+    entry_links = []
+    while len(links_to_visit) > 0:
+        for flow in links_to_visit.pop()["active_flows"]:
+            if flow in affected_flows:
+                continue
+
+            flow_index = len(affected_flows)
+            affected_flows[flow] = flow_index
+            for link in flow.links:
+                if link["id"] not in link_indexes:
+                    link_indexes[link["id"]] = len(capacities)
+                    capacities.append(link["bandwidth"])
+                    links_to_visit.append(link)
+
+                entry_flows.append(flow_index)
+                entry_links.append(link_indexes[link["id"]])
+
+    if len(affected_flows) == 0:
+        return
+
+    rates = calculate_progressive_filling(
+        capacities=capacities,
+        demands=[flow.data_to_transfer for flow in affected_flows],
+        entry_flows=entry_flows,
+        entry_links=entry_links,
+    )
+
+    # Every link in the path of a flow gets the flow's rate
+    for flow, rate in zip(affected_flows, rates):
+        for link_id in flow.bandwidth:
+            flow.bandwidth[link_id] = rate
+
+
+def calculate_progressive_filling(capacities: list, demands: list, entry_flows: list, entry_links: list) -> list:
+    """Calculates network-wide Max-Min Fair rates using progressive filling. The rates of all flows grow together until either a flow
+    reaches its demand or a link becomes saturated. Flows that reached their demand or that traverse saturated links are frozen, and
+    the remaining flows keep growing until every flow is frozen. As growing flows always share the same rate, each iteration only has
+    to find the next demand (demands are sorted once) and the next saturated link, which is done with vectorized NumPy operations.
+
+    Args:
+        capacities (list): Bandwidth of each link.
+        demands (list): Demand of each flow (i.e., the maximum rate it can use).
+        entry_flows (list): Flow index of each entry of the flow-link incidence matrix.
+        entry_links (list): Link index of each entry of the flow-link incidence matrix.
+
+    Returns:
+        list: Rate allocated to each flow.
+    """
+    capacities = np.asarray(capacities, dtype=np.float64)
+    demands = np.maximum(np.asarray(demands, dtype=np.float64), 0)
+    entry_flows = np.asarray(entry_flows, dtype=np.int64)
+    entry_links = np.asarray(entry_links, dtype=np.int64)
+
+    # Sorting the incidence matrix entries by flow and by link, so that the links of a flow and the flows of a link can be sliced
+    entries_by_flow = np.argsort(entry_flows, kind="stable")
+    flow_links = entry_links[entries_by_flow]
+    flow_indptr = np.concatenate(([0], np.cumsum(np.bincount(entry_flows, minlength=len(demands)))))
+    entries_by_link = np.argsort(entry_links, kind="stable")
+    link_flows = entry_flows[entries_by_link]
+    link_indptr = np.concatenate(([0], np.cumsum(np.bincount(entry_links, minlength=len(capacities)))))
+
+    rates = np.zeros(len(demands))
+    growing = np.ones(len(demands), dtype=bool)
+    growing_flows_per_link = np.bincount(entry_links, minlength=len(capacities)).astype(np.float64)
+    residual_capacities = capacities.copy()
+    demand_order = np.argsort(demands, kind="stable")
+    sorted_demands = demands[demand_order]
+    next_demand = 0
+    level = 0.0
+
+    # Capacity below such tolerance is considered exhausted (avoids endless iterations due to floating-point rounding)
+    tolerance = 1e-9 * np.maximum(capacities, 1)
+
+    # Flows without links are only limited by their demands
+    unconstrained_flows = np.flatnonzero(flow_indptr[1:] == flow_indptr[:-1])
+    rates[unconstrained_flows] = demands[unconstrained_flows]
+    growing[unconstrained_flows] = False
+
+    while growing.any():
+        # Skipping demands of flows that have already been frozen
+        while not growing[demand_order[next_demand]]:
+            next_demand += 1
+
+        # The rates grow until the first link gets saturated or the first flow reaches its demand
+        used_links = np.flatnonzero(growing_flows_per_link > 0)
+        link_increment = (residual_capacities[used_links] / growing_flows_per_link[used_links]).min() if len(used_links) > 0 else np.inf
+        demand_increment = demands[demand_order[next_demand]] - level
+        increment = max(min(link_increment, demand_increment), 0)
+
+        level += increment
+        residual_capacities[used_links] -= increment * growing_flows_per_link[used_links]
+
+        # Freezing flows that reached their demands and flows that traverse saturated links
+        last_demand = np.searchsorted(sorted_demands, level + 1e-9 * max(level, 1), side="right")
+        frozen_flows = [demand_order[next_demand:last_demand]]
+        for link in used_links[residual_capacities[used_links] <= tolerance[used_links]]:
+            frozen_flows.append(link_flows[link_indptr[link] : link_indptr[link + 1]])
+
+        frozen_flows = np.unique(np.concatenate(frozen_flows))
+        frozen_flows = frozen_flows[growing[frozen_flows]]
+
+        # Flows whose demands only differ from the level due to floating-point rounding get their demands (otherwise a negligible
+        # amount of data would be left for the next time step)
+        reached_demand = demands[frozen_flows] <= level + 1e-9 * max(level, 1)
+        rates[frozen_flows] = np.where(reached_demand, demands[frozen_flows], level)
+        growing[frozen_flows] = False
+
+        # Frozen flows stop consuming the capacity of their links
+        frozen_links = np.concatenate([flow_links[flow_indptr[flow] : flow_indptr[flow + 1]] for flow in frozen_flows])
+        growing_flows_per_link -= np.bincount(frozen_links, minlength=len(capacities))
+
+    return np.minimum(rates, demands).tolist()
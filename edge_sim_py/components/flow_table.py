@@ -0,0 +1,388 @@
+""" Contains an array-backed storage for the state of network flows, used to update flows and links in batches."""
+# Python libraries
+import numbers
+import numpy as np
+from collections.abc import MutableMapping
+
+
+class FlowTable:
+    """Class that stores the remaining data and the bandwidth shares of active network flows inside NumPy arrays. NetworkFlow objects
+    attached to the table become views over its arrays (their "data_to_transfer" and "bandwidth" attributes read and write the table),
+    so that the progress of all flows, their completion, and the bandwidth demand of links can be computed with a few vectorized
+    operations per time step instead of Python code executed for each flow and link.
+
+    Each flow occupies a row of the table, and each (flow, link) pair occupies an entry. The entries of a flow are stored side by side,
+    and rows keep the order in which flows were attached. Values are stored as floats along with a flag that tells whether they were
+    originally integers, so that flows and links read the same types of values as when their state is kept inside regular attributes.
+    Flows are detached (i.e., their state is copied back to regular attributes) once they finish. Flows whose classes override the
+    built-in activation procedure are stored in the table but are not progressed by the "step()" method, as they must be activated on
+    their own.
+    """
+
+    def __init__(self) -> object:
+        """Creates a FlowTable object.
+
+        Returns:
+            object: Created FlowTable object.
+        """
+        # Flow stored in each row (None for rows of detached flows), whether it is progressed in batches, and its remaining data (and
+        # whether it is an integer) and first entry
+        self.flows = []
+        self.attached = np.zeros(64, dtype=bool)
+        self.batched = np.zeros(64, dtype=bool)
+        self.remaining_data = np.zeros(64)
+        self.remaining_data_integral = np.zeros(64, dtype=bool)
+        self.first_entries = np.zeros(64, dtype=np.int64)
+        self.detached_rows = 0
+
+        # Row, link column, and bandwidth share (NaN while the share is not defined) of each entry, and whether the share is an integer
+        self.entry_count = 0
+        self.entry_rows = np.zeros(256, dtype=np.int64)
+        self.entry_links = np.zeros(256, dtype=np.int64)
+        self.shares = np.zeros(256)
+        self.shares_integral = np.zeros(256, dtype=bool)
+
+        # Links used by the attached flows (indexed by column) and the bandwidth demand last assigned to each of them
+        self.links = []
+        self.link_columns = {}
+        self.link_demands = np.zeros(0)
+
+    def attach(self, flow: object, batched: bool = True):
+        """Moves the state of a network flow to the table.
+
+        Args:
+            flow (object): NetworkFlow object.
+            batched (bool, optional): Whether the flow is progressed by the "step()" method (False for flows that are activated on
+                their own). Defaults to True.
+        """
+        # Compacting the table once most of its rows belong to detached flows
+        if self.detached_rows > 64 and self.detached_rows > len(self.flows) / 2:
+            self._compact()
+
+        row = len(self.flows)
+        links = {link["id"]: link for link in flow.links}
+        bandwidth = flow.bandwidth
+
+        self._reserve(rows=row + 1, entries=self.entry_count + len(bandwidth))
+        self.flows.append(flow)
+        self.attached[row] = True
+        self.batched[row] = batched
+        self.set_remaining_data(row=row, value=flow.data_to_transfer)
+        self.first_entries[row] = self.entry_count
+
+        offsets = {}
+        for offset, (link_id, share) in enumerate(bandwidth.items()):
+            entry = self.entry_count
+            self.entry_rows[entry] = row
+            self.entry_links[entry] = self._get_link_column(link=links[link_id])
+            self.set_share(entry=entry, share=share)
+            offsets[link_id] = offset
+            self.entry_count += 1
+
+        flow._flow_table = self
+        flow._flow_table_row = row
+        flow._flow_table_offsets = offsets
+
+    def detach(self, flow: object):
+        """Moves the state of a network flow from the table back to regular attributes of the flow.
+
+        Args:
+            flow (object): NetworkFlow object.
+        """
+        data_to_transfer = self.get_remaining_data(flow=flow)
+        bandwidth = dict(flow.bandwidth)
+
+        self.flows[flow._flow_table_row] = None
+        self.attached[flow._flow_table_row] = False
+        self.detached_rows += 1
+        flow._flow_table = None
+        flow._flow_table_row = None
+        flow._flow_table_offsets = None
+
+        flow.data_to_transfer = data_to_transfer
+        flow.bandwidth = bandwidth
+
+    def get_remaining_data(self, flow: object) -> float:
+        """Gets the amount of data a flow has yet to transfer.
+
+        Args:
+            flow (object): NetworkFlow object.
+
+        Returns:
+            float: Remaining data (an int if the remaining data is an integer).
+        """
+        row = flow._flow_table_row
+        value = self.remaining_data[row]
+        return int(value) if self.remaining_data_integral[row] else float(value)
+
+    def set_remaining_data(self, value: float, flow: object = None, row: int = None):
+        """Sets the amount of data a flow has yet to transfer.
+
+        Args:
+            value (float): Remaining data.
+            flow (object, optional): NetworkFlow object. Defaults to None (the flow is identified by the "row" argument).
+            row (int, optional): Row of the flow. Defaults to None (the row of the "flow" argument).
+        """
+        row = flow._flow_table_row if row is None else row
+        self.remaining_data[row] = value
+        self.remaining_data_integral[row] = isinstance(value, numbers.Integral)
+
+    def get_share(self, entry: int) -> float:
+        """Gets the bandwidth share stored in a given entry.
+
+        Args:
+            entry (int): Entry index.
+
+        Returns:
+            float: Bandwidth share (None if the share was not defined yet, or an int if the share is an integer).
+        """
+        share = self.shares[entry]
+        if np.isnan(share):
+            return None
+
+        return int(share) if self.shares_integral[entry] else float(share)
+
+    def set_share(self, entry: int, share: float):
+        """Sets the bandwidth share stored in a given entry.
+
+        Args:
+            entry (int): Entry index.
+            share (float): Bandwidth share (None for undefined shares).
+        """
+        self.shares[entry] = np.nan if share is None else share
+        self.shares_integral[entry] = isinstance(share, numbers.Integral)
+
+    def step(self) -> list:
+        """Updates the progress of all attached flows (except for those activated on their own) according to their bandwidth shares,
+        finishing those that have no data left to transfer. Flows that finish or have events that require recalculating their
+        bandwidth shares are processed in the order they were attached, as if each flow was activated on its own.
+
+        Returns:
+            finished_flows (list): Flows that finished.
+        """
+        rows = len(self.flows)
+        if rows == 0:
+            return []
+
+        rates, largest_shares, integral_rates = self._get_rates()
+        attached = self.attached[:rows] & self.batched[:rows]
+
+        # Flows whose bandwidth shares are all defined progress according to the smallest share among the links they use (the remaining
+        # data of a flow only stays an integer if the share is an integer as well)
+        remaining_data = self.remaining_data[:rows]
+        progressing = attached & ~np.isnan(rates)
+        remaining_data[progressing] -= rates[progressing]
+        self.remaining_data_integral[:rows] &= integral_rates | ~progressing
+
+        # Gathering flows that finished or whose bandwidth shares must be recalculated (see "NetworkFlow.report_bandwidth_events()")
+        finished = attached & (remaining_data <= 0)
+        has_events = attached & (np.isnan(rates) | (remaining_data == 0) | (remaining_data < largest_shares))
+
+        finished_flows = []
+        for row in np.flatnonzero(finished | has_events).tolist():
+            flow = self.flows[row]
+            if finished[row]:
+                flow._finish()
+                finished_flows.append(flow)
+
+            flow.report_bandwidth_events()
+
+        return finished_flows
+
+    def update_link_demands(self):
+        """Updates the bandwidth demand of links (i.e., the sum of the bandwidth shares of the flows that cross them)."""
+        entries = self.entry_count
+        if entries == 0 and len(self.links) == 0:
+            return
+
+        valid_entries = self.attached[self.entry_rows[:entries]] & ~np.isnan(self.shares[:entries])
+        entry_links = self.entry_links[:entries][valid_entries]
+        demands = np.bincount(entry_links, weights=self.shares[:entries][valid_entries], minlength=len(self.links))
+
+        # Only links whose demand changed are updated. Demands are integers as long as all the shares summed up are integers
+        changed_columns = np.flatnonzero(demands != self.link_demands).tolist()
+        if len(changed_columns) > 0:
+            fractional_entries = ~self.shares_integral[:entries][valid_entries]
+            fractional_shares = np.bincount(entry_links[fractional_entries], minlength=len(self.links))
+
+            for column in changed_columns:
+                demand = demands[column]
+                self.links[column]["bandwidth_demand"] = int(demand) if fractional_shares[column] == 0 else float(demand)
+
+        self.link_demands = demands
+
+    def _get_rates(self) -> tuple:
+        """Gets the smallest and the largest bandwidth share of each row (NaN for rows with undefined shares or without links), and
+        whether the smallest share is an integer (i.e., whether all shares of the row are integers).
+
+        Returns:
+            tuple: Smallest bandwidth shares, largest bandwidth shares, and whether the smallest shares are integers.
+        """
+        rows = len(self.flows)
+        rates = np.full(rows, np.nan)
+        largest_shares = np.full(rows, np.nan)
+        integral_rates = np.zeros(rows, dtype=bool)
+
+        entry_counts = np.diff(np.append(self.first_entries[:rows], self.entry_count))
+        rows_with_links = np.flatnonzero(entry_counts > 0)
+        if len(rows_with_links) > 0:
+            shares = self.shares[: self.entry_count]
+            rates[rows_with_links] = np.minimum.reduceat(shares, self.first_entries[rows_with_links])
+            largest_shares[rows_with_links] = np.maximum.reduceat(shares, self.first_entries[rows_with_links])
+            integral_shares = self.shares_integral[: self.entry_count]
+            if integral_shares.all():
+                integral_rates[rows_with_links] = True
+            elif integral_shares.any():
+                integral_rates[rows_with_links] = np.logical_and.reduceat(integral_shares, self.first_entries[rows_with_links])
+
+        return rates, largest_shares, integral_rates
+
+    def _get_link_column(self, link: object) -> int:
+        """Gets the column of a link, adding the link to the table if needed.
+
+        Args:
+            link (object): NetworkLink object.
+
+        Returns:
+            column (int): Link column.
+        """
+        column = self.link_columns.get(link["id"])
+        if column is None:
+            column = len(self.links)
+            self.links.append(link)
+            self.link_columns[link["id"]] = column
+            self.link_demands = np.append(self.link_demands, link["bandwidth_demand"])
+
+        return column
+
+    def _reserve(self, rows: int, entries: int):
+        """Grows the table arrays (doubling their sizes) so that they fit a given number of rows and entries.
+
+        Args:
+            rows (int): Number of rows.
+            entries (int): Number of entries.
+        """
+        if rows > len(self.remaining_data):
+            size = max(rows, 2 * len(self.remaining_data))
+            self.attached = np.resize(self.attached, size)
+            self.batched = np.resize(self.batched, size)
+            self.remaining_data = np.resize(self.remaining_data, size)
+            self.remaining_data_integral = np.resize(self.remaining_data_integral, size)
+            self.first_entries = np.resize(self.first_entries, size)
+
+        if entries > len(self.shares):
+            size = max(entries, 2 * len(self.shares))
+            self.entry_rows = np.resize(self.entry_rows, size)
+            self.entry_links = np.resize(self.entry_links, size)
+            self.shares = np.resize(self.shares, size)
+            self.shares_integral = np.resize(self.shares_integral, size)
+
+    def _compact(self):
+        """Removes the rows and entries of detached flows."""
+        rows = len(self.flows)
+        attached_rows = np.flatnonzero(self.attached[:rows])
+        entry_rows = self.entry_rows[: self.entry_count]
+        attached_entries = np.flatnonzero(self.attached[entry_rows])
+
+        # Renumbering rows and entries while keeping their order
+        new_rows = np.full(rows, -1, dtype=np.int64)
+        new_rows[attached_rows] = np.arange(len(attached_rows))
+        entry_counts = np.diff(np.append(self.first_entries[:rows], self.entry_count))[attached_rows]
+
+        self.flows = [self.flows[row] for row in attached_rows.tolist()]
+        self.attached[:rows] = False
+        self.attached[: len(attached_rows)] = True
+        self.batched[: len(attached_rows)] = self.batched[attached_rows]
+        self.remaining_data[: len(attached_rows)] = self.remaining_data[attached_rows]
+        self.remaining_data_integral[: len(attached_rows)] = self.remaining_data_integral[attached_rows]
+        self.first_entries[: len(attached_rows)] = np.cumsum(entry_counts) - entry_counts
+        self.entry_rows[: len(attached_entries)] = new_rows[entry_rows[attached_entries]]
+        self.entry_links[: len(attached_entries)] = self.entry_links[attached_entries]
+        self.shares[: len(attached_entries)] = self.shares[attached_entries]
+        self.shares_integral[: len(attached_entries)] = self.shares_integral[attached_entries]
+        self.entry_count = len(attached_entries)
+        self.detached_rows = 0
+
+        for row, flow in enumerate(self.flows):
+            flow._flow_table_row = row
+
+
+class FlowBandwidth(MutableMapping):
+    """Dictionary-like view over the bandwidth shares of a network flow stored inside a FlowTable (indexed by link ID, with None for
+    shares that were not defined yet).
+    """
+
+    def __init__(self, flow: object) -> object:
+        """Creates a FlowBandwidth object.
+
+        Args:
+            flow (object): NetworkFlow object attached to a FlowTable.
+
+        Returns:
+            object: Created FlowBandwidth object.
+        """
+        self.flow = flow
+
+    def _get_entry(self, link_id: int) -> int:
+        """Gets the table entry that stores the flow's share of a link.
+
+        Args:
+            link_id (int): Link ID.
+
+        Returns:
+            int: Entry index.
+        """
+        table = self.flow._flow_table
+        return table.first_entries[self.flow._flow_table_row] + self.flow._flow_table_offsets[link_id]
+
+    def __getitem__(self, link_id: int) -> float:
+        """Gets the flow's bandwidth share of a link.
+
+        Args:
+            link_id (int): Link ID.
+
+        Returns:
+            float: Bandwidth share (None if the share was not defined yet).
+        """
+        return self.flow._flow_table.get_share(entry=self._get_entry(link_id=link_id))
+
+    def __setitem__(self, link_id: int, share: float):
+        """Sets the flow's bandwidth share of a link.
+
+        Args:
+            link_id (int): Link ID.
+            share (float): Bandwidth share (None for undefined shares).
+        """
+        self.flow._flow_table.set_share(entry=self._get_entry(link_id=link_id), share=share)
+
+    def __delitem__(self, link_id: int):
+        """Prevents links from being removed from the bandwidth shares, as the table entries of a flow are fixed once it is attached.
+
+        Args:
+            link_id (int): Link ID.
+        """
+        raise Exception("Links cannot be removed from the bandwidth shares of a flow stored in a flow table.")
+
+    def __iter__(self) -> object:
+        """Iterates over the IDs of the links used by the flow.
+
+        Returns:
+            object: Iterator over link IDs.
+        """
+        return iter(self.flow._flow_table_offsets)
+
+    def __len__(self) -> int:
+        """Gets the number of links used by the flow.
+
+        Returns:
+            int: Number of links.
+        """
+        return len(self.flow._flow_table_offsets)
+
+    def __repr__(self) -> str:
+        """Defines how the object is represented inside the console (i.e., as a regular dictionary of bandwidth shares).
+
+        Returns:
+            str: Object representation.
+        """
+        return repr(dict(self))
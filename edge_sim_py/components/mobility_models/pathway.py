@@ -7,7 +7,6 @@ from edge_sim_py.components.base_station import BaseStation
 
 # Python libraries
 import random
-import networkx as nx
 
 
 def pathway(user: object):
@@ -36,7 +35,7 @@ def pathway(user: object):
         target_node = random.choice([bs for bs in BaseStation.all() if bs != current_node])
 
         # Calculating the shortest mobility path according to the Pathway mobility model
-        path = nx.shortest_path(G=user.model.topology, source=current_node.network_switch, target=target_node.network_switch)
+        path = user.model.topology.get_shortest_path(source=current_node.network_switch, target=target_node.network_switch)
         mobility_path.extend([network_switch.base_station for network_switch in path])
 
         if i < n_paths - 1:
@@ -1,17 +1,41 @@
 """ Contains network-flow-related functionality."""
 # EdgeSimPy components
 from edge_sim_py.component_manager import ComponentManager
+from edge_sim_py.components.flow_table import FlowBandwidth
 
 # Mesa modules
 from mesa import Agent
 
+# Python libraries
+import math
+import numbers
+import sys
+
 
 class NetworkFlow(ComponentManager, Agent):
     """Class that represents a network flow."""
 
-    # Class attributes that allow this class to use helper methods from the ComponentManager
-    _instances = []
-    _object_count = 0
+    # Attributes whose changes affect model-level metrics (see the "update_kpis()" method)
+    _tracked_attributes = ["status"]
+
+    # Flow table that stores the flow's remaining data and bandwidth shares (see the "flow_storage" simulator option)
+    _flow_table = None
+
+    # Types of the metrics collected by the "collect()" method (used when metrics are stored in a columnar format)
+    metrics_schema = {
+        "Instance ID": "int",
+        "Object being Transferred": "str",
+        "Object Type": "str",
+        "Start": "int",
+        "End": "int",
+        "Source": "int",
+        "Target": "int",
+        "Path": "list[int]",
+        "Links Bandwidth": "list[number]",
+        "Actual Bandwidth": "number",
+        "Status": "str",
+        "Data to Transfer": "number",
+    }
 
     def __init__(
         self,
@@ -50,6 +74,9 @@ class NetworkFlow(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
         # Reference to the network topology object
         self.topology = topology
 
@@ -65,6 +92,9 @@ class NetworkFlow(ComponentManager, Agent):
         self.bandwidth = {}
         self.last_updated_bandwidth = {}
 
+        # Network links used by the flow
+        self.links = []
+
         # Temporal information about the flow
         self.start = start
         self.end = None
@@ -79,6 +109,7 @@ class NetworkFlow(ComponentManager, Agent):
         for i in range(0, len(path) - 1):
             link = self.topology[path[i]][path[i + 1]]
             link["active_flows"].append(self)
+            self.links.append(link)
             self.bandwidth[link["id"]] = None
             self.last_updated_bandwidth[link["id"]] = None
 
@@ -86,6 +117,58 @@ class NetworkFlow(ComponentManager, Agent):
         self.model = None
         self.unique_id = None
 
+        # Marking the links used by the flow as dirty so that their bandwidth shares are calculated
+        self.report_bandwidth_events()
+
+    @property
+    def data_to_transfer(self) -> float:
+        """Amount of data the flow has yet to transfer, which is stored inside the flow table while the flow is attached to one.
+
+        Returns:
+            float: Remaining data.
+        """
+        if self._flow_table is not None:
+            return self._flow_table.get_remaining_data(flow=self)
+
+        return self._data_to_transfer
+
+    @data_to_transfer.setter
+    def data_to_transfer(self, value: float):
+        """Updates the amount of data the flow has yet to transfer.
+
+        Args:
+            value (float): Remaining data.
+        """
+        if self._flow_table is not None:
+            self._flow_table.set_remaining_data(flow=self, value=value)
+        else:
+            self._data_to_transfer = value
+
+    @property
+    def bandwidth(self) -> dict:
+        """Bandwidth shares of the flow in each link it uses (indexed by link ID). While the flow is attached to a flow table, shares
+        are accessed through a dictionary-like view over the table.
+
+        Returns:
+            dict: Bandwidth shares.
+        """
+        if self._flow_table is not None:
+            return FlowBandwidth(flow=self)
+
+        return self._bandwidth
+
+    @bandwidth.setter
+    def bandwidth(self, value: dict):
+        """Replaces the bandwidth shares of the flow.
+
+        Args:
+            value (dict): Bandwidth shares.
+        """
+        if self._flow_table is not None:
+            raise Exception("The bandwidth shares of a flow attached to a flow table cannot be replaced.")
+
+        self._bandwidth = value
+
     def _to_dict(self) -> dict:
         """Method that overrides the way the object is formatted to JSON."
 
@@ -100,41 +183,135 @@ class NetworkFlow(ComponentManager, Agent):
             "start": self.start,
             "end": self.end,
             "data_to_transfer": self.data_to_transfer,
-            "bandwidth": self.bandwidth,
+            "bandwidth": dict(self.bandwidth),
             "metadata": self.metadata,
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
-        bw = list(self.bandwidth.values())
-        actual_bw = min(bw) if len([bw for bw in self.bandwidth.values() if bw == None]) == 0 else None
-
-        if self.metadata["type"] == "layer":
-            object_being_transferred = f"{str(self.metadata['object'])} ({self.metadata['object'].instruction})"
-        else:
-            object_being_transferred = str(self.metadata["object"])
-
         metrics = {
-            "Instance ID": self.id,
-            "Object being Transferred": object_being_transferred,
-            "Object Type": self.metadata["type"],
-            "Start": self.start,
-            "End": self.end,
-            "Source": self.source.id if self.source else None,
-            "Target": self.target.id if self.target else None,
-            "Path": [node.id for node in self.path],
-            "Links Bandwidth": bw,
-            "Actual Bandwidth": actual_bw,
-            "Status": self.status,
-            "Data to Transfer": self.data_to_transfer,
+            "Instance ID": lambda: self.id,
+            "Object being Transferred": self._get_transferred_object_name,
+            "Object Type": lambda: self.metadata["type"],
+            "Start": lambda: self.start,
+            "End": lambda: self.end,
+            "Source": lambda: self.source.id if self.source else None,
+            "Target": lambda: self.target.id if self.target else None,
+            "Path": lambda: [node.id for node in self.path],
+            "Links Bandwidth": lambda: list(self.bandwidth.values()),
+            "Actual Bandwidth": lambda: min(self.bandwidth.values()) if len([bw for bw in self.bandwidth.values() if bw == None]) == 0 else None,
+            "Status": lambda: self.status,
+            "Data to Transfer": lambda: self.data_to_transfer,
         }
+
+        # Only the requested metrics are computed
+        metrics = {name: metric() for name, metric in metrics.items() if fields is None or name in fields}
         return metrics
 
+    def update_kpis(self, kpis: object):
+        """Reports the flow's current state to the model-level metrics maintained incrementally by the simulator.
+
+        Args:
+            kpis (object): IncrementalMetrics object.
+        """
+        kpis.set_membership(name="Active Flows", obj=self, is_member=self.status == "active")
+
+    def report_bandwidth_events(self):
+        """Reports to the network topology the events that require recalculating the flow's bandwidth shares (i.e., the flow has
+        just started or finished, or has more bandwidth than it needs), marking the links used by the flow as dirty.
+        """
+        if self.topology is None:
+            return
+
+        flow_just_started = any([bw is None for bw in self.bandwidth.values()])
+        if flow_just_started:
+            self.topology.mark_dirty_links(flow=self, event="flow_started")
+
+        if self.data_to_transfer == 0 or self.status == "finished":
+            self.topology.mark_dirty_links(flow=self, event="flow_finished")
+
+        if not flow_just_started and any([self.data_to_transfer < bw for bw in self.bandwidth.values()]):
+            self.topology.mark_dirty_links(flow=self, event="demand_below_share")
+
+    def _get_transferred_object_name(self) -> str:
+        """Gets the name of the object transferred by the flow.
+
+        Returns:
+            str: Name of the object being transferred.
+        """
+        if self.metadata["type"] == "layer":
+            return f"{str(self.metadata['object'])} ({self.metadata['object'].instruction})"
+
+        return str(self.metadata["object"])
+
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the network flow has events to process (i.e., its completion).
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the flow's "step()" method must run next.
+        """
+        if self.status != "active":
+            return float("inf")
+
+        current_step = self.model.schedule.steps
+
+        if any([bw == None for bw in self.bandwidth.values()]) or self.data_to_transfer <= 0:
+            return current_step
+
+        bandwidth = min(self.bandwidth.values()) if len(self.bandwidth) > 0 else 0
+        if bandwidth <= 0:
+            return float("inf")
+
+        # The flow finishes in the last of the "step()" calls needed to transfer its remaining data, and the first of them would
+        # take place at the current time step
+        return current_step + self._get_steps_to_finish(bandwidth=bandwidth) - 1
+
+    def _get_steps_to_finish(self, bandwidth: float) -> int:
+        """Gets how many calls to the "step()" method the flow needs to transfer its remaining data at a given bandwidth.
+
+        Args:
+            bandwidth (float): Bandwidth available to the flow.
+
+        Returns:
+            steps (int): Number of calls to the "step()" method.
+        """
+        ratio = self.data_to_transfer / bandwidth
+        steps = math.ceil(ratio)
+
+        # The "step()" method subtracts the bandwidth from the remaining data once per call, and each subtraction between floats may
+        # be rounded. Hence, when the remaining data is close to a multiple of the bandwidth, the subtractions are replayed
+        if not isinstance(self.data_to_transfer, numbers.Integral) or not isinstance(bandwidth, numbers.Integral):
+            rounding_error = 4 * steps * sys.float_info.epsilon * max(ratio, 1)
+            if abs(ratio - round(ratio)) <= rounding_error:
+                remaining_data = self.data_to_transfer
+                steps = 0
+                while remaining_data > 0:
+                    remaining_data -= bandwidth
+                    steps += 1
+
+        return steps
+
+    def fast_forward(self, steps: int):
+        """Updates the flow progress as if it was activated during a given number of time steps without events.
+
+        Args:
+            steps (int): Number of time steps.
+        """
+        if self.status == "active" and not any([bw == None for bw in self.bandwidth.values()]):
+            bandwidth = min(self.bandwidth.values())
+            for _ in range(steps):
+                self.data_to_transfer -= bandwidth
+
+            self.report_bandwidth_events()
+
     def step(self):
         """Method that executes the events involving the object at each time step."""
         if self.status == "active":
@@ -143,31 +320,40 @@ class NetworkFlow(ComponentManager, Agent):
                 self.data_to_transfer -= min(self.bandwidth.values())
 
             if self.data_to_transfer <= 0:
-                # Updating the completed flow's properties
-                self.data_to_transfer = 0
-
-                # Storing the current step as when the flow ended
-                self.end = self.model.schedule.steps + 1
-
-                # Updating the flow status to "finished"
-                self.status = "finished"
-
-                # Releasing links used by the completed flow
-                for i in range(0, len(self.path) - 1):
-                    link = self.model.topology[self.path[i]][self.path[i + 1]]
-                    link["active_flows"].remove(self)
-
-                # When container layer flows finish: Adds the container layer to its target host
-                if self.metadata["type"] == "layer":
-                    # Removing the flow from its target host's download queue
-                    self.target.download_queue.remove(self)
-
-                    # Adding the layer to its target host
-                    layer = self.metadata["object"]
-                    layer.server = self.target
-                    self.target.container_layers.append(layer)
-
-                # When service state flows finish: change the service migration status
-                elif self.metadata["type"] == "service_state":
-                    service = self.metadata["object"]
-                    service._Service__migrations[-1]["status"] = "finished"
+                self._finish()
+
+            self.report_bandwidth_events()
+
+    def _finish(self):
+        """Finishes the flow, releasing the links it used and applying its effects (e.g., adding a container layer to its target host)."""
+        # Moving the flow's state out of the flow table
+        if self._flow_table is not None:
+            self._flow_table.detach(flow=self)
+
+        # Updating the completed flow's properties
+        self.data_to_transfer = 0
+
+        # Storing the current step as when the flow ended
+        self.end = self.model.schedule.steps + 1
+
+        # Updating the flow status to "finished"
+        self.status = "finished"
+
+        # Releasing links used by the completed flow
+        for link in self.links:
+            link["active_flows"].remove(self)
+
+        # When container layer flows finish: Adds the container layer to its target host
+        if self.metadata["type"] == "layer":
+            # Removing the flow from its target host's download queue
+            self.target.download_queue.remove(self)
+
+            # Adding the layer to its target host
+            layer = self.metadata["object"]
+            layer.server = self.target
+            self.target.container_layers.append(layer)
+
+        # When service state flows finish: change the service migration status
+        elif self.metadata["type"] == "service_state":
+            service = self.metadata["object"]
+            service._Service__migrations[-1]["status"] = "finished"
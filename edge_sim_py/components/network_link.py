@@ -10,9 +10,11 @@ from mesa import Agent
 class NetworkLink(dict, ComponentManager, Agent):
     """Class that represents a network link."""
 
-    # Class attributes that allow this class to use helper methods from ComponentManager
-    _instances = []
-    _object_count = 0
+    # Attributes that affect the shortest paths and path delays cached by the network topology
+    routing_attributes = ["delay", "active"]
+
+    # Attributes that affect the power consumption of the network switches connected by the link (see "NetworkSwitch.update_kpis()")
+    power_attributes = ["active", "bandwidth"]
 
     def __init__(self, obj_id: int = None) -> object:
         """Creates a NetworkLink object.
@@ -32,6 +34,9 @@ class NetworkLink(dict, ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self["id"] = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
         # Reference to the network topology
         self["topology"] = None
 
@@ -81,6 +86,24 @@ class NetworkLink(dict, ComponentManager, Agent):
         """
         self[attribute_name] = attribute_value
 
+    def __setitem__(self, key: str, value: object):
+        """Overrides the value of an object attribute, discarding the routes cached by the network topology and the power consumption
+        of the connected switches reported to the model-level metrics if the attribute affects them.
+
+        Args:
+            key (str): Name of the attribute to be changed.
+            value (object): Value for the attribute.
+        """
+        dict.__setitem__(self, key, value)
+
+        if key in self.routing_attributes and self.get("topology") is not None:
+            self["topology"].invalidate_routes()
+
+        if key in self.power_attributes:
+            for node in self.get("nodes", []):
+                if isinstance(node, ComponentManager):
+                    node._update_kpis()
+
     def __delattr__(self, attribute_name: str):
         """Deletes an object attribute by its name.
 
@@ -115,9 +138,12 @@ class NetworkLink(dict, ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
@@ -128,3 +154,15 @@ class NetworkLink(dict, ComponentManager, Agent):
         """Method that executes the events involving the object at each time step."""
         # Updating the link's bandwidth demand based on the slice of bandwidth used by the active flows that cross it in the current step
         self["bandwidth_demand"] = sum(flow.bandwidth[self.id] for flow in self["active_flows"])
+
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the link has events to process (i.e., changes in its bandwidth demand).
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the next event takes place.
+        """
+        bandwidth_shares = [flow.bandwidth[self.id] for flow in self["active_flows"]]
+        if None in bandwidth_shares or self["bandwidth_demand"] != sum(bandwidth_shares):
+            return self.model.schedule.steps
+
+        return float("inf")
@@ -12,9 +12,14 @@ import copy
 class NetworkSwitch(ComponentManager, Agent):
     """Class that represents a network switch."""
 
-    # Class attributes that allow this class to use helper methods from ComponentManager
-    _instances = []
-    _object_count = 0
+    # Attributes whose changes affect model-level metrics (see the "update_kpis()" method)
+    _tracked_attributes = ["active", "power_model", "power_model_parameters"]
+
+    # Types of the metrics collected by the "collect()" method (used when metrics are stored in a columnar format)
+    metrics_schema = {
+        "Instance ID": "int",
+        "Power Consumption": "number",
+    }
 
     def __init__(self, obj_id: int = None) -> object:
         """Creates a NetworkSwitch object.
@@ -34,6 +39,9 @@ class NetworkSwitch(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
         # Network switch coordinates
         self.coordinates = None
 
@@ -81,22 +89,44 @@ class NetworkSwitch(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
         metrics = {
-            "Instance ID": self.id,
-            "Power Consumption": self.get_power_consumption(),
+            "Instance ID": lambda: self.id,
+            "Power Consumption": lambda: self.get_power_consumption(),
         }
+
+        # Only the requested metrics are computed
+        metrics = {name: metric() for name, metric in metrics.items() if fields is None or name in fields}
         return metrics
 
+    def update_kpis(self, kpis: object):
+        """Reports the switch's current state to the model-level metrics maintained incrementally by the simulator.
+
+        Args:
+            kpis (object): IncrementalMetrics object.
+        """
+        kpis.invalidate_value(name="Power Consumption", obj=self, get_value=self.get_power_consumption)
+
     def step(self):
         """Method that executes the events involving the object at each time step."""
         ...
 
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the object has events to process.
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the next event takes place.
+        """
+        return float("inf")
+
     def get_power_consumption(self) -> float:
         """Gets the network switch's power consumption.
 
@@ -8,16 +8,21 @@ from edge_sim_py.components.network_flow import NetworkFlow
 # Mesa modules
 from mesa import Agent
 
-# Python libraries
-import networkx as nx
-
 
 class Service(ComponentManager, Agent):
     """Class that represents a service."""
 
-    # Class attributes that allow this class to use helper methods from the ComponentManager
-    _instances = []
-    _object_count = 0
+    # Attributes whose changes affect model-level metrics (see the "update_kpis()" method)
+    _tracked_attributes = ["being_provisioned"]
+
+    # Types of the metrics collected by the "collect()" method (used when metrics are stored in a columnar format)
+    metrics_schema = {
+        "Instance ID": "int",
+        "Available": "bool",
+        "Server": "int",
+        "Being Provisioned": "bool",
+        "Last Migration": "object",
+    }
 
     def __init__(
         self,
@@ -50,6 +55,9 @@ class Service(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
         # Service label
         self.label = label
 
@@ -106,15 +114,34 @@ class Service(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
+        metrics = {
+            "Instance ID": lambda: self.id,
+            "Available": lambda: self._available,
+            "Server": lambda: self.server.id if self.server else None,
+            "Being Provisioned": lambda: self.being_provisioned,
+            "Last Migration": self._get_last_migration_metrics,
+        }
 
-        if len(self._Service__migrations) > 0:
+        # Only the requested metrics are computed
+        metrics = {name: metric() for name, metric in metrics.items() if fields is None or name in fields}
+        return metrics
+
+    def _get_last_migration_metrics(self) -> dict:
+        """Gathers metrics about the service's last migration.
 
+        Returns:
+            last_migration (dict): Last migration metrics (or None if the service has never been migrated).
+        """
+        if len(self._Service__migrations) > 0:
             last_migration = {
                 "status": self._Service__migrations[-1]["status"],
                 "origin": str(self._Service__migrations[-1]["origin"]),
@@ -128,14 +155,25 @@ class Service(ComponentManager, Agent):
         else:
             last_migration = None
 
-        metrics = {
-            "Instance ID": self.id,
-            "Available": self._available,
-            "Server": self.server.id if self.server else None,
-            "Being Provisioned": self.being_provisioned,
-            "Last Migration": last_migration,
-        }
-        return metrics
+        return last_migration
+
+    def update_kpis(self, kpis: object):
+        """Reports the service's current state to the model-level metrics maintained incrementally by the simulator.
+
+        Args:
+            kpis (object): IncrementalMetrics object.
+        """
+        kpis.set_membership(name="Ongoing Migrations", obj=self, is_member=self.being_provisioned)
+
+    def update_statistics(self, statistics: object):
+        """Updates the online statistics about the service's migrations (once each migration finishes).
+
+        Args:
+            statistics (object): OnlineStatistics object.
+        """
+        if len(self._Service__migrations) > 0 and self._Service__migrations[-1]["end"] == self.model.schedule.steps:
+            migration = self._Service__migrations[-1]
+            statistics.update(name="Migration Duration", value=migration["end"] - migration["start"])
 
     def step(self):
         """Method that executes the events involving the object at each time step."""
@@ -143,7 +181,7 @@ class Service(ComponentManager, Agent):
             migration = self._Service__migrations[-1]
 
             # Gathering information about the service's image
-            image = ContainerImage.find_by(attribute_name="digest", attribute_value=self.image_digest)
+            image = ContainerImage.get_metadata(digest=self.image_digest)
 
             # Gathering layers present in the target server (layers, download_queue, waiting_queue)
             layers_downloaded = [l for l in migration["target"].container_layers if l.digest in image.layers_digests]
@@ -170,9 +208,9 @@ class Service(ComponentManager, Agent):
 
                 # Once all service layers have been pulled, creates a ContainerImage object representing
                 # the service image on the target host if that host didn't already have such image
-                if not any([image.digest == self.image_digest for image in migration["target"].container_images]):
-                    # Finding similar image provisioned on the infrastructure to get metadata from it when creating the new image
-                    template_image = ContainerImage.find_by(attribute_name="digest", attribute_value=self.image_digest)
+                if not migration["target"].container_images.has_digest(digest=self.image_digest):
+                    # Gathering the image metadata from the catalog of images to create the new image
+                    template_image = ContainerImage.get_metadata(digest=self.image_digest)
                     if template_image is None:
                         raise Exception(f"Could not find any container image with digest: {self.image_digest}")
 
@@ -199,8 +237,7 @@ class Service(ComponentManager, Agent):
                     self._available = False
 
                     # Selecting the path that will be used to transfer the service state
-                    path = nx.shortest_path(
-                        G=self.model.topology,
+                    path = self.model.topology.get_shortest_path(
                         source=self.server.base_station.network_switch,
                         target=migration["target"].base_station.network_switch,
                     )
@@ -249,6 +286,91 @@ class Service(ComponentManager, Agent):
                 for user in users:
                     user.set_communication_path(app)
 
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the service has events to process (i.e., changes in its migration status).
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the next event takes place.
+        """
+        if len(self._Service__migrations) > 0 and self._Service__migrations[-1]["end"] == None:
+            migration = self._Service__migrations[-1]
+
+            if migration["status"] == "finished":
+                return self.model.schedule.steps
+
+            # Gathering information about the service's image and the layers present in the target server
+            image = ContainerImage.get_metadata(digest=self.image_digest)
+            layers_downloaded = [l for l in migration["target"].container_layers if l.digest in image.layers_digests]
+            layers_on_download_queue = [
+                flow.metadata["object"]
+                for flow in migration["target"].download_queue
+                if flow.metadata["object"].digest in image.layers_digests
+            ]
+
+            if migration["status"] == "waiting" and len(layers_downloaded + layers_on_download_queue) > 0:
+                return self.model.schedule.steps
+
+            if migration["status"] == "pulling_layers" and len(image.layers_digests) == len(layers_downloaded):
+                return self.model.schedule.steps
+
+        return float("inf")
+
+    def fast_forward(self, steps: int):
+        """Updates the service's migration metadata as if it was activated during a given number of time steps without events.
+
+        Args:
+            steps (int): Number of time steps.
+        """
+        if len(self._Service__migrations) > 0 and self._Service__migrations[-1]["end"] == None:
+            migration = self._Service__migrations[-1]
+
+            # Incrementing the migration time metadata
+            if migration["status"] == "waiting":
+                migration["waiting_time"] += steps
+            elif migration["status"] == "pulling_layers":
+                migration["pulling_layers_time"] += steps
+            elif migration["status"] == "migrating_service_state":
+                migration["migrating_service_state_time"] += steps
+
+    def estimate_migration_time(self, target_server: object) -> float:
+        """Estimates how many time steps provisioning the service on a given edge server would take, without changing the simulation
+        state. The estimate considers the transfer of the layers the server does not have (pulled from the registries the server
+        would select and respecting its maximum number of concurrent layer downloads) followed by the transfer of the service state,
+        and the bandwidth these transfers would get given the currently active flows (see "Topology.estimate_flow_completion_times()").
+
+        Args:
+            target_server (object): Candidate target server.
+
+        Returns:
+            float: Estimated number of time steps (infinity if some layer is not available in any registry).
+        """
+        # Gathering the layers that would be pulled. Layers only start being pulled once a download slot is released
+        flows = []
+        download_slots = max(target_server.max_concurrent_layer_downloads - len(target_server.download_queue), 1)
+        for layer in target_server._get_uncached_layers(service=self):
+            registry, path = target_server._select_container_registry(layer=layer)
+            if registry is None:
+                return float("inf")
+
+            after = [len(flows) - download_slots] if len(flows) >= download_slots else []
+            flows.append({"path": path, "data_to_transfer": layer.size, "after": after})
+
+        # Stateful services have their states transferred once all layers are pulled
+        if self.state > 0 and self.server is not None and self.server != target_server:
+            flows.append(
+                {
+                    "source": self.server.base_station.network_switch,
+                    "target": target_server.base_station.network_switch,
+                    "data_to_transfer": self.state,
+                    "after": list(range(len(flows))),
+                }
+            )
+
+        if len(flows) == 0:
+            return 0
+
+        return max(self.model.topology.estimate_flow_completion_times(flows=flows))
+
     def provision(self, target_server: object):
         """Starts the service's provisioning process. This process comprises both placement and migration. In the former, the
         service is not initially hosted by any server within the infrastructure. In the latter, the service is already being
@@ -257,19 +379,13 @@ class Service(ComponentManager, Agent):
         Args:
             target_server (object): Target server.
         """
-        # Gathering layers present in the target server (layers, download_queue, waiting_queue)
-        layers_downloaded = [layer for layer in target_server.container_layers]
-        layers_on_download_queue = [flow.metadata["object"] for flow in target_server.download_queue]
-        layers_on_waiting_queue = [layer for layer in target_server.waiting_queue]
-
-        layers_on_target_server = layers_downloaded + layers_on_download_queue + layers_on_waiting_queue
-
-        # Gathering the list of layers that compose the service image that are not present in the target server
-        image = ContainerImage.find_by(attribute_name="digest", attribute_value=self.image_digest)
+        # Gathering the list of layers that compose the service image that are not present in the target server (layers,
+        # download_queue, waiting_queue)
+        image = ContainerImage.get_metadata(digest=self.image_digest)
         for layer_digest in image.layers_digests:
-            if not any(layer.digest == layer_digest for layer in layers_on_target_server):
+            if not target_server.has_layer(digest=layer_digest):
                 # As the image only stores its layers digests, we need to get information about each of its layers
-                layer_metadata = ContainerLayer.find_by(attribute_name="digest", attribute_value=layer_digest)
+                layer_metadata = ContainerLayer.get_metadata(digest=layer_digest)
 
                 # Creating a new layer object that will be pulled to the target server
                 layer = ContainerLayer(
@@ -311,3 +427,7 @@ class Service(ComponentManager, Agent):
                 "migrating_service_state_time": 0,
             }
         )
+
+        # Letting schedulers that only activate agents with events to process know that the service must be activated
+        if hasattr(self.model.schedule, "register_active_agent"):
+            self.model.schedule.register_active_agent(agent=self)
@@ -2,6 +2,8 @@
 # EdgeSimPy components
 from edge_sim_py.component_manager import ComponentManager
 from edge_sim_py.components.network_flow import NetworkFlow
+from edge_sim_py.components.flow_scheduling import max_min_fairness, equal_share, progressive_filling, estimate_completion_times
+from edge_sim_py.components.compiled_graph import CompiledGraph
 
 # Mesa modules
 from mesa import Agent
@@ -9,13 +11,26 @@ from mesa import Agent
 # Python libraries
 import networkx as nx
 
+SUPPORTED_GRAPH_BACKENDS = ["networkx", "compiled", "scipy", "auto"]
+SUPPORTED_FLOW_EVENTS = ["flow_started", "flow_finished", "demand_below_share"]
 
-class Topology(ComponentManager, nx.Graph, Agent):
-    """Class that represents a network topology."""
 
-    # Class attributes that allow this class to use helper methods from ComponentManager
-    _instances = []
-    _object_count = 0
+class Topology(ComponentManager, nx.Graph, Agent):
+    """Class that represents a network topology. Shortest paths and path delays are cached until the topology changes (i.e., links
+    are added or removed, or the "delay" or "active" attributes of links change). The container registries selected to pull layers
+    are also cached, until either the topology or the registries change.
+    """
+
+    # Maximum number of shortest paths kept in the cache (the cache is emptied once it reaches such size)
+    max_cached_routes = 100000
+
+    # Graph representation used to compute shortest paths. While "networkx" runs NetworkX's algorithms over the topology itself,
+    # "compiled" runs equivalent searches over a CompiledGraph object (CSR arrays kept in sync with the topology), which return the
+    # same paths as NetworkX. The "auto" option uses the compiled graph on topologies with at least "compiled_graph_min_nodes" nodes,
+    # falling back to NetworkX for path weights the compiled graph does not support. Finally, "scipy" runs SciPy's Dijkstra over the
+    # compiled graph (requires SciPy), which finds equally short paths but may break ties between them differently than NetworkX
+    graph_backend = "auto"
+    compiled_graph_min_nodes = 10000
 
     def __init__(self, obj_id: int = None, existing_graph: nx.Graph = None) -> object:
         """Creates a Topology object backed by NetworkX functionality.
@@ -36,6 +51,25 @@ class Topology(ComponentManager, nx.Graph, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
+        # Cached shortest paths (indexed by source, target, and weight) and path delays
+        self._routes = {}
+        self._path_delays = {}
+        self._compiled_graph = None
+
+        # Cached container registries (and paths) used to pull each layer to each network switch (indexed by layer digest and switch)
+        self._registry_routes = {}
+
+        # Links whose bandwidth shares must be recalculated (indexed by the flow event that affected them and by link ID), and
+        # finished flows waiting to be archived
+        self._dirty_links = {event: {} for event in SUPPORTED_FLOW_EVENTS}
+        self._finished_flows = {}
+
+        # Flows whose classes override the built-in activation procedure, which may not report their bandwidth events
+        self._custom_flows = {}
+
         # Initializing the NetworkX topology
         if existing_graph is None:
             nx.Graph.__init__(self)
@@ -55,9 +89,12 @@ class Topology(ComponentManager, nx.Graph, Agent):
         dictionary = {"attributes": {"id": self.id}}
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
@@ -66,8 +103,114 @@ class Topology(ComponentManager, nx.Graph, Agent):
 
     def step(self):
         """Method that executes the events involving the object at each time step."""
+        # Flows that override the built-in activation procedure may change their progress (or finish) without reporting it, so the
+        # links they use are recalculated at every time step (as if such flows had just started) until they finish
+        for flow in list(self._custom_flows):
+            if flow.status == "active":
+                self.mark_dirty_links(flow=flow, event="flow_started")
+            else:
+                del self._custom_flows[flow]
+                self.mark_dirty_links(flow=flow, event="flow_finished")
+
+        # The links used by finished flows are recalculated until the flows are archived
+        for flow in self._finished_flows:
+            self.mark_dirty_links(flow=flow, event="flow_finished")
+
+        # Built-in bandwidth sharing algorithms ignore the "flows" argument (they gather the links marked dirty instead), which is still
+        # passed to custom algorithms that rely on it
         self.model.network_flow_scheduling_algorithm(topology=self, flows=NetworkFlow.all())
 
+        # Archiving flows that finished in previous time steps, as the links they used have already been recalculated
+        finished_flows = [flow for flow in self._finished_flows if flow.end is not None and flow.end <= self.model.schedule.steps]
+        for flow in finished_flows:
+            del self._finished_flows[flow]
+            self.model.schedule.remove(flow)
+            NetworkFlow.archive(flow)
+
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the topology has events to process (i.e., changes in the bandwidth shares of flows).
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the next event takes place.
+        """
+        # Bandwidth shares are recalculated when flows start, finish, or have more bandwidth than needed, and finished flows are
+        # archived in the next time step
+        if len(self._finished_flows) > 0 or len(self._custom_flows) > 0 or any([len(links) > 0 for links in self._dirty_links.values()]):
+            return self.model.schedule.steps
+
+        if NetworkFlow.count() == 0:
+            return float("inf")
+
+        # Custom flow scheduling algorithms may update bandwidth shares at any time step
+        if self.model.network_flow_scheduling_algorithm not in [max_min_fairness, equal_share, progressive_filling]:
+            return self.model.schedule.steps
+
+        return float("inf")
+
+    def mark_dirty_links(self, flow: object, event: str):
+        """Marks the links used by a flow as dirty, so that their bandwidth shares are recalculated by the flow scheduling algorithm.
+
+        Args:
+            flow (object): Network flow affected by the event.
+            event (str): Flow event ("flow_started", "flow_finished", or "demand_below_share").
+        """
+        if event not in SUPPORTED_FLOW_EVENTS:
+            raise Exception(f"Unsupported flow event {event}. Supported events are {SUPPORTED_FLOW_EVENTS}.")
+
+        dirty_links = self._dirty_links[event]
+        for link in flow.links:
+            dirty_links[link["id"]] = link
+
+        # Flows that override the built-in activation procedure are tracked from their first event (i.e., their creation)
+        if type(flow).step is not NetworkFlow.step and flow.status == "active":
+            self._custom_flows[flow] = None
+
+        if event == "flow_finished" and flow.status == "finished":
+            self._finished_flows[flow] = None
+
+    def pop_dirty_links(self, events: list = SUPPORTED_FLOW_EVENTS) -> list:
+        """Gets the links marked as dirty due to a set of flow events. All dirty links are unmarked, including the ones marked due to
+        events that were not requested (i.e., events the flow scheduling algorithm does not react to).
+
+        Args:
+            events (list, optional): Flow events of interest. Defaults to SUPPORTED_FLOW_EVENTS.
+
+        Returns:
+            links (list): Dirty links (each link is included only once).
+        """
+        links = {}
+        for event in events:
+            links.update(self._dirty_links[event])
+
+        for dirty_links in self._dirty_links.values():
+            dirty_links.clear()
+
+        return list(links.values())
+
+    def estimate_flow_completion_times(self, flows: list, algorithm: object = None) -> list:
+        """Estimates how many time steps a set of hypothetical network flows would take to finish if they were created now, considering
+        the flows that are currently active and the bandwidth sharing policy of the simulation (see "estimate_completion_times()").
+        The simulation state is not changed.
+
+        Args:
+            flows (list): Hypothetical flows. Each flow is a dictionary with the "data_to_transfer" key and either the "path" key or the
+                "source" and "target" keys (network nodes connected by the shortest path). The optional "after" key lists the
+                indices of hypothetical flows that must finish before the flow starts.
+            algorithm (object, optional): Flow scheduling algorithm whose sharing policy is considered. Defaults to None (the
+                simulator's "network_flow_scheduling_algorithm" is used).
+
+        Returns:
+            list: Number of time steps each hypothetical flow would take to finish (infinity if it would never finish).
+        """
+        if algorithm is None:
+            algorithm = self.model.network_flow_scheduling_algorithm
+
+        flows = [
+            flow if "path" in flow else {**flow, "path": self.get_shortest_path(source=flow["source"], target=flow["target"])}
+            for flow in flows
+        ]
+        return estimate_completion_times(topology=self, flows=flows, algorithm=algorithm)
+
     def _remove_path_duplicates(self, path: list) -> list:
         """Removes side-by-side duplicated nodes on network paths to avoid NetworkX crashes.
 
@@ -94,12 +237,166 @@ class Topology(ComponentManager, nx.Graph, Agent):
         Returns:
             path_delay (int): Network path delay.
         """
-        path_delay = 0
+        key = tuple(path)
+        if key not in self._path_delays:
+            # Calculates the communication delay based on the delay property of each network link in the path
+            self._path_delays[key] = nx.classes.function.path_weight(G=self, path=path, weight="delay")
+
+        return self._path_delays[key]
+
+    def get_shortest_path(self, source: object, target: object, weight: str = None) -> list:
+        """Gets the shortest path between two network nodes. Paths are computed by NetworkX's "shortest_path()" function or by
+        the compiled graph (see the "graph_backend" attribute) and cached until the topology changes.
+
+        Args:
+            source (object): Node where the path starts.
+            target (object): Node where the path ends.
+            weight (str, optional): Link attribute used as the path weight. Defaults to None (all links have weight 1).
+
+        Returns:
+            list: Shortest path.
+        """
+        key = (source, target, weight)
+        if key not in self._routes:
+            if len(self._routes) >= self.max_cached_routes:
+                self._routes.clear()
+
+            if self._uses_compiled_graph(weight=weight):
+                self._routes[key] = self.get_compiled_graph().get_shortest_path(source=source, target=target, weight=weight)
+            else:
+                self._routes[key] = nx.shortest_path(G=self, source=source, target=target, weight=weight)
+
+        # Returning a copy of the cached path, as callers may modify it
+        return list(self._routes[key])
+
+    def get_path_delay(self, source: object, target: object, weight: str = "delay") -> int:
+        """Gets the communication delay of the shortest path between two network nodes.
+
+        Args:
+            source (object): Node where the path starts.
+            target (object): Node where the path ends.
+            weight (str, optional): Link attribute used to select the shortest path. Defaults to "delay".
+
+        Returns:
+            int: Shortest path delay.
+        """
+        return self.calculate_path_delay(path=self.get_shortest_path(source=source, target=target, weight=weight))
+
+    def get_compiled_graph(self) -> object:
+        """Gets the compiled representation of the topology, which is created once needed and discarded when the topology changes.
+
+        Returns:
+            object: CompiledGraph object.
+        """
+        solver = "scipy" if self.graph_backend == "scipy" else "python"
+        if self._compiled_graph is None or self._compiled_graph.solver != solver:
+            self._compiled_graph = CompiledGraph(graph=self, solver=solver)
+
+        return self._compiled_graph
+
+    def _uses_compiled_graph(self, weight: str = None) -> bool:
+        """Checks whether shortest paths are computed using the compiled representation of the topology.
+
+        Args:
+            weight (str, optional): Link attribute used as the path weight. Defaults to None (all links have weight 1).
+
+        Returns:
+            bool: Whether the compiled graph is used.
+        """
+        if self.graph_backend not in SUPPORTED_GRAPH_BACKENDS:
+            raise Exception(f"Unsupported graph backend {self.graph_backend}. Supported backends are {SUPPORTED_GRAPH_BACKENDS}.")
+
+        if self.graph_backend == "auto":
+            return len(self._adj) >= self.compiled_graph_min_nodes and weight in CompiledGraph.supported_weights
+
+        return self.graph_backend != "networkx"
+
+    def invalidate_routes(self):
+        """Discards the cached shortest paths, path delays, compiled graph, and registry selections (e.g., when links are added or
+        removed or have their delay changed).
+        """
+        self._routes.clear()
+        self._path_delays.clear()
+        self._compiled_graph = None
+        self._registry_routes.clear()
+
+    def invalidate_registry_routes(self, digest: str = None):
+        """Discards the cached container registries selected to pull layers (e.g., when registries are provisioned or deprovisioned,
+        or when layers are added to or removed from servers that host registries).
+
+        Args:
+            digest (str, optional): Digest of the layer whose selections are discarded. Defaults to None (all selections are discarded).
+        """
+        if digest is None:
+            self._registry_routes.clear()
+        else:
+            self._registry_routes.pop(digest, None)
+
+    def add_edge(self, u_of_edge: object, v_of_edge: object, **attr):
+        """Adds a link between two network nodes, discarding the cached shortest paths.
+
+        Args:
+            u_of_edge (object): First network node.
+            v_of_edge (object): Second network node.
+        """
+        nx.Graph.add_edge(self, u_of_edge, v_of_edge, **attr)
+        self.invalidate_routes()
+
+    def add_edges_from(self, ebunch_to_add: list, **attr):
+        """Adds a set of links, discarding the cached shortest paths.
+
+        Args:
+            ebunch_to_add (list): Links to be added.
+        """
+        nx.Graph.add_edges_from(self, ebunch_to_add, **attr)
+        self.invalidate_routes()
+
+    def remove_edge(self, u: object, v: object):
+        """Removes the link between two network nodes, discarding the cached shortest paths.
+
+        Args:
+            u (object): First network node.
+            v (object): Second network node.
+        """
+        nx.Graph.remove_edge(self, u, v)
+        self.invalidate_routes()
+
+    def remove_edges_from(self, ebunch: list):
+        """Removes a set of links, discarding the cached shortest paths.
+
+        Args:
+            ebunch (list): Links to be removed.
+        """
+        nx.Graph.remove_edges_from(self, ebunch)
+        self.invalidate_routes()
 
-        # Calculates the communication delay based on the delay property of each network link in the path
-        path_delay = nx.classes.function.path_weight(G=self, path=path, weight="delay")
+    def remove_node(self, n: object):
+        """Removes a network node and its links, discarding the cached shortest paths.
 
-        return path_delay
+        Args:
+            n (object): Network node to be removed.
+        """
+        nx.Graph.remove_node(self, n)
+        self.invalidate_routes()
+
+    def remove_nodes_from(self, nodes: list):
+        """Removes a set of network nodes and their links, discarding the cached shortest paths.
+
+        Args:
+            nodes (list): Network nodes to be removed.
+        """
+        nx.Graph.remove_nodes_from(self, nodes)
+        self.invalidate_routes()
+
+    def clear(self):
+        """Removes all network nodes and links, discarding the cached shortest paths."""
+        nx.Graph.clear(self)
+        self.invalidate_routes()
+
+    def clear_edges(self):
+        """Removes all links, discarding the cached shortest paths."""
+        nx.Graph.clear_edges(self)
+        self.invalidate_routes()
 
     def _allocate_communication_path(self, communication_path: list, app: object):
         """Adds the demand of a given application to a set of links that comprehend a communication path.
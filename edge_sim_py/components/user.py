@@ -10,15 +10,21 @@ from mesa import Agent
 
 # Python libraries
 import copy
-import networkx as nx
 
 
 class User(ComponentManager, Agent):
     """Class that represents an user."""
 
-    # Class attributes that allow this class to use helper methods from the ComponentManager
-    _instances = []
-    _object_count = 0
+    # Types of the metrics collected by the "collect()" method (used when metrics are stored in a columnar format)
+    metrics_schema = {
+        "Instance ID": "int",
+        "Coordinates": "list[number]",
+        "Base Station": "str",
+        "Delays": "object",
+        "Communication Paths": "object",
+        "Making Requests": "object",
+        "Access History": "object",
+    }
 
     def __init__(self, obj_id: int = None) -> object:
         """Creates an User object.
@@ -38,6 +44,9 @@ class User(ComponentManager, Agent):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
         # User coordinates
         self.coordinates_trace = []
         self.coordinates = None
@@ -97,51 +106,72 @@ class User(ComponentManager, Agent):
         }
         return dictionary
 
-    def collect(self) -> dict:
+    def collect(self, fields: list = None) -> dict:
         """Method that collects a set of metrics for the object.
 
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
+
         Returns:
             metrics (dict): Object metrics.
         """
-        access_history = {}
-        for app in self.applications:
-            access_history[str(app.id)] = self.access_patterns[str(app.id)].history
+        # Metrics are copied to keep collected records from changing, unless the simulator serializes them right away (metrics
+        # are always copied when recording changes, as they are compared against the values collected in the previous step)
+        copy_metrics = getattr(self.model, "metrics_format", "records") == "records" or getattr(self.model, "metrics_encoding", "full") == "delta"
+        snapshot = copy.deepcopy if copy_metrics else lambda value: value
 
         metrics = {
-            "Instance ID": self.id,
-            "Coordinates": self.coordinates,
-            "Base Station": f"{self.base_station} ({self.base_station.coordinates})" if self.base_station else None,
-            "Delays": copy.deepcopy(self.delays),
-            "Communication Paths": copy.deepcopy(self.communication_paths),
-            "Making Requests": copy.deepcopy(self.making_requests),
-            "Access History": copy.deepcopy(access_history),
+            "Instance ID": lambda: self.id,
+            "Coordinates": lambda: self.coordinates,
+            "Base Station": lambda: f"{self.base_station} ({self.base_station.coordinates})" if self.base_station else None,
+            "Delays": lambda: snapshot(self.delays),
+            "Communication Paths": lambda: snapshot(self.communication_paths),
+            "Making Requests": lambda: snapshot(self.making_requests),
+            "Access History": lambda: snapshot({str(app.id): self.access_patterns[str(app.id)].history for app in self.applications}),
         }
+
+        # Only the requested metrics are computed
+        metrics = {name: metric() for name, metric in metrics.items() if fields is None or name in fields}
         return metrics
 
+    def update_kpis(self, kpis: object):
+        """Reports the user's current state to the model-level metrics maintained incrementally by the simulator.
+
+        Args:
+            kpis (object): IncrementalMetrics object.
+        """
+        # Users whose delay is unknown (e.g., while their applications are not provisioned) are deemed as violating their SLAs
+        violating_sla = any(delay is None or delay > self.delay_slas[app_id] for app_id, delay in self.delays.items())
+        kpis.set_membership(name="Users in SLA Violation", obj=self, is_member=violating_sla)
+
+    def update_statistics(self, statistics: object):
+        """Updates the online statistics about the user's accesses (delays and SLA violations of the applications it is accessing).
+
+        Args:
+            statistics (object): OnlineStatistics object.
+        """
+        current_step = str(self.model.schedule.steps)
+        for app in self.applications:
+            if self.making_requests[str(app.id)].get(current_step, False):
+                delay = self.delays[str(app.id)]
+                statistics.increment(name="Requests", group=app.id)
+
+                # Requests whose delay is unknown (e.g., while the application is not provisioned) are deemed as SLA violations
+                if delay is None or delay > self.delay_slas[str(app.id)]:
+                    statistics.increment(name="SLA Violations", group=app.id)
+
+                if delay is not None and delay != float("inf"):
+                    statistics.update(name="User Delay", value=delay, group=app.id)
+
     def step(self):
         """Method that executes the events involving the object at each time step."""
         # Updating user access
         current_step = self.model.schedule.steps + 1
         for app in self.applications:
-            last_access = self.access_patterns[str(app.id)].history[-1]
-
-            # Updating user access waiting and access times. Waiting time represents the period in which the user is waiting for
-            # his application to be provisioned. Access time represents the period in which the user is successfully accessing
-            # his application, meaning his application is available. We assume that an application is only available when all its
-            # services are available.
-            if self.making_requests[str(app.id)][str(current_step)] == True:
-                if len([s for s in app.services if s._available]) == len(app.services):
-                    last_access["access_time"] += 1
-                else:
-                    last_access["waiting_time"] += 1
-
-            # Updating user's making requests attribute for the next time step
-            if current_step + 1 >= last_access["start"] and current_step + 1 <= last_access["end"]:
-                self.making_requests[str(app.id)][str(current_step + 1)] = True
-            else:
-                self.making_requests[str(app.id)][str(current_step + 1)] = False
+            self._update_access_window(app=app, current_step=current_step)
 
             # Creating new access request if needed
+            last_access = self.access_patterns[str(app.id)].history[-1]
             if current_step + 1 == last_access["next_access"]:
                 self.making_requests[str(app.id)][str(current_step + 1)] = True
                 self.access_patterns[str(app.id)].get_next_access(start=current_step + 1)
@@ -167,6 +197,68 @@ class User(ComponentManager, Agent):
                     self.communication_paths[str(application.id)] = []
                     self._compute_delay(app=application)
 
+    def _update_access_window(self, app: object, current_step: int):
+        """Updates the waiting or access time of the user's ongoing access to an application in a given time step, and whether the
+        user makes requests to the application in the following time step.
+
+        Args:
+            app (object): Application accessed by the user.
+            current_step (int): Time step being processed (i.e., "schedule.steps" + 1 while agents are activated).
+        """
+        last_access = self.access_patterns[str(app.id)].history[-1]
+        making_requests = self.making_requests[str(app.id)]
+
+        # Updating user access waiting and access times. Waiting time represents the period in which the user is waiting for
+        # his application to be provisioned. Access time represents the period in which the user is successfully accessing
+        # his application, meaning his application is available. We assume that an application is only available when all its
+        # services are available.
+        if making_requests[str(current_step)] == True:
+            if len([s for s in app.services if s._available]) == len(app.services):
+                last_access["access_time"] += 1
+            else:
+                last_access["waiting_time"] += 1
+
+        # Updating user's making requests attribute for the next time step
+        making_requests[str(current_step + 1)] = current_step + 1 >= last_access["start"] and current_step + 1 <= last_access["end"]
+
+    def get_next_event(self) -> int:
+        """Gets the next time step in which the user has events to process (i.e., new accesses and changes in its location).
+
+        Returns:
+            next_event (int): Value of "schedule.steps" when the user's "step()" method must run next.
+        """
+        current_step = self.model.schedule.steps
+
+        # The "step()" method processes time step "schedule.steps + 1" and creates a new access once the following time step reaches
+        # the next access of the user's current access pattern, i.e., when "schedule.steps + 2" equals the next access
+        next_event = float("inf")
+        for app in self.applications:
+            next_access = self.access_patterns[str(app.id)].history[-1]["next_access"]
+            next_event = min(next_event, next_access - 2)
+
+        # The user's mobility model is executed again once its mobility trace ends
+        next_event = min(next_event, len(self.coordinates_trace))
+
+        # Looking for the next change in the user's location
+        for step in range(current_step, min(next_event, len(self.coordinates_trace))):
+            if self.coordinates_trace[step] != self.coordinates:
+                next_event = step
+                break
+
+        return max(next_event, current_step)
+
+    def fast_forward(self, steps: int):
+        """Updates the user's access metadata as if it was activated during the last time steps (which had no events), catching up
+        with the simulation clock.
+
+        Args:
+            steps (int): Number of time steps.
+        """
+        # The clock has already been advanced, so the skipped steps were processed with "current_step" values up to "schedule.steps"
+        for app in self.applications:
+            for current_step in range(self.model.schedule.steps - steps + 1, self.model.schedule.steps + 1):
+                self._update_access_window(app=app, current_step=current_step)
+
     def _compute_delay(self, app: object, metric: str = "latency") -> int:
         """Computes the delay of an application accessed by the user.
 
@@ -198,6 +290,9 @@ class User(ComponentManager, Agent):
         # Updating application delay inside user's 'applications' attribute
         self.delays[str(app.id)] = delay
 
+        # Delays are modified in place, so changes must be reported to the model-level metrics explicitly
+        self._update_kpis()
+
         return delay
 
     def set_communication_path(self, app: object, communication_path: list = []) -> list:
@@ -237,13 +332,7 @@ class User(ComponentManager, Agent):
                 if origin == target:
                     path = []
                 else:
-                    path = nx.shortest_path(
-                        G=topology,
-                        source=origin.network_switch,
-                        target=target.network_switch,
-                        weight="delay",
-                        method="dijkstra",
-                    )
+                    path = topology.get_shortest_path(source=origin.network_switch, target=target.network_switch, weight="delay")
 
                 # Adding the best path found to the communication path
                 self.communication_paths[str(app.id)].append([network_switch.id for network_switch in path])
@@ -274,6 +363,7 @@ class User(ComponentManager, Agent):
         # Assigning delay and delay SLA attributes. Delay is initially None, and must be overwritten by the service placement
         self.delay_slas[str(app.id)] = delay_sla
         self.delays[str(app.id)] = None
+        self._update_kpis()
 
     def _set_initial_position(self, coordinates: list, number_of_replicates: int = 0) -> object:
         """Defines the initial coordinates for the user, automatically connecting to a base station in that position.
@@ -9,10 +9,6 @@ import random
 class RandomDurationAndIntervalAccessPattern(ComponentManager):
     """Class responsible for simulating random access patterns functionality."""
 
-    # Class attributes that allow this class to use helper methods from ComponentManager
-    _instances = []
-    _object_count = 0
-
     def __init__(
         self,
         obj_id: int = None,
@@ -44,6 +40,9 @@ class RandomDurationAndIntervalAccessPattern(ComponentManager):
             obj_id = self.__class__._object_count
         self.id = obj_id
 
+        # Indexing the object by its ID to speed up lookups
+        self.__class__._instances_by_id.setdefault(obj_id, self)
+
         # Information about the user to whom the access pattern belongs to
         self.user = user if user else None
         self.app = app if app else None
@@ -0,0 +1,10 @@
+"""Automatic Python configuration file."""
+__version__ = "1.1.0"
+
+# Storage of simulation metrics
+from .metrics_table import MetricsTable
+from .metrics_writer import MetricsWriter, BackgroundMetricsWriter, read_metrics, read_metrics_chunks
+from .metrics_reader import MetricsReader
+from .delta_encoding import DeltaEncoder, reconstruct_records
+from .incremental_metrics import IncrementalMetrics
+from .online_statistics import OnlineStatistics, QuantileSketch, RunningStatistics
@@ -0,0 +1,161 @@
+""" Contains the functionality used to store metrics as changes between consecutive records."""
+# Operations used to describe incremental changes to metrics
+SET = "set"
+EXTEND = "extend"
+
+
+class DeltaEncoder:
+    """Class that converts the records collected from each object into change-only records. Each object periodically emits a
+    keyframe (i.e., a full record marked with "Keyframe": True). In the remaining records, only the metrics whose values changed
+    since the previous record of the object are kept (alongside the "Object" and "Time Step" fields).
+
+    Metrics that grow over time (e.g., dictionaries that gain new keys and lists that gain new items) are not repeated. Instead,
+    their changes are stored inside the "Patches" field as [path, operation, value] lists, where "path" lists the dictionary
+    keys and list indexes leading to the changed value and "operation" is either "set" (the value is replaced) or "extend"
+    (items are appended).
+    """
+
+    def __init__(self, keyframe_interval: int = 100) -> object:
+        """Creates a DeltaEncoder object.
+
+        Args:
+            keyframe_interval (int, optional): Number of time steps between the keyframes of each object. Defaults to 100.
+
+        Returns:
+            object: Created DeltaEncoder object.
+        """
+        if keyframe_interval < 1:
+            raise Exception("Keyframe interval must be greater than zero.")
+
+        self.keyframe_interval = keyframe_interval
+
+        # Last metrics and the time step of the last keyframe of each object
+        self.last_metrics = {}
+        self.last_keyframes = {}
+
+    def encode(self, record: dict) -> dict:
+        """Converts a record into a change-only record. Records must be encoded in the order they were collected.
+
+        Args:
+            record (dict): Full record, including the "Object" and "Time Step" fields.
+
+        Returns:
+            encoded_record (dict): Keyframe or change-only record.
+        """
+        name = record["Object"]
+        step = record["Time Step"]
+        metrics = {key: value for key, value in record.items() if key != "Object" and key != "Time Step"}
+
+        # Emitting a keyframe for new objects and for objects whose last keyframe is too old
+        if name not in self.last_keyframes or step - self.last_keyframes[name] >= self.keyframe_interval:
+            self.last_metrics[name] = metrics
+            self.last_keyframes[name] = step
+            return {**record, **{"Keyframe": True}}
+
+        # Keeping only the metrics that changed since the previous record of the object
+        last_metrics = self.last_metrics[name]
+        encoded_record = {"Object": name, "Time Step": step}
+        patches = {}
+        for key, value in metrics.items():
+            if key not in last_metrics:
+                encoded_record[key] = value
+            elif last_metrics[key] != value:
+                changes = []
+                get_changes(old_value=last_metrics[key], new_value=value, path=[], changes=changes)
+
+                # Values that were entirely replaced are stored as they are
+                if len(changes) == 1 and changes[0][0] == [] and changes[0][1] == SET:
+                    encoded_record[key] = value
+                else:
+                    patches[key] = changes
+
+        if len(patches) > 0:
+            encoded_record["Patches"] = patches
+
+        self.last_metrics[name] = metrics
+
+        return encoded_record
+
+
+def get_changes(old_value: object, new_value: object, path: list, changes: list):
+    """Describes the changes between two values as a list of [path, operation, value] lists.
+
+    Args:
+        old_value (object): Previous value.
+        new_value (object): Current value.
+        path (list): Dictionary keys and list indexes leading to the compared values.
+        changes (list): List where the changes are appended.
+    """
+    if type(old_value) is dict and type(new_value) is dict and old_value.keys() <= new_value.keys():
+        for key, value in new_value.items():
+            if key not in old_value:
+                changes.append([path + [key], SET, value])
+            elif old_value[key] != value:
+                get_changes(old_value=old_value[key], new_value=value, path=path + [key], changes=changes)
+
+    elif type(old_value) is list and type(new_value) is list and len(new_value) >= len(old_value):
+        for index, value in enumerate(old_value):
+            if new_value[index] != value:
+                get_changes(old_value=value, new_value=new_value[index], path=path + [index], changes=changes)
+
+        if len(new_value) > len(old_value):
+            changes.append([path, EXTEND, new_value[len(old_value) :]])
+
+    else:
+        changes.append([path, SET, new_value])
+
+
+def apply_change(value: object, path: list, operation: str, change: object) -> object:
+    """Applies a change described by the "get_changes()" function. The given value is not modified, as the containers along
+    the path are copied before being changed.
+
+    Args:
+        value (object): Value to be changed.
+        path (list): Dictionary keys and list indexes leading to the changed value.
+        operation (str): Change operation ("set" or "extend").
+        change (object): New value (or items appended to the value when using the "extend" operation).
+
+    Returns:
+        object: Changed value.
+    """
+    if len(path) == 0:
+        return value + change if operation == EXTEND else change
+
+    if type(value) is dict:
+        changed_value = dict(value)
+        changed_value[path[0]] = apply_change(value=value.get(path[0]), path=path[1:], operation=operation, change=change)
+    else:
+        changed_value = list(value)
+        changed_value[path[0]] = apply_change(value=value[path[0]], path=path[1:], operation=operation, change=change)
+
+    return changed_value
+
+
+def reconstruct_records(records: object):
+    """Iterates over the full records encoded by a DeltaEncoder object. Records of an object that precede its first keyframe
+    (e.g., when reading from the middle of a log) are skipped.
+
+    Args:
+        records (object): Encoded records in the order they were collected (e.g., a list of records or the "read_metrics()" output).
+
+    Yields:
+        dict: Full record.
+    """
+    last_metrics = {}
+
+    for record in records:
+        name = record["Object"]
+
+        if record.get("Keyframe", False):
+            last_metrics[name] = {key: value for key, value in record.items() if key != "Keyframe"}
+        elif name in last_metrics:
+            metrics = {**last_metrics[name], **{key: value for key, value in record.items() if key != "Patches"}}
+            for key, changes in record.get("Patches", {}).items():
+                for path, operation, change in changes:
+                    metrics[key] = apply_change(value=metrics[key], path=path, operation=operation, change=change)
+
+            last_metrics[name] = metrics
+        else:
+            continue
+
+        yield dict(last_metrics[name])
@@ -0,0 +1,110 @@
+""" Contains the functionality used to maintain model-level metrics incrementally as the state of components changes."""
+# Python libraries
+from typing import Callable
+
+
+class IncrementalMetrics:
+    """Class that maintains model-level metrics (e.g., total power consumption and number of active flows) incrementally.
+    Components report their contribution to each metric whenever their state changes, so reading a metric does not require
+    iterating over all components. Two kinds of metrics are supported:
+        - Counts: number of objects that satisfy a condition (e.g., flows whose status is "active").
+        - Sums: sum of a value computed for each object (e.g., power consumption). Values can be reported right away or marked as
+            outdated, in which case they are only recomputed when the metric is read.
+    """
+
+    def __init__(self) -> object:
+        """Creates an IncrementalMetrics object.
+
+        Returns:
+            object: Created IncrementalMetrics object.
+        """
+        # Objects that satisfy the condition of each count metric
+        self.members = {}
+
+        # Values of each object, current total, and objects whose values must be recomputed, for each sum metric
+        self.values = {}
+        self.sums = {}
+        self.outdated_values = {}
+
+    def set_membership(self, name: str, obj: object, is_member: bool):
+        """Reports whether an object satisfies the condition of a count metric.
+
+        Args:
+            name (str): Metric name (e.g., "Active Flows").
+            obj (object): Object whose state changed.
+            is_member (bool): Whether the object satisfies the condition of the metric.
+        """
+        members = self.members.setdefault(name, set())
+        if is_member:
+            members.add(obj)
+        else:
+            members.discard(obj)
+
+    def set_value(self, name: str, obj: object, value: float):
+        """Reports the value of an object for a sum metric.
+
+        Args:
+            name (str): Metric name (e.g., "Power Consumption").
+            obj (object): Object whose state changed.
+            value (float): Object value (None values are not added to the metric).
+        """
+        values = self.values.setdefault(name, {})
+        self.outdated_values.get(name, {}).pop(obj, None)
+
+        value = value if value is not None else 0
+        self.sums[name] = self.sums.get(name, 0) + value - values.get(obj, 0)
+        values[obj] = value
+
+    def invalidate_value(self, name: str, obj: object, get_value: Callable):
+        """Marks the value of an object for a sum metric as outdated. The value is recomputed once the metric is read, which
+        avoids recomputing it multiple times when the object state changes several times within the same time step.
+
+        Args:
+            name (str): Metric name (e.g., "Power Consumption").
+            obj (object): Object whose state changed.
+            get_value (Callable): Function that computes the object value.
+        """
+        self.outdated_values.setdefault(name, {})[obj] = get_value
+
+    def remove(self, obj: object):
+        """Removes an object from all metrics.
+
+        Args:
+            obj (object): Object to be removed.
+        """
+        for members in self.members.values():
+            members.discard(obj)
+
+        for name, values in self.values.items():
+            if obj in values:
+                self.sums[name] -= values.pop(obj)
+
+        for outdated_values in self.outdated_values.values():
+            outdated_values.pop(obj, None)
+
+    def get_count(self, name: str) -> int:
+        """Gets the value of a count metric.
+
+        Args:
+            name (str): Metric name.
+
+        Returns:
+            int: Number of objects that satisfy the condition of the metric.
+        """
+        return len(self.members.get(name, ()))
+
+    def get_sum(self, name: str) -> float:
+        """Gets the value of a sum metric, recomputing the values marked as outdated.
+
+        Args:
+            name (str): Metric name.
+
+        Returns:
+            float: Sum of the values of the objects.
+        """
+        outdated_values = self.outdated_values.get(name, {})
+        while len(outdated_values) > 0:
+            obj, get_value = outdated_values.popitem()
+            self.set_value(name=name, obj=obj, value=get_value())
+
+        return self.sums.get(name, 0)
@@ -0,0 +1,229 @@
+""" Contains the functionality used to lazily read the metrics files written during the simulation."""
+# EdgeSimPy components
+from edge_sim_py.monitoring.metrics_writer import get_metrics_file_path, get_index_file_path
+
+# Python libraries
+import os
+import bisect
+import msgpack
+import numpy as np
+
+
+class MetricsReader:
+    """Class that streams the records of a given metrics group (e.g., "User") from the disk, one record at a time, so that logs
+    larger than the available memory can be processed. Records can be filtered by time step, object, and field. Reading a time
+    range from the middle of a log is sped up by an optional sidecar index (created with the "build_index()" method) that stores
+    where each chunk of records starts and which time steps it covers.
+    """
+
+    def __init__(self, logs_directory: str = "logs", name: str = "") -> object:
+        """Creates a MetricsReader object.
+
+        Args:
+            logs_directory (str, optional): Directory where metrics files are stored. Defaults to "logs".
+            name (str, optional): Metrics group name (e.g., "User"). Defaults to "".
+
+        Returns:
+            object: Created MetricsReader object.
+        """
+        self.logs_directory = logs_directory
+        self.name = name
+
+        # Sidecar index of the metrics files (or None if there is no index or it does not match the files anymore)
+        self.index = self._load_index()
+
+    def records(self, start_step: int = None, end_step: int = None, objects: list = None, fields: list = None):
+        """Iterates over the records that match the given filters, in the order they were written.
+
+        Args:
+            start_step (int, optional): First time step to be read. Defaults to None (records are read from the beginning).
+            end_step (int, optional): Last time step to be read. Defaults to None (records are read until the end).
+            objects (list, optional): Names of the objects to be read (e.g., ["User_1"]). Defaults to None (all objects are read).
+            fields (list, optional): Names of the fields kept in each record (e.g., ["Time Step", "Coordinates"]). Defaults to None
+                (all fields are kept). Delta-encoded records must be read without field filters to be reconstructed afterwards.
+
+        Yields:
+            dict: Record.
+        """
+        objects = set(objects) if objects is not None else None
+
+        for record in self._iterate_records(start_step=start_step):
+            # Records are written in chronological order, so there is no need to keep reading after the last time step
+            if end_step is not None and record["Time Step"] > end_step:
+                return
+
+            if start_step is not None and record["Time Step"] < start_step:
+                continue
+            if objects is not None and record["Object"] not in objects:
+                continue
+
+            if fields is not None:
+                record = {field: record[field] for field in fields if field in record}
+
+            yield record
+
+    def columns(
+        self,
+        start_step: int = None,
+        end_step: int = None,
+        objects: list = None,
+        fields: list = None,
+        batch_size: int = 10000,
+        as_numpy: bool = True,
+    ):
+        """Iterates over batches of records that match the given filters, with each batch arranged as columns (i.e., a dictionary
+        that maps each field to its values). Batches can be converted into DataFrames (e.g., "pandas.DataFrame(batch)").
+
+        Args:
+            start_step (int, optional): First time step to be read. Defaults to None (records are read from the beginning).
+            end_step (int, optional): Last time step to be read. Defaults to None (records are read until the end).
+            objects (list, optional): Names of the objects to be read (e.g., ["User_1"]). Defaults to None (all objects are read).
+            fields (list, optional): Names of the fields to be read. Defaults to None (all fields are read).
+            batch_size (int, optional): Maximum number of records in each batch. Defaults to 10000.
+            as_numpy (bool, optional): Whether columns are NumPy arrays (or lists). Defaults to True.
+
+        Yields:
+            dict: Batch of records arranged as columns. Fields missing from some of the records are filled with None.
+        """
+        batch = []
+        for record in self.records(start_step=start_step, end_step=end_step, objects=objects, fields=fields):
+            batch.append(record)
+
+            if len(batch) == batch_size:
+                yield get_columns(records=batch, fields=fields, as_numpy=as_numpy)
+                batch = []
+
+        if len(batch) > 0:
+            yield get_columns(records=batch, fields=fields, as_numpy=as_numpy)
+
+    def build_index(self) -> dict:
+        """Creates the sidecar index of the metrics files, which lists the position and the time steps covered by each chunk.
+
+        Returns:
+            index (dict): Created index.
+        """
+        index = {"files": [], "chunks": []}
+
+        file_index = 0
+        while os.path.exists(get_metrics_file_path(logs_directory=self.logs_directory, name=self.name, file_index=file_index)):
+            file_path = get_metrics_file_path(logs_directory=self.logs_directory, name=self.name, file_index=file_index)
+            index["files"].append(os.path.getsize(file_path))
+
+            with open(file_path, "rb") as input_file:
+                unpacker = msgpack.Unpacker(input_file, strict_map_key=False)
+                while True:
+                    offset = unpacker.tell()
+                    try:
+                        chunk_size = unpacker.read_array_header()
+                    except msgpack.OutOfData:
+                        break
+
+                    steps = [unpacker.unpack()["Time Step"] for _ in range(chunk_size)]
+                    if chunk_size > 0:
+                        index["chunks"].append([file_index, offset, steps[0], steps[-1]])
+
+            file_index += 1
+
+        with open(get_index_file_path(logs_directory=self.logs_directory, name=self.name), "wb") as output_file:
+            output_file.write(msgpack.packb(index))
+
+        self.index = index
+
+        return index
+
+    def _load_index(self) -> dict:
+        """Loads the sidecar index of the metrics files.
+
+        Returns:
+            index (dict): Loaded index (or None if there is no index or the files changed after the index was created).
+        """
+        index_path = get_index_file_path(logs_directory=self.logs_directory, name=self.name)
+        if not os.path.exists(index_path):
+            return None
+
+        with open(index_path, "rb") as input_file:
+            index = msgpack.unpackb(input_file.read(), strict_map_key=False)
+
+        # Discarding indexes that do not match the files (e.g., when more chunks were written after the index was created)
+        for file_index, file_size in enumerate(index["files"] + [None]):
+            file_path = get_metrics_file_path(logs_directory=self.logs_directory, name=self.name, file_index=file_index)
+            current_size = os.path.getsize(file_path) if os.path.exists(file_path) else None
+            if current_size != file_size:
+                return None
+
+        return index
+
+    def _iterate_records(self, start_step: int = None):
+        """Iterates over the records written to the metrics files, starting from the chunk that contains a given time step
+        when there is an index available.
+
+        Args:
+            start_step (int, optional): First time step to be read. Defaults to None (records are read from the beginning).
+
+        Yields:
+            dict: Record.
+        """
+        first_file_index, first_offset = 0, 0
+
+        # Finding the first chunk that contains records from the given time step
+        if start_step is not None and self.index is not None:
+            chunks = self.index["chunks"]
+            position = bisect.bisect_left(chunks, start_step, key=lambda chunk: chunk[3])
+            if position == len(chunks):
+                return
+
+            first_file_index, first_offset = chunks[position][0], chunks[position][1]
+
+        file_index = first_file_index
+        while os.path.exists(get_metrics_file_path(logs_directory=self.logs_directory, name=self.name, file_index=file_index)):
+            file_path = get_metrics_file_path(logs_directory=self.logs_directory, name=self.name, file_index=file_index)
+            with open(file_path, "rb") as input_file:
+                if file_index == first_file_index:
+                    input_file.seek(first_offset)
+
+                # Unpacking one record at a time rather than whole chunks to keep memory usage low
+                unpacker = msgpack.Unpacker(input_file, strict_map_key=False)
+                while True:
+                    try:
+                        chunk_size = unpacker.read_array_header()
+                    except msgpack.OutOfData:
+                        break
+
+                    for _ in range(chunk_size):
+                        yield unpacker.unpack()
+
+            file_index += 1
+
+
+def get_columns(records: list, fields: list = None, as_numpy: bool = True) -> dict:
+    """Arranges a list of records as columns.
+
+    Args:
+        records (list): List of records.
+        fields (list, optional): Names of the fields to be arranged as columns. Defaults to None (all fields found in the records).
+        as_numpy (bool, optional): Whether columns are NumPy arrays (or lists). Defaults to True.
+
+    Returns:
+        columns (dict): Dictionary that maps each field to its values.
+    """
+    if fields is None:
+        fields = list({field: None for record in records for field in record})
+
+    columns = {}
+    for field in fields:
+        values = [record.get(field) for record in records]
+
+        # Values that NumPy cannot arrange as a one-dimensional array (e.g., lists and None) are kept as Python objects
+        if as_numpy:
+            value_types = {type(value) for value in values}
+            if value_types <= {int, float} or value_types == {bool} or value_types == {str}:
+                values = np.array(values)
+            else:
+                array = np.empty(len(values), dtype=object)
+                for position, value in enumerate(values):
+                    array[position] = value
+                values = array
+
+        columns[field] = values
+
+    return columns
@@ -0,0 +1,507 @@
+""" Contains the columnar storage used to keep the metrics collected during the simulation in memory."""
+# Python libraries
+import copy
+import msgpack
+import numpy as np
+
+# Types of the values stored inside scalar columns and their NumPy representation
+SCALAR_TYPES = {
+    "int": np.int64,
+    "float": np.float64,
+    "number": np.float64,
+    "bool": np.bool_,
+    "str": np.int32,
+}
+
+# Marker of records that lack a given metric
+_MISSING = object()
+
+
+class _ChunkedArray:
+    """Growable typed array that stores its values inside preallocated NumPy chunks."""
+
+    def __init__(self, dtype: type, chunk_size: int):
+        """Creates a _ChunkedArray object.
+
+        Args:
+            dtype (type): NumPy data type of the array values.
+            chunk_size (int): Number of values stored inside each chunk.
+        """
+        self.dtype = dtype
+        self.chunk_size = chunk_size
+        self.chunks = []
+        self.length = 0
+
+    def __len__(self) -> int:
+        """Returns the number of values stored inside the array.
+
+        Returns:
+            int: Number of values.
+        """
+        return self.length
+
+    def append(self, value: object):
+        """Appends a value to the array, preallocating a new chunk when the current one is full.
+
+        Args:
+            value (object): Value to be appended.
+        """
+        position = self.length % self.chunk_size
+        if position == 0:
+            self.chunks.append(np.empty(self.chunk_size, dtype=self.dtype))
+
+        self.chunks[-1][position] = value
+        self.length += 1
+
+    def get(self, index: int) -> object:
+        """Gets the value stored at a given position of the array.
+
+        Args:
+            index (int): Position of the value.
+
+        Returns:
+            object: Stored value.
+        """
+        return self.chunks[index // self.chunk_size][index % self.chunk_size]
+
+    def to_numpy(self) -> np.ndarray:
+        """Gathers the values stored inside the array into a single NumPy array.
+
+        Returns:
+            np.ndarray: Stored values.
+        """
+        if self.length == 0:
+            return np.empty(0, dtype=self.dtype)
+
+        return np.concatenate(self.chunks)[: self.length]
+
+
+class _ScalarColumn:
+    """Column that stores scalar values (numbers, booleans, and strings) inside typed arrays. Strings are dictionary-encoded,
+    and values that do not match the column type (e.g., None) are kept aside as exceptions.
+    """
+
+    def __init__(self, value_type: str, chunk_size: int):
+        """Creates a _ScalarColumn object.
+
+        Args:
+            value_type (str): Type of the column values ("int", "float", "number", "bool", or "str").
+            chunk_size (int): Number of values stored inside each chunk.
+        """
+        self.value_type = value_type
+        self.values = _ChunkedArray(dtype=SCALAR_TYPES[value_type], chunk_size=chunk_size)
+        self.exceptions = {}
+
+        # Numbers are stored as floats along with a flag that tells whether they were originally integers
+        self.integral = _ChunkedArray(dtype=np.bool_, chunk_size=chunk_size) if value_type == "number" else None
+
+        # Dictionary used to encode strings
+        self.categories = []
+        self.category_codes = {}
+
+    def __len__(self) -> int:
+        """Returns the number of values stored inside the column.
+
+        Returns:
+            int: Number of values.
+        """
+        return len(self.values)
+
+    def append(self, value: object):
+        """Appends a value to the column.
+
+        Args:
+            value (object): Value to be appended.
+        """
+        value_type = type(value)
+
+        if self.value_type == "int" and value_type is int and -(2**63) <= value < 2**63:
+            self.values.append(value)
+
+        elif self.value_type == "float" and value_type is float:
+            self.values.append(value)
+
+        elif self.value_type == "number" and (value_type is float or value_type is int and -(2**53) <= value <= 2**53):
+            self.values.append(value)
+            self.integral.append(value_type is int)
+
+        elif self.value_type == "bool" and value_type is bool:
+            self.values.append(value)
+
+        elif self.value_type == "str" and value_type is str:
+            code = self.category_codes.get(value)
+            if code is None:
+                code = len(self.categories)
+                self.category_codes[value] = code
+                self.categories.append(value)
+
+            self.values.append(code)
+
+        else:
+            # Values that do not match the column type are copied so that they are not affected by later changes
+            self.exceptions[len(self.values)] = value if value is None or value is _MISSING else copy.deepcopy(value)
+            self.values.append(0)
+            if self.integral is not None:
+                self.integral.append(False)
+
+    def get(self, index: int) -> object:
+        """Gets the value stored at a given position of the column.
+
+        Args:
+            index (int): Position of the value.
+
+        Returns:
+            object: Stored value.
+        """
+        if index in self.exceptions:
+            return self.exceptions[index]
+
+        value = self.values.get(index)
+
+        if self.value_type == "str":
+            return self.categories[value]
+        elif self.value_type == "number" and self.integral.get(index):
+            return int(value)
+
+        return value.item()
+
+    def to_numpy(self) -> np.ndarray:
+        """Gathers the column values into a NumPy array. Values that do not match the type of numeric columns are represented as
+        NaN, whereas the other columns fall back to arrays of objects in such case.
+
+        Returns:
+            np.ndarray: Column values.
+        """
+        if self.value_type == "str":
+            return np.array([self.get(index) for index in range(len(self))], dtype=object)
+
+        values = self.values.to_numpy()
+        if len(self.exceptions) > 0:
+            if self.value_type in ["float", "number"]:
+                values[list(self.exceptions.keys())] = np.nan
+            else:
+                values = np.array([self.get(index) for index in range(len(self))], dtype=object)
+
+        return values
+
+
+class _SequenceColumn:
+    """Column that stores variable-length sequences (lists or tuples) of scalar values. The items of all sequences are stored
+    inside a single scalar column, and an array of offsets tells where each sequence ends.
+    """
+
+    def __init__(self, sequence_type: type, item_type: str, chunk_size: int):
+        """Creates a _SequenceColumn object.
+
+        Args:
+            sequence_type (type): Type of the sequences (list or tuple).
+            item_type (str): Type of the sequence items ("int", "float", "number", "bool", or "str").
+            chunk_size (int): Number of values stored inside each chunk.
+        """
+        self.sequence_type = sequence_type
+        self.items = _ScalarColumn(value_type=item_type, chunk_size=chunk_size)
+        self.offsets = _ChunkedArray(dtype=np.int64, chunk_size=chunk_size)
+        self.exceptions = {}
+
+    def __len__(self) -> int:
+        """Returns the number of sequences stored inside the column.
+
+        Returns:
+            int: Number of sequences.
+        """
+        return len(self.offsets)
+
+    def append(self, value: object):
+        """Appends a sequence to the column.
+
+        Args:
+            value (object): Sequence to be appended.
+        """
+        if type(value) is self.sequence_type:
+            for item in value:
+                self.items.append(item)
+        else:
+            self.exceptions[len(self.offsets)] = value if value is None or value is _MISSING else copy.deepcopy(value)
+
+        self.offsets.append(len(self.items))
+
+    def get(self, index: int) -> object:
+        """Gets the sequence stored at a given position of the column.
+
+        Args:
+            index (int): Position of the sequence.
+
+        Returns:
+            object: Stored sequence.
+        """
+        if index in self.exceptions:
+            return self.exceptions[index]
+
+        start = self.offsets.get(index - 1) if index > 0 else 0
+        end = self.offsets.get(index)
+
+        return self.sequence_type(self.items.get(position) for position in range(start, end))
+
+    def to_numpy(self) -> np.ndarray:
+        """Gathers the column values into a NumPy array of objects.
+
+        Returns:
+            np.ndarray: Column values.
+        """
+        values = np.empty(len(self), dtype=object)
+        for index in range(len(self)):
+            values[index] = self.get(index)
+
+        return values
+
+
+class _ObjectColumn:
+    """Column that stores arbitrary values (e.g., dictionaries) serialized with MessagePack. The serialized values are
+    concatenated into a single buffer, and an array of offsets tells where each value ends.
+    """
+
+    def __init__(self, chunk_size: int):
+        """Creates an _ObjectColumn object.
+
+        Args:
+            chunk_size (int): Number of values stored inside each chunk.
+        """
+        self.buffer = bytearray()
+        self.offsets = _ChunkedArray(dtype=np.int64, chunk_size=chunk_size)
+        self.exceptions = {}
+
+    def __len__(self) -> int:
+        """Returns the number of values stored inside the column.
+
+        Returns:
+            int: Number of values.
+        """
+        return len(self.offsets)
+
+    def append(self, value: object):
+        """Appends a value to the column.
+
+        Args:
+            value (object): Value to be appended.
+        """
+        if value is _MISSING:
+            self.exceptions[len(self.offsets)] = value
+        else:
+            try:
+                self.buffer += msgpack.packb(value)
+            except TypeError:
+                # Values that cannot be serialized are copied so that they are not affected by later changes
+                self.exceptions[len(self.offsets)] = copy.deepcopy(value)
+
+        self.offsets.append(len(self.buffer))
+
+    def get(self, index: int) -> object:
+        """Gets the value stored at a given position of the column.
+
+        Args:
+            index (int): Position of the value.
+
+        Returns:
+            object: Stored value.
+        """
+        if index in self.exceptions:
+            return self.exceptions[index]
+
+        start = self.offsets.get(index - 1) if index > 0 else 0
+        end = self.offsets.get(index)
+
+        return msgpack.unpackb(self.buffer[start:end], strict_map_key=False)
+
+    def to_numpy(self) -> np.ndarray:
+        """Gathers the column values into a NumPy array of objects.
+
+        Returns:
+            np.ndarray: Column values.
+        """
+        values = np.empty(len(self), dtype=object)
+        for index in range(len(self)):
+            values[index] = self.get(index)
+
+        return values
+
+
+class MetricsTable:
+    """Class that stores the metrics collected from the objects of a given class in a columnar format. Each metric is stored in
+    a separate column whose type is defined by a schema (e.g., {"Instance ID": "int", "Coordinates": "tuple[int]"}). Supported
+    types are "int", "float", "number" (integers or floats), "bool", "str", sequences of such types (e.g., "list[int]"), and
+    "object" (any value that can be serialized with MessagePack). Metrics not described by the schema are stored as "object".
+
+    Tables behave like lists of records (i.e., dictionaries), which keeps them compatible with code written for such format.
+    """
+
+    def __init__(self, schema: dict = {}, chunk_size: int = 1024) -> object:
+        """Creates a MetricsTable object.
+
+        Args:
+            schema (dict, optional): Types of the metrics stored in the table. Defaults to {}.
+            chunk_size (int, optional): Number of values stored inside each chunk of the table's typed arrays. Defaults to 1024.
+
+        Returns:
+            object: Created MetricsTable object.
+        """
+        self.schema = schema
+        self.chunk_size = chunk_size
+
+        # Table columns and the row from which each of them starts
+        self.columns = {}
+        self.first_rows = {}
+
+        # Number of records stored in the table
+        self.length = 0
+
+    def __len__(self) -> int:
+        """Returns the number of records stored in the table.
+
+        Returns:
+            int: Number of records.
+        """
+        return self.length
+
+    def __iter__(self):
+        """Iterates over the records stored in the table.
+
+        Yields:
+            dict: Record.
+        """
+        for index in range(self.length):
+            yield self._get_record(index)
+
+    def __getitem__(self, index: object) -> object:
+        """Gets one or more records stored in the table.
+
+        Args:
+            index (object): Record position (int) or range of positions (slice).
+
+        Returns:
+            object: Record (dict) or list of records.
+        """
+        if type(index) is slice:
+            return [self._get_record(position) for position in range(*index.indices(self.length))]
+
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError("MetricsTable index out of range.")
+
+        return self._get_record(index)
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the table with another table or with a list of records.
+
+        Args:
+            other (object): Object to be compared.
+
+        Returns:
+            bool: Comparison result.
+        """
+        if isinstance(other, (MetricsTable, list)):
+            return len(self) == len(other) and all(record == other_record for record, other_record in zip(self, other))
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Defines how the object is represented inside the console.
+
+        Returns:
+            str: Object representation.
+        """
+        return f"MetricsTable(records={self.length}, columns={list(self.columns.keys())})"
+
+    def _create_column(self, column_type: str) -> object:
+        """Creates a column of a given type.
+
+        Args:
+            column_type (str): Column type.
+
+        Returns:
+            object: Created column.
+        """
+        if column_type in SCALAR_TYPES:
+            return _ScalarColumn(value_type=column_type, chunk_size=self.chunk_size)
+
+        for sequence_type in [list, tuple]:
+            prefix = f"{sequence_type.__name__}["
+            if column_type.startswith(prefix) and column_type.endswith("]") and column_type[len(prefix) : -1] in SCALAR_TYPES:
+                return _SequenceColumn(sequence_type=sequence_type, item_type=column_type[len(prefix) : -1], chunk_size=self.chunk_size)
+
+        if column_type == "object":
+            return _ObjectColumn(chunk_size=self.chunk_size)
+
+        raise Exception(f"Unsupported metric type '{column_type}'.")
+
+    def append(self, record: dict):
+        """Appends a record to the table.
+
+        Args:
+            record (dict): Record to be appended.
+        """
+        for name, value in record.items():
+            column = self.columns.get(name)
+
+            # Creating columns for metrics that had not been collected before
+            if column is None:
+                column = self._create_column(column_type=self.schema.get(name, "object"))
+                self.columns[name] = column
+                self.first_rows[name] = self.length
+
+            column.append(value)
+
+        self.length += 1
+
+        # Padding the columns of metrics that are not part of the record
+        if len(record) < len(self.columns):
+            for name, column in self.columns.items():
+                if len(column) + self.first_rows[name] < self.length:
+                    column.append(_MISSING)
+
+    def _get_record(self, index: int) -> dict:
+        """Rebuilds the record stored at a given position of the table.
+
+        Args:
+            index (int): Record position.
+
+        Returns:
+            record (dict): Record.
+        """
+        record = {}
+        for name, column in self.columns.items():
+            if index >= self.first_rows[name]:
+                value = column.get(index - self.first_rows[name])
+                if value is not _MISSING:
+                    record[name] = value
+
+        return record
+
+    def column(self, name: str) -> np.ndarray:
+        """Gets the values of a given metric as a NumPy array. Records that lack the metric are represented as None.
+
+        Args:
+            name (str): Metric name.
+
+        Returns:
+            np.ndarray: Metric values.
+        """
+        column = self.columns[name]
+        values = column.to_numpy()
+
+        # Making sure all records are represented inside the array
+        first_row = self.first_rows[name]
+        if first_row > 0 or any(value is _MISSING for value in column.exceptions.values()):
+            values = values.astype(object)
+            values[[position for position, value in column.exceptions.items() if value is _MISSING]] = None
+            values = np.concatenate([np.full(first_row, None, dtype=object), values])
+
+        return values
+
+    def to_records(self) -> list:
+        """Converts the table into a list of records.
+
+        Returns:
+            list: Records stored in the table.
+        """
+        return list(self)
@@ -0,0 +1,254 @@
+""" Contains the functionality used to stream simulation metrics to the disk."""
+# Python libraries
+import os
+import queue
+import atexit
+import msgpack
+import threading
+
+
+class MetricsWriter:
+    """Class that streams metrics to append-only MessagePack files. Each call to the "write()" method appends a chunk (i.e., a
+    MessagePack-encoded list of records) to the file of a given metrics group (e.g., "User" metrics are written to "User.msgpack").
+    Optionally, files are rotated once they reach a maximum size, in which case chunks are written to numbered files (e.g.,
+    "User.1.msgpack", "User.2.msgpack", and so on).
+    """
+
+    def __init__(self, logs_directory: str = "logs", max_file_size: int = None) -> object:
+        """Creates a MetricsWriter object.
+
+        Args:
+            logs_directory (str, optional): Directory where metrics files are stored. Defaults to "logs".
+            max_file_size (int, optional): Maximum size of each file in bytes. Defaults to None (files are not rotated).
+
+        Returns:
+            object: Created MetricsWriter object.
+        """
+        self.logs_directory = logs_directory
+        self.max_file_size = max_file_size
+
+        # Open files and the index of the file currently used by each metrics group
+        self.files = {}
+        self.file_indexes = {}
+
+    def write(self, name: str, records: list):
+        """Appends a chunk of records to the file of a given metrics group and flushes it to the disk.
+
+        Args:
+            name (str): Metrics group name (e.g., "User").
+            records (list): Records to be written (any sequence of records, such as MetricsTable objects, is accepted).
+        """
+        chunk = msgpack.packb(records if type(records) is list else list(records))
+
+        # Files of metrics groups that were not written by this object yet are replaced, as they belong to previous executions
+        if name not in self.file_indexes:
+            self._remove_files(name=name)
+            self._open_file(name=name, file_index=0)
+
+        # Rotating the file in case the chunk would make it exceed the maximum file size
+        output_file = self.files.get(name)
+        if output_file is None:
+            output_file = self._open_file(name=name, file_index=self.file_indexes[name])
+        elif self.max_file_size is not None and output_file.tell() > 0 and output_file.tell() + len(chunk) > self.max_file_size:
+            output_file.close()
+            output_file = self._open_file(name=name, file_index=self.file_indexes[name] + 1)
+
+        output_file.write(chunk)
+        output_file.flush()
+
+    def flush(self):
+        """Flushes the chunks written so far to the disk."""
+        for output_file in self.files.values():
+            output_file.flush()
+
+    def close(self):
+        """Closes the open files. Files are reopened in append mode if further chunks are written."""
+        for output_file in self.files.values():
+            output_file.close()
+
+        self.files = {}
+
+    def _open_file(self, name: str, file_index: int) -> object:
+        """Opens the file of a given metrics group.
+
+        Args:
+            name (str): Metrics group name.
+            file_index (int): Index of the file (files are rotated when they reach the maximum file size).
+
+        Returns:
+            output_file (object): Open file.
+        """
+        if not os.path.exists(f"{self.logs_directory}/"):
+            os.makedirs(f"{self.logs_directory}")
+
+        output_file = open(get_metrics_file_path(logs_directory=self.logs_directory, name=name, file_index=file_index), "ab")
+
+        self.files[name] = output_file
+        self.file_indexes[name] = file_index
+
+        return output_file
+
+    def _remove_files(self, name: str):
+        """Removes the files of a given metrics group.
+
+        Args:
+            name (str): Metrics group name.
+        """
+        file_index = 0
+        while os.path.exists(get_metrics_file_path(logs_directory=self.logs_directory, name=name, file_index=file_index)):
+            os.remove(get_metrics_file_path(logs_directory=self.logs_directory, name=name, file_index=file_index))
+            file_index += 1
+
+        # Removing the sidecar index of the files (if any), as it no longer matches them
+        if os.path.exists(get_index_file_path(logs_directory=self.logs_directory, name=name)):
+            os.remove(get_index_file_path(logs_directory=self.logs_directory, name=name))
+
+
+class BackgroundMetricsWriter(MetricsWriter):
+    """Class that serializes and writes chunks of metrics in a background thread. Chunks are handed to the thread through a
+    bounded queue, so the simulation waits for the thread (rather than piling up chunks in memory) whenever it falls behind.
+    """
+
+    def __init__(self, logs_directory: str = "logs", max_file_size: int = None, max_queue_size: int = 16) -> object:
+        """Creates a BackgroundMetricsWriter object.
+
+        Args:
+            logs_directory (str, optional): Directory where metrics files are stored. Defaults to "logs".
+            max_file_size (int, optional): Maximum size of each file in bytes. Defaults to None (files are not rotated).
+            max_queue_size (int, optional): Maximum number of chunks waiting to be written. Defaults to 16.
+
+        Returns:
+            object: Created BackgroundMetricsWriter object.
+        """
+        MetricsWriter.__init__(self, logs_directory=logs_directory, max_file_size=max_file_size)
+
+        # Queue of chunks waiting to be written and the thread that writes them (started once the first chunk is written)
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.thread = None
+
+        # Exception raised by the background thread, which is reported back to the simulation
+        self.error = None
+
+    def write(self, name: str, records: list):
+        """Schedules a chunk of records to be appended to the file of a given metrics group. The records must not be modified
+        after this call, as they are serialized in the background.
+
+        Args:
+            name (str): Metrics group name (e.g., "User").
+            records (list): Records to be written (any sequence of records, such as MetricsTable objects, is accepted).
+        """
+        self._raise_error()
+
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._write_chunks, name="EdgeSimPyMetricsWriter", daemon=True)
+            self.thread.start()
+
+            # Making sure pending chunks are written if the interpreter exits before the writer is closed
+            atexit.register(self.close)
+
+        self.queue.put((name, records))
+
+    def flush(self):
+        """Waits until the chunks scheduled so far are written to the disk."""
+        if self.thread is not None:
+            self.queue.join()
+
+        self._raise_error()
+
+    def close(self):
+        """Writes the pending chunks, stops the background thread, and closes the open files."""
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+            atexit.unregister(self.close)
+
+        MetricsWriter.close(self)
+        self._raise_error()
+
+    def _write_chunks(self):
+        """Writes the chunks scheduled by the simulation until the writer is closed."""
+        while True:
+            item = self.queue.get()
+
+            try:
+                if item is None:
+                    return
+
+                if self.error is None:
+                    MetricsWriter.write(self, name=item[0], records=item[1])
+            except Exception as exception:
+                self.error = exception
+            finally:
+                self.queue.task_done()
+
+    def _raise_error(self):
+        """Raises the exception that interrupted the background thread (if any)."""
+        if self.error is not None:
+            error = self.error
+            self.error = None
+            raise error
+
+
+def get_metrics_file_path(logs_directory: str, name: str, file_index: int = 0) -> str:
+    """Gets the path of a metrics file.
+
+    Args:
+        logs_directory (str): Directory where metrics files are stored.
+        name (str): Metrics group name (e.g., "User").
+        file_index (int, optional): Index of the file (files are rotated when they reach a maximum size). Defaults to 0.
+
+    Returns:
+        str: Metrics file path.
+    """
+    if file_index == 0:
+        return f"{logs_directory}/{name}.msgpack"
+
+    return f"{logs_directory}/{name}.{file_index}.msgpack"
+
+
+def get_index_file_path(logs_directory: str, name: str) -> str:
+    """Gets the path of the sidecar index of the files of a given metrics group.
+
+    Args:
+        logs_directory (str): Directory where metrics files are stored.
+        name (str): Metrics group name (e.g., "User").
+
+    Returns:
+        str: Index file path.
+    """
+    return f"{logs_directory}/{name}.index.msgpack"
+
+
+def read_metrics_chunks(logs_directory: str, name: str):
+    """Iterates over the chunks of records written to the files of a given metrics group, in the order they were written.
+
+    Args:
+        logs_directory (str): Directory where metrics files are stored.
+        name (str): Metrics group name (e.g., "User").
+
+    Yields:
+        list: Chunk of records.
+    """
+    file_index = 0
+    while os.path.exists(get_metrics_file_path(logs_directory=logs_directory, name=name, file_index=file_index)):
+        with open(get_metrics_file_path(logs_directory=logs_directory, name=name, file_index=file_index), "rb") as input_file:
+            for chunk in msgpack.Unpacker(input_file, strict_map_key=False):
+                yield chunk
+
+        file_index += 1
+
+
+def read_metrics(logs_directory: str, name: str):
+    """Iterates over the records written to the files of a given metrics group, in the order they were written.
+
+    Args:
+        logs_directory (str): Directory where metrics files are stored.
+        name (str): Metrics group name (e.g., "User").
+
+    Yields:
+        dict: Record.
+    """
+    for chunk in read_metrics_chunks(logs_directory=logs_directory, name=name):
+        for record in chunk:
+            yield record
@@ -0,0 +1,284 @@
+""" Contains the functionality used to summarize simulation metrics on the fly (i.e., without storing every collected value)."""
+# Python libraries
+import math
+
+
+class RunningStatistics:
+    """Class that keeps the count, mean, variance, minimum, and maximum of a stream of values (using Welford's algorithm)."""
+
+    def __init__(self) -> object:
+        """Creates a RunningStatistics object.
+
+        Returns:
+            object: Created RunningStatistics object.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.sum_of_squared_differences = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def update(self, value: float):
+        """Adds a value to the stream.
+
+        Args:
+            value (float): New value.
+        """
+        self.count += 1
+        difference = value - self.mean
+        self.mean += difference / self.count
+        self.sum_of_squared_differences += difference * (value - self.mean)
+
+        self.minimum = value if self.minimum is None or value < self.minimum else self.minimum
+        self.maximum = value if self.maximum is None or value > self.maximum else self.maximum
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the values added to the stream.
+
+        Returns:
+            float: Sample variance (or 0 if less than two values were added).
+        """
+        return self.sum_of_squared_differences / (self.count - 1) if self.count > 1 else 0.0
+
+
+class QuantileSketch:
+    """Class that estimates quantiles of a stream of values using logarithmic buckets (as in DDSketch). Quantile estimates have a
+    bounded relative error, and memory usage is capped by merging the buckets of the smallest values once the maximum number of
+    buckets is reached.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> object:
+        """Creates a QuantileSketch object.
+
+        Args:
+            relative_accuracy (float, optional): Maximum relative error of the quantile estimates. Defaults to 0.01.
+            max_buckets (int, optional): Maximum number of buckets kept for positive (and for negative) values. Defaults to 2048.
+
+        Returns:
+            object: Created QuantileSketch object.
+        """
+        if relative_accuracy <= 0 or relative_accuracy >= 1:
+            raise Exception("Relative accuracy must be between zero and one.")
+
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+
+        # Number of values inside each bucket. Positive and negative values are kept in separate buckets indexed by their magnitude
+        self.positive_buckets = {}
+        self.negative_buckets = {}
+        self.zero_count = 0
+        self.count = 0
+
+        # Extreme values, used to bound the quantile estimates
+        self.minimum = None
+        self.maximum = None
+
+    def update(self, value: float):
+        """Adds a value to the stream.
+
+        Args:
+            value (float): New value.
+        """
+        self.count += 1
+        self.minimum = value if self.minimum is None or value < self.minimum else self.minimum
+        self.maximum = value if self.maximum is None or value > self.maximum else self.maximum
+
+        if value == 0:
+            self.zero_count += 1
+            return
+
+        buckets = self.positive_buckets if value > 0 else self.negative_buckets
+        bucket = math.ceil(math.log(abs(value)) / self.log_gamma)
+        buckets[bucket] = buckets.get(bucket, 0) + 1
+
+        # Merging the buckets of the values with the smallest magnitudes once the sketch gets too large
+        if len(buckets) > self.max_buckets:
+            smallest_buckets = sorted(buckets)[:2]
+            buckets[smallest_buckets[1]] += buckets.pop(smallest_buckets[0])
+
+    def get_quantile(self, quantile: float) -> float:
+        """Estimates a quantile of the values added to the stream.
+
+        Args:
+            quantile (float): Quantile between 0 and 1 (e.g., 0.95).
+
+        Returns:
+            float: Quantile estimate (or None if no values were added).
+        """
+        if self.count == 0:
+            return None
+
+        rank = quantile * (self.count - 1)
+
+        # Going through the buckets from the smallest to the largest value until the one that contains the given rank is found
+        accumulated_count = 0
+        value = None
+        for bucket in sorted(self.negative_buckets, reverse=True):
+            accumulated_count += self.negative_buckets[bucket]
+            if accumulated_count > rank:
+                value = -self._get_bucket_value(bucket=bucket)
+                break
+
+        if value is None:
+            accumulated_count += self.zero_count
+            if accumulated_count > rank:
+                value = 0
+
+        if value is None:
+            for bucket in sorted(self.positive_buckets):
+                accumulated_count += self.positive_buckets[bucket]
+                if accumulated_count > rank:
+                    value = self._get_bucket_value(bucket=bucket)
+                    break
+
+        if value is None:
+            value = self.maximum
+
+        return min(max(value, self.minimum), self.maximum)
+
+    def _get_bucket_value(self, bucket: int) -> float:
+        """Gets the value that represents a given bucket.
+
+        Args:
+            bucket (int): Bucket index.
+
+        Returns:
+            float: Representative value of the bucket magnitude.
+        """
+        return 2 * self.gamma**bucket / (self.gamma + 1)
+
+
+class OnlineStatistics:
+    """Class that summarizes simulation metrics on the fly. Each metric is identified by a name and an optional group (e.g., the
+    "User Delay" metric grouped by application ID), and is summarized by its count, mean, variance, extreme values, and quantile
+    estimates. Counters (e.g., number of SLA violations) are kept separately. Statistics can be queried at any time, including
+    by the resource management algorithm in the middle of the simulation.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> object:
+        """Creates an OnlineStatistics object.
+
+        Args:
+            relative_accuracy (float, optional): Maximum relative error of the quantile estimates. Defaults to 0.01.
+            max_buckets (int, optional): Maximum number of buckets of each quantile sketch. Defaults to 2048.
+
+        Returns:
+            object: Created OnlineStatistics object.
+        """
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+
+        # Statistics and quantile sketches of each metric, and counters, indexed by (name, group)
+        self.metrics = {}
+        self.counters = {}
+
+    def update(self, name: str, value: float, group: object = None):
+        """Adds a value to a metric.
+
+        Args:
+            name (str): Metric name (e.g., "User Delay").
+            value (float): New value.
+            group (object, optional): Metric group (e.g., an application ID). Defaults to None.
+        """
+        if (name, group) not in self.metrics:
+            self.metrics[(name, group)] = (
+                RunningStatistics(),
+                QuantileSketch(relative_accuracy=self.relative_accuracy, max_buckets=self.max_buckets),
+            )
+
+        statistics, sketch = self.metrics[(name, group)]
+        statistics.update(value=value)
+        sketch.update(value=value)
+
+    def increment(self, name: str, group: object = None, amount: int = 1):
+        """Increments a counter.
+
+        Args:
+            name (str): Counter name (e.g., "SLA Violations").
+            group (object, optional): Counter group (e.g., an application ID). Defaults to None.
+            amount (int, optional): Increment. Defaults to 1.
+        """
+        self.counters[(name, group)] = self.counters.get((name, group), 0) + amount
+
+    def get_counter(self, name: str, group: object = None) -> int:
+        """Gets the value of a counter.
+
+        Args:
+            name (str): Counter name.
+            group (object, optional): Counter group. Defaults to None.
+
+        Returns:
+            int: Counter value (0 if the counter was never incremented).
+        """
+        return self.counters.get((name, group), 0)
+
+    def get_quantile(self, name: str, quantile: float, group: object = None) -> float:
+        """Estimates a quantile of a metric.
+
+        Args:
+            name (str): Metric name.
+            quantile (float): Quantile between 0 and 1 (e.g., 0.95).
+            group (object, optional): Metric group. Defaults to None.
+
+        Returns:
+            float: Quantile estimate (or None if the metric has no values).
+        """
+        if (name, group) not in self.metrics:
+            return None
+
+        return self.metrics[(name, group)][1].get_quantile(quantile=quantile)
+
+    def get_summary(self, name: str, group: object = None, quantiles: list = [0.5, 0.95, 0.99]) -> dict:
+        """Summarizes the values of a metric.
+
+        Args:
+            name (str): Metric name.
+            group (object, optional): Metric group. Defaults to None.
+            quantiles (list, optional): Quantiles to be estimated. Defaults to [0.5, 0.95, 0.99].
+
+        Returns:
+            summary (dict): Metric summary (or None if the metric has no values).
+        """
+        if (name, group) not in self.metrics:
+            return None
+
+        statistics, sketch = self.metrics[(name, group)]
+        summary = {
+            "Count": statistics.count,
+            "Mean": statistics.mean,
+            "Variance": statistics.variance,
+            "Standard Deviation": math.sqrt(statistics.variance),
+            "Minimum": statistics.minimum,
+            "Maximum": statistics.maximum,
+        }
+        for quantile in quantiles:
+            summary[f"P{quantile * 100:g}"] = sketch.get_quantile(quantile=quantile)
+
+        return summary
+
+    def get_groups(self, name: str) -> list:
+        """Gets the groups of a metric or counter.
+
+        Args:
+            name (str): Metric or counter name.
+
+        Returns:
+            list: Groups of the metric or counter.
+        """
+        return list({group: None for (metric_name, group) in list(self.metrics) + list(self.counters) if metric_name == name})
+
+    def to_dict(self) -> dict:
+        """Summarizes all metrics and counters.
+
+        Returns:
+            dictionary (dict): Summaries of metrics and values of counters, indexed by name and group.
+        """
+        dictionary = {}
+        for name, group in self.metrics:
+            dictionary.setdefault(name, {})[group] = self.get_summary(name=name, group=group)
+        for name, group in self.counters:
+            dictionary.setdefault(name, {})[group] = self.counters[(name, group)]
+
+        return dictionary
@@ -0,0 +1,114 @@
+""" Contains functionality for running multiple replicates of a simulation in parallel."""
+# EdgeSimPy components
+from edge_sim_py.simulator import Simulator
+
+# Python libraries
+import os
+import time
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+# Serialized dataset and simulator configuration shared by the replicates executed by each worker process
+_worker_configuration = {}
+
+
+def run_replicates(
+    dataset: object,
+    simulator_kwargs: dict,
+    seeds: list,
+    workers: int = None,
+    summary_function: Callable = None,
+) -> list:
+    """Executes one simulation replicate per seed in a pool of worker processes. The dataset is parsed only once, and each
+    replicate stores its logs inside a dedicated subdirectory of the "logs_directory" passed within "simulator_kwargs".
+
+    The "random" module is seeded at the beginning of each replicate, which covers the built-in activation schedulers, mobility
+    models and access patterns. Please notice that the "simulator_kwargs" values (e.g., the stopping criterion and the resource
+    management algorithm) must be picklable if the platform does not use the "fork" start method to create processes.
+
+    Args:
+        dataset (object): Dataset file (URL for external JSON file, path for local JSON file, Python dictionary).
+        simulator_kwargs (dict): Arguments passed to the constructor of the Simulator object of each replicate.
+        seeds (list): Seeds used by the replicates (one replicate is executed per seed).
+        workers (int, optional): Number of worker processes (at least 1). Defaults to None (number of processors in the machine).
+        summary_function (Callable, optional): Function that receives the simulator once a replicate ends and returns a
+            dictionary with custom metrics that are added to the replicate summary. Defaults to None.
+
+    Returns:
+        summaries (list): Replicate summaries, sorted in the same order as the "seeds" list.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if type(workers) is not int or workers < 1:
+        raise Exception(f"Invalid number of workers {workers}. Please use a positive integer (or None to use all processors).")
+
+    # Parsing the dataset once. Each replicate gets its own copy of the dataset through this serialized representation
+    serialized_dataset = pickle.dumps(Simulator.load_dataset(input_file=dataset), protocol=pickle.HIGHEST_PROTOCOL)
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(seeds)) if len(seeds) > 0 else 1,
+        initializer=_initialize_worker,
+        initargs=(serialized_dataset, simulator_kwargs, summary_function),
+    ) as executor:
+        summaries = list(executor.map(_run_replicate, range(len(seeds)), seeds))
+
+    return summaries
+
+
+def _initialize_worker(serialized_dataset: bytes, simulator_kwargs: dict, summary_function: Callable):
+    """Stores the configuration shared by the replicates executed by a worker process.
+
+    Args:
+        serialized_dataset (bytes): Serialized dataset.
+        simulator_kwargs (dict): Arguments passed to the constructor of the Simulator object of each replicate.
+        summary_function (Callable): Function that gathers custom metrics once a replicate ends.
+    """
+    _worker_configuration["serialized_dataset"] = serialized_dataset
+    _worker_configuration["simulator_kwargs"] = simulator_kwargs
+    _worker_configuration["summary_function"] = summary_function
+
+
+def _run_replicate(replicate: int, seed: int) -> dict:
+    """Executes a simulation replicate.
+
+    Args:
+        replicate (int): Replicate index.
+        seed (int): Seed used by the replicate.
+
+    Returns:
+        summary (dict): Replicate summary.
+    """
+    simulator_kwargs = dict(_worker_configuration["simulator_kwargs"])
+    summary_function = _worker_configuration["summary_function"]
+
+    # Isolating the logs of each replicate inside a dedicated directory
+    logs_directory = simulator_kwargs.get("logs_directory", "logs")
+    simulator_kwargs["logs_directory"] = f"{logs_directory}/replicate_{replicate}"
+
+    # Seeding the random number generators used throughout the simulation
+    random.seed(seed)
+
+    simulator = Simulator(**simulator_kwargs)
+    simulator.reset_randomizer(seed=seed)
+    simulator.initialize(input_file=pickle.loads(_worker_configuration["serialized_dataset"]))
+
+    start_time = time.perf_counter()
+    simulator.run_model()
+    execution_time = time.perf_counter() - start_time
+
+    summary = {
+        "replicate": replicate,
+        "seed": seed,
+        "logs_directory": simulator.logs_directory,
+        "steps": simulator.schedule.steps,
+        "execution_time": execution_time,
+        "metrics": simulator.collect(),
+    }
+
+    if summary_function is not None:
+        summary["metrics"].update(summary_function(simulator))
+
+    return summary
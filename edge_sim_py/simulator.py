@@ -1,8 +1,9 @@
 """ Contains all the simulation management functionality."""
 # EdgeSimPy components
-from edge_sim_py.component_manager import ComponentManager
+from edge_sim_py.component_manager import ComponentManager, _adopt_unscoped_registries, _process_registries_lock
 from edge_sim_py.components import *
 from edge_sim_py.activation_schedulers import *
+from edge_sim_py.monitoring import MetricsTable, MetricsWriter, BackgroundMetricsWriter, DeltaEncoder, OnlineStatistics, IncrementalMetrics
 
 # Mesa modules
 from mesa import Model, Agent
@@ -10,27 +11,40 @@ from mesa import Model, Agent
 # Python libraries
 import os
 import json
-import msgpack
+import inspect
 from typing import Callable
 from datetime import timedelta
 from urllib.parse import urlparse
 from urllib.request import urlopen
 
 SUPPORTED_TIME_UNITS = ["seconds", "microseconds", "milliseconds", "minutes"]
+SUPPORTED_TIME_ADVANCE_MECHANISMS = ["fixed_increment", "next_event"]
+SUPPORTED_METRICS_FORMATS = ["records", "columnar"]
+SUPPORTED_METRICS_ENCODINGS = ["full", "delta"]
+SUPPORTED_DUMP_MODES = ["background", "synchronous"]
+SUPPORTED_MONITORING_OPTIONS = ["enabled", "interval", "fields"]
+SUPPORTED_FLOW_STORAGES = ["objects", "table"]
 
 
 class Simulator(ComponentManager, Model):
     """Class responsible for managing the simulation."""
 
-    # Class attributes that allow this class to use helper methods from ComponentManager
-    _instances = []
-    _object_count = 0
+    # Simulators are stored in a registry shared by the whole process instead of the registries of the active simulator
+    _process_wide_registry = True
+
+    # Types of the metrics collected by the "collect()" method (used when metrics are stored in a columnar format)
+    metrics_schema = {
+        "Power Consumption": "number",
+        "Active Flows": "int",
+        "Ongoing Migrations": "int",
+        "Users in SLA Violation": "int",
+    }
 
     def __init__(
         self,
         stopping_criterion: Callable = None,
         resource_management_algorithm: Callable = None,
-        resource_management_algorithm_parameters: dict = {},
+        resource_management_algorithm_parameters: dict = None,
         user_defined_functions: list = [],
         network_flow_scheduling_algorithm: Callable = max_min_fairness,
         tick_duration: int = 1,
@@ -39,6 +53,15 @@ class Simulator(ComponentManager, Model):
         scheduler: Callable = DefaultScheduler,
         dump_interval: int = 100,
         logs_directory: str = "logs",
+        time_advance: str = "fixed_increment",
+        metrics_format: str = "records",
+        max_log_file_size: int = None,
+        dump_mode: str = "background",
+        monitoring: dict = None,
+        metrics_encoding: str = "full",
+        keyframe_interval: int = 100,
+        collect_statistics: bool = False,
+        flow_storage: str = "objects",
     ) -> object:
         """Creates a Simulator object.
 
@@ -47,20 +70,65 @@ class Simulator(ComponentManager, Model):
             resource_management_algorithm (Callable, optional): Main resource management algorithm executed at each step of the simulation. Defaults to None.
             resource_management_algorithm_parameters (dict, optional): User-defined parameters. Defaults to {}.
             user_defined_functions (list, optional): List of user-defined functions.
-            network_flow_scheduling_algorithm (Callable, optional): Bandwidth sharing algorithm. Defaults to equal_share.
+            network_flow_scheduling_algorithm (Callable, optional): Bandwidth sharing algorithm (e.g., equal_share, max_min_fairness, or
+                progressive_filling), called with the "topology" and "flows" arguments at each time step. Built-in algorithms ignore
+                "flows" and only recalculate the shares of links marked dirty in the topology. Defaults to max_min_fairness.
             obj_id (int, optional): Object identifier. Defaults to None.
             scheduler (Callable, optional): Agent activation scheduler regime.
             dump_interval (int, optional): Interval (in time steps) between each time EdgeSimPy dumps simulation data to disk.
             logs_directory (str, optional): Name of the directory where the simulation logs will be stored.
+            time_advance (str, optional): Time advance mechanism. While "fixed_increment" executes every time step, "next_event"
+                fast-forwards the time steps in which no agent has events to process (see the "skip_idle_steps()" method). Skipped
+                steps are still monitored, but the resource management algorithm does not run on them, so algorithms have to declare
+                the steps they act on with the "schedule_wake_up()" method (algorithms that never declare any step are executed at
+                every time step, just as with "fixed_increment"). Defaults to "fixed_increment".
+            metrics_format (str, optional): Format in which agent metrics are kept in memory. While "records" stores a dictionary
+                per agent at each time step, "columnar" stores metrics inside typed arrays (MetricsTable objects that can still be
+                read as lists of records). Defaults to "records".
+            max_log_file_size (int, optional): Maximum size (in bytes) of each metrics file. Once a file reaches such size, metrics
+                are written to a new file. Defaults to None (files are not rotated).
+            dump_mode (str, optional): Whether metrics are serialized and written to the disk by a background thread ("background")
+                or by the simulation loop itself ("synchronous"). Defaults to "background".
+            monitoring (dict, optional): Monitoring settings of each agent class, indexed by class name. Each class accepts the
+                "enabled" (whether its agents are monitored), "interval" (number of time steps between each collection), and
+                "fields" (names of the collected metrics) options, e.g., {"EdgeServer": {"interval": 60, "fields": ["Power
+                Consumption"]}, "NetworkLink": {"enabled": False}}. Defaults to None (all metrics are collected at every step).
+            metrics_encoding (str, optional): Whether agents emit full records ("full") or, apart from periodic keyframes, records
+                with only the metrics that changed since their previous record ("delta"). Full records can be rebuilt from delta
+                records with the "reconstruct_records()" function. Defaults to "full".
+            keyframe_interval (int, optional): Number of time steps between the keyframes of each agent when using the "delta"
+                metrics encoding. Defaults to 100.
+            collect_statistics (bool, optional): Whether online statistics (e.g., user delays per application, SLA violations, server
+                utilization, and migration durations) are updated as agents are monitored. Statistics are available through the
+                "statistics" attribute (an OnlineStatistics object) at any time. Defaults to False.
+            flow_storage (str, optional): Where the remaining data and bandwidth shares of active network flows are stored. While
+                "objects" keeps them inside each NetworkFlow object, "table" keeps them inside NumPy arrays (a FlowTable object) so
+                that the DefaultScheduler updates the progress of flows and the bandwidth demand of links in batches. Defaults to
+                "objects".
 
         Returns:
             object: Created Simulator object.
         """
-        # Object identifier
-        self.__class__._object_count += 1
-        if obj_id is None:
-            obj_id = self.__class__._object_count
-        self.id = obj_id
+        # Object identifier. Simulators are registered process-wide (rather than inside the registries of the active simulator) so
+        # that simulators created in sequence (or in separate threads) get distinct IDs and are all listed by "Simulator.all()"
+        with _process_registries_lock:
+            self.__class__._object_count += 1
+            if obj_id is None:
+                obj_id = self.__class__._object_count
+            self.id = obj_id
+
+            # Indexing the object by its ID to speed up lookups
+            self.__class__._instances_by_id.setdefault(obj_id, self)
+
+        # Registries of components that belong to the simulator. Components created while no simulator was active in the calling
+        # thread (e.g., when creating a dataset programmatically) are adopted by the new simulator
+        if ComponentManager._ComponentManager__model is None:
+            self._component_registries = _adopt_unscoped_registries()
+        else:
+            self._component_registries = {}
+
+        # Making the simulator the active one in the calling thread
+        self.activate()
 
         # Calling the Model class constructor
         Model.__init__(self)
@@ -81,16 +149,62 @@ class Simulator(ComponentManager, Model):
             seconds=seconds, microseconds=microseconds, milliseconds=milliseconds, minutes=minutes
         ).total_seconds()
 
+        # Defining the time advance mechanism
+        if time_advance not in SUPPORTED_TIME_ADVANCE_MECHANISMS:
+            raise Exception(
+                f"Unsupported time advance mechanism {time_advance}. Supported mechanisms are {SUPPORTED_TIME_ADVANCE_MECHANISMS}."
+            )
+        self.time_advance = time_advance
+
+        # Time steps in which the resource management algorithm must be executed when using the "next_event" time advance mechanism,
+        # and whether the algorithm has ever declared them (otherwise it is executed at every time step)
+        self.wake_ups = set()
+        self.declares_wake_ups = False
+
+        # Metrics collected from agents whose state does not change in time steps without events, which are reused while such time
+        # steps are skipped (only when using the "next_event" time advance mechanism)
+        self._idle_records = {}
+
         # Simulation metrics
+        if metrics_format not in SUPPORTED_METRICS_FORMATS:
+            raise Exception(f"Unsupported metrics format {metrics_format}. Supported formats are {SUPPORTED_METRICS_FORMATS}.")
+        self.metrics_format = metrics_format
         self.model_metrics = {}
         self.agent_metrics = {}
 
+        # Encoding of agent metrics
+        if metrics_encoding not in SUPPORTED_METRICS_ENCODINGS:
+            raise Exception(f"Unsupported metrics encoding {metrics_encoding}. Supported encodings are {SUPPORTED_METRICS_ENCODINGS}.")
+        self.metrics_encoding = metrics_encoding
+        self.keyframe_interval = keyframe_interval
+        self.metrics_encoder = DeltaEncoder(keyframe_interval=keyframe_interval) if metrics_encoding == "delta" else None
+
+        # Model-level metrics maintained incrementally as the state of agents changes
+        self.kpis = IncrementalMetrics()
+
+        # Online statistics about the agents, updated whenever agents are monitored
+        self.statistics = OnlineStatistics() if collect_statistics else None
+
+        # Monitoring settings of each agent class
+        self.monitoring = monitoring if monitoring is not None else {}
+        for class_name, options in self.monitoring.items():
+            for option in options:
+                if option not in SUPPORTED_MONITORING_OPTIONS:
+                    raise Exception(
+                        f"Unsupported monitoring option {option} for {class_name}. Supported options are {SUPPORTED_MONITORING_OPTIONS}."
+                    )
+
+            if options.get("interval", 1) < 1:
+                raise Exception(f"Monitoring interval of {class_name} must be greater than zero.")
+
         # Defining the model schedule
         self.schedule = scheduler(self)
 
-        # Resource management algorithm
+        # Resource management algorithm. A new parameters dictionary is created for each simulator when no parameters are given
         self.resource_management_algorithm = resource_management_algorithm
-        self.resource_management_algorithm_parameters = resource_management_algorithm_parameters
+        self.resource_management_algorithm_parameters = (
+            resource_management_algorithm_parameters if resource_management_algorithm_parameters is not None else {}
+        )
         self.resource_management_algorithm_parameters["current_step"] = self.schedule.steps + 1
 
         # User-defined functions (e.g., user mobility models)
@@ -104,19 +218,33 @@ class Simulator(ComponentManager, Model):
         # Function that manages how network bandwidth is shared among concurrent flows
         self.network_flow_scheduling_algorithm = network_flow_scheduling_algorithm
 
+        # Storage of the state of active network flows
+        if flow_storage not in SUPPORTED_FLOW_STORAGES:
+            raise Exception(f"Unsupported flow storage {flow_storage}. Supported flow storages are {SUPPORTED_FLOW_STORAGES}.")
+        self.flow_storage = flow_storage
+        self.flow_table = FlowTable() if flow_storage == "table" else None
+
         # Attributes that EdgeSimPy uses to know when to dump simulation metrics into the disk
         self.last_dump = 0
         self.dump_interval = dump_interval
         self.logs_directory = logs_directory
+        self.max_log_file_size = max_log_file_size
+
+        if dump_mode not in SUPPORTED_DUMP_MODES:
+            raise Exception(f"Unsupported dump mode {dump_mode}. Supported dump modes are {SUPPORTED_DUMP_MODES}.")
+        self.dump_mode = dump_mode
+
+        # Object that streams metrics to the disk (created once metrics are dumped for the first time) and the number of records
+        # of each metrics group that have already been written but are still kept in memory
+        self.metrics_writer = None
+        self.dumped_records = {}
 
         # Attribute that stores the network topology used during the simulation
         self.topology = None
 
-        # Storing a reference to the Simulator object inside the ComponentManager class
-        ComponentManager._ComponentManager__model = self
-
         # Adding the new object to the list of instances of its class
-        self.__class__._instances.append(self)
+        with _process_registries_lock:
+            self.__class__._instances.append(self)
 
     def initialize(self, input_file: str) -> None:
         """Sets up the initial values for state variables, which includes, e.g., loading components from a dataset file.
@@ -124,36 +252,22 @@ class Simulator(ComponentManager, Model):
         Args:
             input_file (str): Dataset file (URL for external JSON file, path for local JSON file, Python dictionary).
         """
+        # Making sure the components loaded from the dataset are stored inside the registries of this simulator
+        self.activate()
+
         # Resetting the list of instances of EdgeSimPy's component classes
         for component_class in ComponentManager.__subclasses__():
             if component_class.__name__ != "Simulator":
                 component_class._object_count = 0
                 component_class._instances = []
+                component_class._removed_instances = {}
+                component_class._instances_by_id = {}
+                component_class._indexes = {}
+                component_class._archive = []
+                component_class._catalog = {}
 
-        # Declaring an empty variable that will receive the dataset metadata (if user passes valid information)
-        data = None
-
-        # If "input_file" is a Python dictionary, no additional parsing is needed before starting loading the dataset
-        if type(input_file) is dict:
-            data = input_file
-
-        # If "input_file" represents a valid URL, parses its response
-        elif all([urlparse(input_file).scheme, urlparse(input_file).netloc]):
-            data = json.loads(urlopen(input_file).read())
-
-        # If "input_file" points to the local filesystem, checks if the file exists and parses it
-        else:
-            if os.path.exists(input_file):
-                with open(input_file, "r", encoding="UTF-8") as read_file:
-                    data = json.load(read_file)
-
-            elif os.path.exists(f"{os.getcwd()}/{input_file}"):
-                with open(f"{os.getcwd()}/{input_file}", "r", encoding="UTF-8") as read_file:
-                    data = json.load(read_file)
-
-        # Raising exception if the dataset could not be loaded based on the specified arguments
-        if type(data) is not dict:
-            raise TypeError("EdgeSimPy could not load the dataset based on the specified arguments.")
+        # Parsing the dataset metadata
+        data = self.load_dataset(input_file=input_file)
 
         # Creating simulator components based on the specified input data
         missing_keys = [key for key in data.keys() if key not in globals()]
@@ -238,6 +352,12 @@ class Simulator(ComponentManager, Model):
                 else:
                     raise Exception(f"Couldn't add the relationship {key} with value {value}. Please check your dataset.")
 
+        # Loading the catalogs of container image and layer metadata (i.e., a read-only record for each digest in the dataset)
+        for image in ContainerImage.all():
+            ContainerImage.get_metadata(digest=image.digest)
+        for layer in ContainerLayer.all():
+            ContainerLayer.get_metadata(digest=layer.digest)
+
         # Filling the network topology
         for link in NetworkLink.all():
             # Adding the nodes connected by the link to the topology
@@ -249,6 +369,44 @@ class Simulator(ComponentManager, Model):
             topology._adj[link.nodes[0]][link.nodes[1]] = link
             topology._adj[link.nodes[1]][link.nodes[0]] = link
 
+    @staticmethod
+    def load_dataset(input_file: object) -> dict:
+        """Parses a dataset file without creating any component. Please notice that the "initialize()" method uses the objects
+        within the parsed dataset as component attributes. Hence, a parsed dataset should not be reused by multiple simulators.
+
+        Args:
+            input_file (object): Dataset file (URL for external JSON file, path for local JSON file, Python dictionary).
+
+        Returns:
+            data (dict): Dataset metadata.
+        """
+        # Declaring an empty variable that will receive the dataset metadata (if user passes valid information)
+        data = None
+
+        # If "input_file" is a Python dictionary, no additional parsing is needed before starting loading the dataset
+        if type(input_file) is dict:
+            data = input_file
+
+        # If "input_file" represents a valid URL, parses its response
+        elif all([urlparse(input_file).scheme, urlparse(input_file).netloc]):
+            data = json.loads(urlopen(input_file).read())
+
+        # If "input_file" points to the local filesystem, checks if the file exists and parses it
+        else:
+            if os.path.exists(input_file):
+                with open(input_file, "r", encoding="UTF-8") as read_file:
+                    data = json.load(read_file)
+
+            elif os.path.exists(f"{os.getcwd()}/{input_file}"):
+                with open(f"{os.getcwd()}/{input_file}", "r", encoding="UTF-8") as read_file:
+                    data = json.load(read_file)
+
+        # Raising exception if the dataset could not be loaded based on the specified arguments
+        if type(data) is not dict:
+            raise TypeError("EdgeSimPy could not load the dataset based on the specified arguments.")
+
+        return data
+
     def run_model(self):
         """Executes the simulation."""
         if self.stopping_criterion == None:
@@ -257,10 +415,20 @@ class Simulator(ComponentManager, Model):
         if self.resource_management_algorithm == None:
             raise Exception("Please assign the 'resource_management_algorithm' attribute before starting the simulation.")
 
+        # Making sure the class-level helper methods (e.g., "Service.all()") refer to this simulator's components
+        self.activate()
+
         # Calls the method that collects monitoring data about the agents
         self.monitor()
 
         while self.running:
+            # Fast-forwards time steps in which no agent has events to process (only when using the "next_event" time advance mechanism)
+            if self.time_advance == "next_event" and self.schedule.steps > 0:
+                self.skip_idle_steps()
+
+                if not self.running:
+                    break
+
             # Calls the method that advances the simulation time
             self.step()
 
@@ -272,9 +440,14 @@ class Simulator(ComponentManager, Model):
 
         # Dumps simulation data to the disk to make sure no metrics are discarded
         self.dump_data_to_disk()
+        if self.metrics_writer is not None:
+            self.metrics_writer.close()
 
     def step(self):
         """Advances the model's system in one step."""
+        # Making sure the class-level helper methods (e.g., "Service.all()") refer to this simulator's components
+        self.activate()
+
         # Running resource management algorithm
         self.resource_management_algorithm(parameters=self.resource_management_algorithm_parameters)
 
@@ -284,51 +457,264 @@ class Simulator(ComponentManager, Model):
         # Updating the "current_step" attribute inside the resource management algorithm's parameters
         self.resource_management_algorithm_parameters["current_step"] = self.schedule.steps + 1
 
-    def collect(self) -> dict:
-        """Method that collects a set of model-level metrics.
+    def collect(self, fields: list = None) -> dict:
+        """Method that collects a set of model-level metrics. Metrics are maintained incrementally as the state of agents changes
+        (see the "kpis" attribute), so collecting them does not require iterating over all agents.
+
+        Args:
+            fields (list, optional): Names of the metrics to be collected. Defaults to None (all metrics are collected).
 
         Returns:
             metrics (dict): Model-level metrics.
         """
-        metrics = {}
+        metrics = {
+            "Power Consumption": lambda: self.kpis.get_sum(name="Power Consumption"),
+            "Active Flows": lambda: self.kpis.get_count(name="Active Flows"),
+            "Ongoing Migrations": lambda: self.kpis.get_count(name="Ongoing Migrations"),
+            "Users in SLA Violation": lambda: self.kpis.get_count(name="Users in SLA Violation"),
+        }
+
+        # Only the requested metrics are computed
+        metrics = {name: metric() for name, metric in metrics.items() if fields is None or name in fields}
         return metrics
 
-    def monitor(self):
-        """Monitors a set of metrics from the model and its agents."""
-        # Collecting model-level metrics
-        self.collect()
+    def monitor(self, idle: bool = False):
+        """Monitors a set of metrics from the model and its agents.
 
-        # Collecting agent-level metrics
-        for agent in self.schedule._agents.values():
-            metrics = agent.collect()
+        Args:
+            idle (bool, optional): Whether the current time step was skipped by the "next_event" time advance mechanism, in which
+                case the metrics of agents that are not fast-forwarded (i.e., whose state only changes in time steps with events)
+                are reused from the last time they were collected. Defaults to False.
+        """
+        # Metrics of idle agents are only reused within the same sequence of skipped time steps
+        if not idle:
+            self._idle_records = {}
+
+        # Collecting model-level metrics according to the monitoring settings of the simulator's class
+        collect, fields, filter_fields = self._get_monitoring_plan(agent=self)
+        if collect:
+            metrics = self.collect() if fields is None or filter_fields else self.collect(fields=fields)
+            if filter_fields:
+                metrics = {name: value for name, value in metrics.items() if name in fields}
 
             if metrics != {}:
-                if f"{agent.__class__.__name__}" not in self.agent_metrics:
-                    self.agent_metrics[f"{agent.__class__.__name__}"] = []
+                self._store_metrics(storage=self.model_metrics, obj=self, metrics=metrics, fields=fields)
+
+        # Collecting agent-level metrics according to the monitoring settings of each agent class
+        monitoring_plans = {}
+        for agent in self.schedule._agents.values():
+            class_name = agent.__class__.__name__
+            if class_name not in monitoring_plans:
+                monitoring_plans[class_name] = self._get_monitoring_plan(agent=agent)
+
+            collect, fields, filter_fields = monitoring_plans[class_name]
 
-                metrics = {**{"Object": f"{agent}", "Time Step": self.schedule.steps}, **metrics}
-                self.agent_metrics[f"{agent.__class__.__name__}"].append(metrics)
+            # Updating online statistics, which are independent of the monitoring settings
+            if self.statistics is not None and hasattr(agent, "update_statistics"):
+                agent.update_statistics(statistics=self.statistics)
 
-        if self.schedule.steps == self.last_dump + self.dump_interval:
+            if not collect:
+                continue
+
+            metrics = self._idle_records.get(id(agent)) if idle and not hasattr(agent, "fast_forward") else None
+            if metrics is None:
+                metrics = agent.collect() if fields is None or filter_fields else agent.collect(fields=fields)
+                if filter_fields:
+                    metrics = {name: value for name, value in metrics.items() if name in fields}
+
+                if self.time_advance == "next_event":
+                    self._idle_records[id(agent)] = metrics
+
+            if metrics != {}:
+                self._store_metrics(storage=self.agent_metrics, obj=agent, metrics=metrics, fields=fields)
+
+        if self.schedule.steps >= self.last_dump + self.dump_interval:
             self.dump_data_to_disk()
             self.last_dump = self.schedule.steps
 
+    def _store_metrics(self, storage: dict, obj: object, metrics: dict, fields: list = None):
+        """Stores the metrics collected from an object alongside the metrics previously collected from objects of its class.
+
+        Args:
+            storage (dict): Metrics storage, indexed by class name (i.e., the "agent_metrics" or "model_metrics" attribute).
+            obj (object): Object whose metrics were collected.
+            metrics (dict): Collected metrics.
+            fields (list, optional): Names of the collected metrics. Defaults to None (all metrics are collected).
+        """
+        class_name = obj.__class__.__name__
+        if class_name not in storage:
+            if self.metrics_format == "columnar":
+                storage[class_name] = MetricsTable(schema=self._get_metrics_schema(agent=obj, fields=fields))
+            else:
+                storage[class_name] = []
+
+        metrics = {**{"Object": f"{obj}", "Time Step": self.schedule.steps}, **metrics}
+        if self.metrics_encoder is not None:
+            metrics = self.metrics_encoder.encode(record=metrics)
+
+        storage[class_name].append(metrics)
+
+    def _get_monitoring_plan(self, agent: object) -> tuple:
+        """Gets how the metrics of an agent's class must be collected in the current time step.
+
+        Args:
+            agent (object): Agent object.
+
+        Returns:
+            collect (bool): Whether the agent's metrics must be collected in the current time step.
+            fields (list): Names of the metrics to be collected (or None if all metrics must be collected).
+            filter_fields (bool): Whether the agent's "collect()" method is unable to select fields (e.g., in user-defined
+                components), in which case unwanted metrics are discarded after being collected.
+        """
+        options = self.monitoring.get(agent.__class__.__name__, {})
+
+        collect = options.get("enabled", True) and self.schedule.steps % options.get("interval", 1) == 0
+        fields = options.get("fields")
+        filter_fields = fields is not None and "fields" not in inspect.signature(agent.collect).parameters
+
+        return collect, fields, filter_fields
+
+    def _get_metrics_schema(self, agent: object, fields: list = None) -> dict:
+        """Gets the types of the metrics collected from an agent, including the ones added by the "monitor()" method.
+
+        Args:
+            agent (object): Agent object.
+            fields (list, optional): Names of the collected metrics. Defaults to None (all metrics are collected).
+
+        Returns:
+            dict: Metric types.
+        """
+        schema = {name: kind for name, kind in getattr(agent, "metrics_schema", {}).items() if fields is None or name in fields}
+        if self.metrics_encoding == "delta":
+            schema["Keyframe"] = "bool"
+            schema["Patches"] = "object"
+
+        return {**{"Object": "str", "Time Step": "int"}, **schema}
+
     def dump_data_to_disk(self, clean_data_in_memory: bool = True) -> None:
-        """Dumps simulation metrics to the disk.
+        """Dumps simulation metrics to the disk. Metrics are appended to the metrics files as chunks of records, and only the
+        records collected since the previous dump are written. When using the "background" dump mode, this method returns before
+        the chunks are written (the "close()" method of the "metrics_writer" attribute waits for them).
 
         Args:
             clean_data_in_memory (bool, optional): Purges the list of metrics stored in the memory. Defaults to True.
         """
         if self.dump_interval != float("inf"):
-            if not os.path.exists(f"{self.logs_directory}/"):
-                os.makedirs(f"{self.logs_directory}")
+            if self.metrics_writer is None:
+                writer_class = BackgroundMetricsWriter if self.dump_mode == "background" else MetricsWriter
+                self.metrics_writer = writer_class(logs_directory=self.logs_directory, max_file_size=self.max_log_file_size)
+
+            for storage in [self.model_metrics, self.agent_metrics]:
+                for key, value in storage.items():
+                    # Writing the records that were not written by previous dumps. Buffers that are purged from the memory are
+                    # handed over to the writer as they are, which avoids copying them
+                    dumped_records = self.dumped_records.get(key, 0)
+                    records = value if clean_data_in_memory and dumped_records == 0 else value[dumped_records:]
+                    if len(records) > 0:
+                        self.metrics_writer.write(name=key, records=records)
+
+                    if clean_data_in_memory:
+                        storage[key] = MetricsTable(schema=value.schema, chunk_size=value.chunk_size) if isinstance(value, MetricsTable) else []
+                        self.dumped_records[key] = 0
+                    else:
+                        self.dumped_records[key] = len(value)
+
+    def schedule_wake_up(self, step: int):
+        """Makes sure the resource management algorithm is executed at a given time step when using the "next_event" time advance
+        mechanism, as the resource management algorithm is only executed in time steps in which agents have events to process.
+        Algorithms whose decisions depend on the time step (e.g., periodic reallocations) must declare each step they act on,
+        otherwise runs with the "next_event" mechanism diverge from runs with the "fixed_increment" mechanism.
+
+        Args:
+            step (int): Time step (as informed by the "current_step" key within the resource management algorithm's parameters).
+        """
+        self.declares_wake_ups = True
+        self.wake_ups.add(step)
 
-            for key, value in self.agent_metrics.items():
-                with open(f"{self.logs_directory}/{key}.msgpack", "wb") as output_file:
-                    output_file.write(msgpack.packb(value))
+    def get_next_event(self) -> int:
+        """Gets the next time step in which some agent has events to process. As for agents, the returned value is the value of
+        "schedule.steps" when the "step()" method must run next, i.e., all steps before it can be fast-forwarded. Please notice that
+        inside "step()", agents are activated and the resource management algorithm receives "current_step" = "schedule.steps" + 1.
 
-                if clean_data_in_memory:
-                    value = []
+        Returns:
+            next_event (int): Value of "schedule.steps" when "step()" must run next (infinity if no events are scheduled).
+        """
+        current_step = self.schedule.steps
+
+        # Resource management algorithms that do not declare the time steps they act on are executed at every time step
+        if not self.declares_wake_ups:
+            return current_step
+
+        # Gathering the next wake-up of the resource management algorithm (stored as the "current_step" value it must receive)
+        self.wake_ups = set(step for step in self.wake_ups if step > current_step)
+        next_event = min(self.wake_ups) - 1 if len(self.wake_ups) > 0 else float("inf")
+
+        for agent in self.schedule._agents.values():
+            # Agents that do not report their next events are activated at every time step
+            if not hasattr(agent, "get_next_event"):
+                return current_step
+
+            next_event = min(next_event, agent.get_next_event())
+            if next_event <= current_step:
+                return current_step
+
+        return next_event
+
+    def skip_idle_steps(self):
+        """Fast-forwards the time steps in which no agent has events to process (and no wake-up of the resource management algorithm
+        is scheduled). Instead of being activated, agents whose state changes at every time step in a predictable manner (e.g.,
+        the progress of network flows) are fast-forwarded, and each class of such agents is only brought up to date (by all the
+        steps skipped since its last update) when its metrics or online statistics are collected, or once the skipped steps end.
+        Metrics of the remaining agents do not change while steps are skipped, so they are collected once and then reused. Each
+        skipped step is still monitored and checked against the stopping criterion, hence records, online statistics, and model-level
+        metrics match those of activating all agents. Please notice that stopping criteria must depend on the time step or on the
+        events of agents, as agents may not be up to date when the stopping criterion is checked.
+        """
+        next_event = self.get_next_event()
+
+        # Agents do not change during idle time steps, so the agents to be fast-forwarded are gathered (by class) once
+        agents_by_class = {}
+        for agent in self.schedule._agents.values():
+            if hasattr(agent, "fast_forward"):
+                agents_by_class.setdefault(agent.__class__.__name__, []).append(agent)
+
+        # Number of skipped steps by which the agents of each class are yet to be fast-forwarded
+        pending_steps = {class_name: 0 for class_name in agents_by_class}
+
+        while self.running and self.schedule.steps < next_event:
+            # Advancing the simulation clock
+            self.schedule.steps += 1
+            self.schedule.time += 1
+            self.resource_management_algorithm_parameters["current_step"] = self.schedule.steps + 1
+
+            # Fast-forwarding the agents whose metrics (or online statistics) are collected in the current time step
+            for class_name, agents in agents_by_class.items():
+                pending_steps[class_name] += 1
+                collect, _, _ = self._get_monitoring_plan(agent=agents[0])
+                if collect or (self.statistics is not None and hasattr(agents[0], "update_statistics")):
+                    for agent in agents:
+                        agent.fast_forward(steps=pending_steps[class_name])
+                    pending_steps[class_name] = 0
+
+            # Collecting monitoring data and checking the stopping criterion as if the time step was executed
+            self.monitor(idle=True)
+            self.running = False if self.stopping_criterion(self) else True
+
+        # Bringing the remaining agents up to date with the simulation clock
+        for class_name, agents in agents_by_class.items():
+            if pending_steps[class_name] > 0:
+                for agent in agents:
+                    agent.fast_forward(steps=pending_steps[class_name])
+
+    def activate(self) -> object:
+        """Makes the simulator the active one in the calling thread. Class-level helper methods (e.g., "Service.all()") and
+        newly created components refer to the component registries of the active simulator.
+
+        Returns:
+            object: Activated Simulator object.
+        """
+        ComponentManager._ComponentManager__model = self
+        return self
 
     def initialize_agent(self, agent: object) -> object:
         """Initializes an agent object.
@@ -340,7 +726,7 @@ class Simulator(ComponentManager, Model):
             object: Initialized agent.
         """
         # Reference to the Simulator object
-        agent.model = ComponentManager._ComponentManager__model
+        agent.model = self
 
         # Agent unique ID
         agent.unique_id = agent.model.next_id()
@@ -351,4 +737,13 @@ class Simulator(ComponentManager, Model):
         # Adding the object to the list of agents of its model
         agent.model.schedule.add(agent)
 
+        # Moving the state of active network flows to the flow table (flows that override the built-in activation procedure are not
+        # progressed in batches)
+        if self.flow_table is not None and isinstance(agent, NetworkFlow) and agent.status == "active":
+            self.flow_table.attach(flow=agent, batched=type(agent).step is NetworkFlow.step)
+
+        # Reporting the agent's initial state to the model-level metrics maintained incrementally by the simulator
+        if hasattr(agent, "update_kpis"):
+            agent.update_kpis(kpis=self.kpis)
+
         return agent
@@ -0,0 +1,138 @@
+""" Contains fixtures shared by the test suite."""
+# EdgeSimPy components
+from edge_sim_py import *
+from edge_sim_py.dataset_generator.network_topologies.partially_connected_hexagonal_mesh import find_neighbors_hexagonal_grid
+
+# Python libraries
+import os
+import copy
+import random
+import pytest
+
+
+def build_dataset(x_size: int = 6, y_size: int = 6, users: int = 20, services: int = 12, seed: int = 1) -> dict:
+    """Builds a small synthetic dataset with edge servers, container registries, services, and users.
+
+    Args:
+        x_size (int, optional): Number of columns of the map. Defaults to 6.
+        y_size (int, optional): Number of rows of the map. Defaults to 6.
+        users (int, optional): Number of users. Defaults to 20.
+        services (int, optional): Number of services. Defaults to 12.
+        seed (int, optional): Seed of the random number generator. Defaults to 1.
+
+    Returns:
+        dict: Dataset.
+    """
+    random.seed(seed)
+
+    # Creating base stations and network switches
+    map_coordinates = hexagonal_grid(x_size=x_size, y_size=y_size)
+    for coordinates in map_coordinates:
+        base_station = BaseStation()
+        base_station.wireless_delay = 0
+        base_station.coordinates = coordinates
+        base_station._connect_to_network_switch(network_switch=sample_switch())
+
+    # Creating network links
+    links = set()
+    for switch in NetworkSwitch.all():
+        for neighbor in find_neighbors_hexagonal_grid(map_coordinates=map_coordinates, current_position=switch.coordinates):
+            links.add(frozenset([switch.coordinates, neighbor]))
+    partially_connected_hexagonal_mesh(
+        network_nodes=NetworkSwitch.all(),
+        link_specifications=[{"number_of_objects": len(links), "delay": 1, "bandwidth": 12.5}],
+    )
+
+    # Creating edge servers
+    for index, base_station in enumerate(random.sample(BaseStation.all(), 8)):
+        edge_server = [e5430, jetson_nano, raspberry_pi4][index % 3]()
+        edge_server.power_model = LinearServerPowerModel
+        base_station._connect_to_edge_server(edge_server=edge_server)
+
+    # Creating container images and registries
+    images = [
+        {
+            "name": "registry",
+            "tag": "latest",
+            "digest": "sha256:registry",
+            "layers": [{"digest": "sha256:r1", "size": 2, "instruction": "ADD registry"}, {"digest": "sha256:base", "size": 3, "instruction": "ADD base"}],
+        }
+    ]
+    for index in range(4):
+        images.append(
+            {
+                "name": f"app{index}",
+                "tag": "latest",
+                "digest": f"sha256:app{index}",
+                "layers": [
+                    {"digest": "sha256:base", "size": 3, "instruction": "ADD base"},
+                    {"digest": f"sha256:app{index}a", "size": 5 + index, "instruction": f"RUN a{index}"},
+                    {"digest": f"sha256:app{index}b", "size": 7 + index, "instruction": f"RUN b{index}"},
+                ],
+            }
+        )
+    registries = create_container_registries(
+        container_image_specifications=images,
+        container_registry_specifications=[
+            {"number_of_objects": 2, "cpu_demand": 0, "memory_demand": 0, "images": [{"name": image["name"], "tag": "latest"} for image in images]}
+        ],
+    )
+    random_fit_registries(container_registry_specifications=registries, servers=EdgeServer.all())
+
+    # Creating applications, services, and users
+    for index in range(services):
+        application = Application()
+        service = Service(image_digest=f"sha256:app{index % 4}", cpu_demand=1, memory_demand=512, state=random.choice([0, 10, 25]))
+        application.connect_to_service(service)
+
+    for _ in range(users):
+        user = User()
+        user.mobility_model = random.choice([pathway, random_mobility])
+        user._set_initial_position(coordinates=random.choice(map_coordinates), number_of_replicates=2)
+        application = random.choice(Application.all())
+        user._connect_to_application(app=application, delay_sla=random.randint(3, 8))
+        access_pattern = random.choice([CircularDurationAndIntervalAccessPattern, RandomDurationAndIntervalAccessPattern])
+        access_pattern(user=user, app=application, start=1, duration_values=[3, 5, 8], interval_values=[2, 6])
+
+    random_fit_services()
+
+    return ComponentManager.export_scenario(save_to_file=False)
+
+
+@pytest.fixture(scope="session")
+def dataset(tmp_path_factory: pytest.TempPathFactory) -> dict:
+    """Small synthetic dataset shared by the tests.
+
+    Returns:
+        dict: Dataset.
+    """
+    # Building the dataset inside a temporary directory, as exporting scenarios creates a "datasets" directory
+    working_directory = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("dataset"))
+    try:
+        data = build_dataset()
+    finally:
+        os.chdir(working_directory)
+
+    # Components created while building the dataset are adopted (and then discarded) by a throwaway simulator
+    Simulator()
+    return data
+
+
+@pytest.fixture
+def simulator(dataset: dict) -> object:
+    """Simulator initialized with the shared dataset.
+
+    Returns:
+        object: Simulator object.
+    """
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == 30,
+        resource_management_algorithm=lambda parameters: None,
+        dump_interval=float("inf"),
+    )
+    # Simulators change the datasets they load, so each simulator gets its own copy of the shared dataset
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+    return simulator
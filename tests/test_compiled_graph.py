@@ -0,0 +1,70 @@
+""" Tests the shortest paths found by the compiled graph backends of the Topology class."""
+# EdgeSimPy components
+from edge_sim_py import *
+from edge_sim_py.components.compiled_graph import CompiledGraph
+
+# Python libraries
+import networkx as nx
+import pytest
+
+
+def get_node_pairs(topology: object) -> list:
+    """Lists all pairs of nodes of a topology.
+
+    Args:
+        topology (object): Topology object.
+
+    Returns:
+        list: Node pairs.
+    """
+    return [(source, target) for source in topology.nodes for target in topology.nodes]
+
+
+@pytest.mark.parametrize("weight", [None, "delay"])
+@pytest.mark.parametrize("uniform_delays", [True, False])
+def test_compiled_backend_matches_networkx_paths(simulator: object, weight: str, uniform_delays: bool):
+    topology = simulator.topology
+    if not uniform_delays:
+        for link in NetworkLink.all():
+            link["delay"] = link.id % 4 + 1
+
+    compiled_graph = CompiledGraph(graph=topology)
+
+    for source, target in get_node_pairs(topology=topology):
+        expected_path = nx.shortest_path(G=topology, source=source, target=target, weight=weight)
+        assert compiled_graph.get_shortest_path(source=source, target=target, weight=weight) == expected_path
+
+
+@pytest.mark.parametrize("weight", [None, "delay"])
+def test_scipy_backend_finds_equally_short_paths(simulator: object, weight: str):
+    pytest.importorskip("scipy")
+    topology = simulator.topology
+    compiled_graph = CompiledGraph(graph=topology, solver="scipy")
+
+    for source, target in get_node_pairs(topology=topology):
+        path = compiled_graph.get_shortest_path(source=source, target=target, weight=weight)
+        expected_length = nx.shortest_path_length(G=topology, source=source, target=target, weight=weight)
+        assert path[0] == source and path[-1] == target
+        length = len(path) - 1 if weight is None else nx.path_weight(G=topology, path=path, weight=weight)
+        assert length == pytest.approx(expected_length)
+
+
+def test_auto_backend_falls_back_to_networkx_for_unsupported_weights(simulator: object, monkeypatch: object):
+    topology = simulator.topology
+    monkeypatch.setattr(topology, "graph_backend", "auto")
+    monkeypatch.setattr(topology, "compiled_graph_min_nodes", 0)
+    for link in NetworkLink.all():
+        link["cost"] = link.id % 3 + 1
+
+    source, target = list(topology.nodes)[0], list(topology.nodes)[-1]
+    expected_path = nx.shortest_path(G=topology, source=source, target=target, weight="cost")
+    assert topology.get_shortest_path(source=source, target=target, weight="cost") == expected_path
+
+
+def test_compiled_backend_rejects_unsupported_weights(simulator: object, monkeypatch: object):
+    topology = simulator.topology
+    monkeypatch.setattr(topology, "graph_backend", "compiled")
+
+    source, target = list(topology.nodes)[0], list(topology.nodes)[-1]
+    with pytest.raises(Exception, match="Unsupported path weight"):
+        topology.get_shortest_path(source=source, target=target, weight="cost")
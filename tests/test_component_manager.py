@@ -0,0 +1,70 @@
+""" Tests the registries that store the instances of component classes."""
+# EdgeSimPy components
+from edge_sim_py import *
+
+# Python libraries
+import pytest
+
+
+def test_removed_objects_leave_the_list_of_instances(simulator: object):
+    flows = [NetworkFlow(metadata={"type": "custom"}) for _ in range(6)]
+    for flow in [flows[4], flows[0], flows[2]]:
+        NetworkFlow.remove(flow)
+
+    assert NetworkFlow.count() == 3
+    assert NetworkFlow.all() == [flows[1], flows[3], flows[5]]
+    assert NetworkFlow.first() is flows[1] and NetworkFlow.last() is flows[5]
+    assert NetworkFlow.find_by_id(flows[0].id) is None and NetworkFlow.find_by_id(flows[3].id) is flows[3]
+
+    with pytest.raises(Exception, match="is not in the list of instances"):
+        NetworkFlow.remove(flows[2])
+
+
+def test_archived_objects_keep_their_records(simulator: object):
+    links = NetworkLink.all()
+    archived_links = [links[-1], links[0]]
+    for link in archived_links:
+        NetworkLink.archive(link)
+
+    assert [record["Object"] for record in NetworkLink.archived()] == [str(link) for link in archived_links]
+    assert not any(link is archived_link for link in NetworkLink.all() for archived_link in archived_links)
+
+
+def test_objects_that_share_ids_are_removed_by_identity(simulator: object):
+    flows = [NetworkFlow(obj_id=1, metadata={"type": "custom"}) for _ in range(3)]
+    NetworkFlow.remove(flows[1])
+
+    assert NetworkFlow.all() == [flows[0], flows[2]]
+    assert flows[1] not in NetworkFlow._instances and flows[2] in NetworkFlow._instances
+
+    # Objects created by other simulators are not in the list of instances of the class
+    other_simulator = Simulator()
+    other_flow = NetworkFlow(obj_id=1, metadata={"type": "custom"})
+    simulator.activate()
+    with pytest.raises(Exception, match="is not in the list of instances"):
+        NetworkFlow.remove(other_flow)
+
+    other_simulator.activate()
+    assert NetworkFlow.all() == [other_flow]
+
+
+def test_indexed_attributes_follow_reassignments_and_removals(simulator: object):
+    base_stations = BaseStation.all()
+    moved_base_station, other_base_station = base_stations[0], base_stations[1]
+    previous_coordinates = moved_base_station.coordinates
+    assert BaseStation.find_by(attribute_name="coordinates", attribute_value=previous_coordinates) is moved_base_station
+
+    moved_base_station.coordinates = other_base_station.coordinates
+    assert BaseStation.find_by(attribute_name="coordinates", attribute_value=previous_coordinates) is None
+    assert BaseStation.find_all_by(attribute_name="coordinates", attribute_value=other_base_station.coordinates) == [
+        other_base_station,
+        moved_base_station,
+    ]
+
+    BaseStation.remove(other_base_station)
+    assert BaseStation.find_all_by(attribute_name="coordinates", attribute_value=moved_base_station.coordinates) == [moved_base_station]
+
+    # Indexed lookups match the ones found by scanning the list of instances
+    for layer in ContainerLayer.all():
+        expected_layers = [other_layer for other_layer in ContainerLayer.all() if other_layer.digest == layer.digest]
+        assert ContainerLayer.find_all_by(attribute_name="digest", attribute_value=layer.digest) == expected_layers
@@ -0,0 +1,85 @@
+""" Tests the catalogs of container image and layer metadata."""
+# EdgeSimPy components
+from edge_sim_py import *
+from edge_sim_py.components.container_catalog import ContainerImageMetadata, ContainerLayerMetadata
+
+# Python libraries
+import copy
+import random
+import pytest
+
+
+def migrate_services(parameters: dict):
+    """Resource management algorithm that migrates every service to the next edge server in the first time step.
+
+    Args:
+        parameters (dict): Resource management algorithm parameters.
+    """
+    if parameters["current_step"] == 1:
+        servers = EdgeServer.all()
+        for service in Service.all():
+            target = servers[(servers.index(service.server) + 1) % len(servers)]
+            if target.has_capacity_to_host(service):
+                service.provision(target_server=target)
+
+
+def test_catalogs_hold_one_read_only_record_per_digest(simulator: object):
+    images = {image.digest: image for image in ContainerImage.all()}
+    layers = {layer.digest: layer for layer in ContainerLayer.all()}
+    assert ContainerImage._catalog.keys() == images.keys() and ContainerLayer._catalog.keys() == layers.keys()
+
+    for digest, image in images.items():
+        metadata = ContainerImage.get_metadata(digest=digest)
+        assert metadata == ContainerImageMetadata(
+            digest=digest, name=image.name, tag=image.tag, architecture=image.architecture, layers_digests=tuple(image.layers_digests)
+        )
+        with pytest.raises(AttributeError):
+            metadata.layers_digests = ()
+
+    for digest, layer in layers.items():
+        assert ContainerLayer.get_metadata(digest=digest) == ContainerLayerMetadata(digest=digest, size=layer.size, instruction=layer.instruction)
+
+    assert ContainerImage.get_metadata(digest="sha256:unknown") is None and ContainerLayer.get_metadata(digest="sha256:unknown") is None
+
+
+def test_catalogs_are_not_changed_by_image_and_layer_copies(dataset: dict):
+    random.seed(1)
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == 30,
+        resource_management_algorithm=migrate_services,
+        dump_interval=float("inf"),
+    )
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+
+    image_catalog, layer_catalog = dict(ContainerImage._catalog), dict(ContainerLayer._catalog)
+    images, layers = ContainerImage.count(), ContainerLayer.count()
+    simulator.run_model()
+
+    # Migrations copy images and layers to their target servers, but copies share the records loaded from the dataset
+    assert ContainerImage.count() > images and ContainerLayer.count() > layers
+    assert ContainerImage._catalog == image_catalog and ContainerLayer._catalog == layer_catalog
+    for digest, metadata in image_catalog.items():
+        assert ContainerImage.get_metadata(digest=digest) is metadata
+
+    image_copies = ContainerImage.all()[images:]
+    assert len(image_copies) > 0
+    assert all(image.layers_digests is ContainerImage.get_metadata(digest=image.digest).layers_digests for image in image_copies)
+
+
+def test_simulators_load_their_own_catalogs(dataset: dict):
+    first_simulator, second_simulator = Simulator(), Simulator()
+    first_simulator.initialize(input_file=copy.deepcopy(dataset))
+
+    second_dataset = copy.deepcopy(dataset)
+    for image in second_dataset["ContainerImage"]:
+        image["attributes"]["tag"] = "second"
+    second_simulator.initialize(input_file=second_dataset)
+
+    digest = dataset["ContainerImage"][0]["attributes"]["digest"]
+    first_simulator.activate()
+    assert ContainerImage.get_metadata(digest=digest).tag == dataset["ContainerImage"][0]["attributes"]["tag"]
+
+    second_simulator.activate()
+    assert ContainerImage.get_metadata(digest=digest).tag == "second"
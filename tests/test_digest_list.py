@@ -0,0 +1,45 @@
+""" Tests the lists that keep track of the digests of their items."""
+# EdgeSimPy components
+from edge_sim_py.components.digest_list import DigestList
+
+# Python libraries
+from collections import Counter
+from types import SimpleNamespace
+
+
+def assert_digests_match_items(digest_list: DigestList):
+    """Checks that the digests tracked by a DigestList match its items.
+
+    Args:
+        digest_list (DigestList): DigestList object.
+    """
+    assert digest_list.digests == dict(Counter(item.digest for item in digest_list))
+
+
+def test_mutators_keep_digests_consistent():
+    items = [SimpleNamespace(digest=f"sha256:{index % 3}") for index in range(8)]
+    digest_list = DigestList(items=items[:4])
+
+    digest_list.append(items[4])
+    digest_list.extend(items[5:7])
+    digest_list.insert(0, items[7])
+    digest_list.remove(items[1])
+    digest_list.pop()
+    digest_list[0] = items[1]
+    digest_list[1:3] = items[5:8]
+    del digest_list[-1]
+    digest_list += items[:2]
+    assert_digests_match_items(digest_list=digest_list)
+
+    digest_list *= 2
+    assert_digests_match_items(digest_list=digest_list)
+
+    digest_list *= 0
+    assert digest_list == [] and not digest_list.has_digest("sha256:0")
+
+
+def test_lists_created_without_items_are_independent():
+    first_list, second_list = DigestList(), DigestList()
+    first_list.append(SimpleNamespace(digest="sha256:0"))
+
+    assert second_list == [] and second_list.digests == {}
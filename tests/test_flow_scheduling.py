@@ -0,0 +1,241 @@
+""" Tests the algorithms that share the bandwidth of network links among network flows."""
+# EdgeSimPy components
+from edge_sim_py import *
+from edge_sim_py.components.flow_scheduling.max_min_fairness import calculate_fair_allocation
+from edge_sim_py.components.flow_scheduling.progressive_filling import calculate_progressive_filling
+
+# Python libraries
+import copy
+import random
+import pytest
+
+
+def assert_max_min_fair(capacities: list, demands: list, entry_flows: list, entry_links: list, rates: list):
+    """Checks that rates are feasible and Max-Min Fair, i.e., every flow either gets its demand or crosses a saturated link in which
+    no other flow gets a larger rate.
+
+    Args:
+        capacities (list): Bandwidth of each link.
+        demands (list): Demand of each flow.
+        entry_flows (list): Flow index of each entry of the flow-link incidence matrix.
+        entry_links (list): Link index of each entry of the flow-link incidence matrix.
+        rates (list): Rate of each flow.
+    """
+    link_flows = {link: [] for link in range(len(capacities))}
+    for flow, link in zip(entry_flows, entry_links):
+        link_flows[link].append(flow)
+
+    loads = {link: sum(rates[flow] for flow in flows) for link, flows in link_flows.items()}
+    for link, load in loads.items():
+        assert load <= capacities[link] * (1 + 1e-9)
+
+    for flow, rate in enumerate(rates):
+        assert 0 <= rate <= demands[flow] * (1 + 1e-9)
+        if rate < demands[flow] * (1 - 1e-9):
+            flow_links = [link for link, flows in link_flows.items() if flow in flows]
+            assert any(
+                loads[link] >= capacities[link] * (1 - 1e-9) and all(rates[other_flow] <= rate * (1 + 1e-9) for other_flow in link_flows[link])
+                for link in flow_links
+            )
+
+
+def test_progressive_filling_redistributes_unused_capacity():
+    # Flow 0 crosses both links, flow 1 only crosses the first link, and flow 2 only crosses the second link
+    rates = calculate_progressive_filling(capacities=[10, 20], demands=[100, 100, 100], entry_flows=[0, 0, 1, 2], entry_links=[0, 1, 0, 1])
+    assert rates == pytest.approx([5, 5, 15])
+
+    # Flows whose demands are smaller than their fair share leave the capacity they do not use to the other flows
+    rates = calculate_progressive_filling(capacities=[10, 20], demands=[2, 100, 100], entry_flows=[0, 0, 1, 2], entry_links=[0, 1, 0, 1])
+    assert rates == pytest.approx([2, 8, 18])
+
+    # Flows without links are only limited by their demands
+    assert calculate_progressive_filling(capacities=[10], demands=[4, 30], entry_flows=[1], entry_links=[0]) == pytest.approx([4, 10])
+
+    # Flows whose demands are reached get exactly their demands, even when other demands differ from them only due to rounding
+    assert calculate_progressive_filling(capacities=[12.5, 12.5], demands=[2.4999999999999982, 2.5], entry_flows=[0, 1], entry_links=[0, 1]) == [
+        2.4999999999999982,
+        2.5,
+    ]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_progressive_filling_finds_max_min_fair_rates(seed: int):
+    random.seed(seed)
+    capacities = [random.choice([1, 5, 12.5, 100]) for _ in range(random.randint(1, 30))]
+    demands = [random.choice([0, 0.5, 3, 10, 1000]) for _ in range(random.randint(1, 60))]
+    entries = {(flow, link) for flow in range(len(demands)) for link in random.sample(range(len(capacities)), random.randint(1, min(5, len(capacities))))}
+    entry_flows, entry_links = [flow for flow, _ in sorted(entries)], [link for _, link in sorted(entries)]
+
+    rates = calculate_progressive_filling(capacities=capacities, demands=demands, entry_flows=entry_flows, entry_links=entry_links)
+    assert_max_min_fair(capacities=capacities, demands=demands, entry_flows=entry_flows, entry_links=entry_links, rates=rates)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_progressive_filling_matches_max_min_fairness_on_a_single_link(seed: int):
+    random.seed(seed)
+    capacity = random.choice([1, 12.5, 100])
+    demands = [random.choice([0.5, 3, 10, 1000]) for _ in range(random.randint(1, 20))]
+
+    rates = calculate_progressive_filling(capacities=[capacity], demands=demands, entry_flows=list(range(len(demands))), entry_links=[0] * len(demands))
+    expected_rates = [min(share, demand) for share, demand in zip(calculate_fair_allocation(capacity=capacity, demands=demands), demands)]
+    assert rates == pytest.approx(expected_rates)
+
+
+def migrate_services(parameters: dict):
+    """Resource management algorithm that migrates every service to the next edge server in the first time step.
+
+    Args:
+        parameters (dict): Resource management algorithm parameters.
+    """
+    if parameters["current_step"] == 1:
+        servers = EdgeServer.all()
+        for service in Service.all():
+            target = servers[(servers.index(service.server) + 1) % len(servers)]
+            if target.has_capacity_to_host(service):
+                service.provision(target_server=target)
+
+
+def checked_progressive_filling(topology: object, flows: list):
+    """Runs the progressive filling algorithm and checks that active flows get the same rate in all their links and that no link
+    is overloaded.
+
+    Args:
+        topology (object): Network topology object.
+        flows (list): Ignored.
+    """
+    progressive_filling(topology=topology, flows=flows)
+
+    active_flows = [flow for flow in NetworkFlow.all() if flow.status == "active"]
+    assert all(len(set(flow.bandwidth.values())) == 1 and None not in flow.bandwidth.values() for flow in active_flows)
+    for link in NetworkLink.all():
+        assert sum(flow.bandwidth[link["id"]] for flow in link["active_flows"]) <= link["bandwidth"] * (1 + 1e-9)
+
+
+def test_simulations_with_progressive_filling_finish_migrations(dataset: dict):
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == 60,
+        resource_management_algorithm=migrate_services,
+        dump_interval=float("inf"),
+        network_flow_scheduling_algorithm=checked_progressive_filling,
+    )
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+    simulator.run_model()
+
+    migrations = [migration for service in Service.all() for migration in service._Service__migrations]
+    assert len([migration for migration in migrations if migration["status"] == "finished"]) > 0
+    assert len(NetworkFlow.archived()) > 0
+
+
+def recalculating_all_links(algorithm: object) -> object:
+    """Wraps a bandwidth sharing algorithm so that the shares of all links used by active flows are recalculated at every time step.
+
+    Args:
+        algorithm (object): Bandwidth sharing algorithm.
+
+    Returns:
+        object: Wrapped algorithm.
+    """
+
+    def full_recalculation(topology: object, flows: list):
+        """Marks the links of all active flows as dirty before running the wrapped algorithm.
+
+        Args:
+            topology (object): Network topology object.
+            flows (list): Network flows.
+        """
+        for flow in flows:
+            if flow.status == "active":
+                topology.mark_dirty_links(flow=flow, event="flow_started")
+
+        algorithm(topology=topology, flows=flows)
+
+    return full_recalculation
+
+
+def run_with_migrations(dataset: dict, algorithm: object) -> object:
+    """Runs a simulation in which services are migrated across edge servers with a given bandwidth sharing algorithm.
+
+    Args:
+        dataset (dict): Dataset.
+        algorithm (object): Bandwidth sharing algorithm.
+
+    Returns:
+        object: Simulator object.
+    """
+    random.seed(1)
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == 30,
+        resource_management_algorithm=migrate_services,
+        dump_interval=float("inf"),
+        network_flow_scheduling_algorithm=algorithm,
+    )
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+    simulator.run_model()
+    return simulator
+
+
+@pytest.mark.parametrize("algorithm", [equal_share, max_min_fairness, progressive_filling])
+def test_recalculating_dirty_links_matches_recalculating_all_links(dataset: dict, algorithm: object):
+    full = run_with_migrations(dataset=dataset, algorithm=recalculating_all_links(algorithm=algorithm))
+    full_flows = [(flow["Object"], flow["Start"], flow["End"]) for flow in NetworkFlow.archived()]
+    assert len(full_flows) > 0
+
+    incremental = run_with_migrations(dataset=dataset, algorithm=algorithm)
+    assert [(flow["Object"], flow["Start"], flow["End"]) for flow in NetworkFlow.archived()] == full_flows
+    assert incremental.agent_metrics == full.agent_metrics
+
+
+def create_flows(parameters: dict):
+    """Resource management algorithm that creates a batch of network flows in the second time step and estimates the completion
+    times of another batch before creating it in the sixth time step.
+
+    Args:
+        parameters (dict): Resource management algorithm parameters.
+    """
+    if parameters["current_step"] in [2, 6]:
+        topology = Topology.first()
+        servers = EdgeServer.all()
+        switches = [(servers[i].base_station.network_switch, servers[(i * 3 + 1) % len(servers)].base_station.network_switch) for i in range(8)]
+        flows = [{"source": source, "target": target, "data_to_transfer": random.choice([5, 17, 40, 60, 150])} for source, target in switches]
+
+        if parameters["current_step"] == 6:
+            topology.model.estimated_completion_times = topology.estimate_flow_completion_times(flows=flows)
+            topology.model.estimated_flows = []
+
+        for flow in flows:
+            network_flow = NetworkFlow(
+                topology=topology,
+                source=flow["source"],
+                target=flow["target"],
+                start=parameters["current_step"],
+                path=topology.get_shortest_path(source=flow["source"], target=flow["target"]),
+                data_to_transfer=flow["data_to_transfer"],
+                metadata={"type": "custom", "object": flow["source"]},
+            )
+            topology.model.initialize_agent(agent=network_flow)
+            if parameters["current_step"] == 6:
+                topology.model.estimated_flows.append(network_flow)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("algorithm", [equal_share, max_min_fairness, progressive_filling])
+def test_estimated_completion_times_match_simulated_flows(dataset: dict, algorithm: object, seed: int):
+    random.seed(seed)
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == 60,
+        resource_management_algorithm=create_flows,
+        dump_interval=float("inf"),
+        network_flow_scheduling_algorithm=algorithm,
+    )
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+    simulator.run_model()
+
+    # Estimates consider the flows created earlier, which are still active when the estimated flows are created
+    assert all(flow.status == "finished" for flow in simulator.estimated_flows)
+    assert simulator.estimated_completion_times == [flow.end - flow.start + 1 for flow in simulator.estimated_flows]
@@ -0,0 +1,163 @@
+""" Tests the storage of network flows inside a flow table."""
+# EdgeSimPy components
+from edge_sim_py import *
+
+# Python libraries
+import copy
+import json
+import pytest
+
+
+class ThrottledFlow(NetworkFlow):
+    """Network flow that overrides the built-in activation procedure, transferring data at half of its bandwidth share."""
+
+    def step(self):
+        """Method that executes the events involving the object at each time step."""
+        self.activations = getattr(self, "activations", 0) + 1
+        if self.status == "active":
+            if not any([bw == None for bw in self.bandwidth.values()]):
+                self.data_to_transfer -= min(self.bandwidth.values()) / 2
+
+            if self.data_to_transfer <= 0:
+                self._finish()
+
+            self.report_bandwidth_events()
+
+
+class SilentFlow(NetworkFlow):
+    """Network flow that transfers data at half of its bandwidth share without reporting its bandwidth events."""
+
+    def step(self):
+        """Method that executes the events involving the object at each time step."""
+        if self.status == "active":
+            if not any([bw == None for bw in self.bandwidth.values()]):
+                self.data_to_transfer -= min(self.bandwidth.values()) / 2
+
+            if self.data_to_transfer <= 0:
+                self._finish()
+
+
+def run_with_throttled_flow(dataset: dict, flow_storage: str, flow_class: type = ThrottledFlow) -> object:
+    """Runs a simulation in which a custom network flow transfers data between two edge servers.
+
+    Args:
+        dataset (dict): Dataset.
+        flow_storage (str): Where the state of network flows is stored.
+        flow_class (type, optional): Custom network flow class. Defaults to ThrottledFlow.
+
+    Returns:
+        object: Custom network flow object.
+    """
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == 40,
+        resource_management_algorithm=lambda parameters: None,
+        dump_interval=float("inf"),
+        flow_storage=flow_storage,
+    )
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+
+    source, target = EdgeServer.all()[0], EdgeServer.all()[-1]
+    path = simulator.topology.get_shortest_path(source=source.base_station.network_switch, target=target.base_station.network_switch)
+    flow = flow_class(
+        topology=simulator.topology,
+        source=source,
+        target=target,
+        start=1,
+        path=path,
+        data_to_transfer=100,
+        metadata={"type": "custom", "object": source},
+    )
+    simulator.initialize_agent(agent=flow)
+    simulator.run_model()
+
+    return flow
+
+
+def test_table_storage_activates_flows_that_override_step(dataset: dict):
+    object_flow = run_with_throttled_flow(dataset=dataset, flow_storage="objects")
+    table_flow = run_with_throttled_flow(dataset=dataset, flow_storage="table")
+
+    assert object_flow.status == "finished"
+    assert table_flow.status == object_flow.status
+    assert table_flow.end == object_flow.end
+    assert table_flow.activations == object_flow.activations
+
+
+@pytest.mark.parametrize("flow_storage", ["objects", "table"])
+def test_flows_that_do_not_report_bandwidth_events_are_archived(dataset: dict, flow_storage: str):
+    reporting_flow = run_with_throttled_flow(dataset=dataset, flow_storage=flow_storage)
+    reporting_links = [(link.id, link["bandwidth_demand"]) for link in NetworkLink.all()]
+
+    silent_flow = run_with_throttled_flow(dataset=dataset, flow_storage=flow_storage, flow_class=SilentFlow)
+    assert silent_flow.end == reporting_flow.end
+    assert [record["Object"] for record in NetworkFlow.archived()] == [str(silent_flow)]
+    assert [(link.id, link["bandwidth_demand"]) for link in NetworkLink.all()] == reporting_links
+    assert len(silent_flow.model.topology._custom_flows) == 0
+
+
+def test_flow_bandwidth_rejects_link_removals(dataset: dict):
+    simulator = Simulator(flow_storage="table")
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+
+    source, target = EdgeServer.all()[0], EdgeServer.all()[-1]
+    path = simulator.topology.get_shortest_path(source=source.base_station.network_switch, target=target.base_station.network_switch)
+    flow = NetworkFlow(topology=simulator.topology, source=source, target=target, path=path, data_to_transfer=10, metadata={"type": "custom"})
+    simulator.initialize_agent(agent=flow)
+
+    assert dict(flow.bandwidth) == {link["id"]: None for link in flow.links}
+    with pytest.raises(Exception, match="cannot be removed"):
+        del flow.bandwidth[flow.links[0]["id"]]
+
+
+def run_with_migrations(dataset: dict, flow_storage: str) -> object:
+    """Runs a simulation in which services are migrated across edge servers, creating layer and service state flows.
+
+    Args:
+        dataset (dict): Dataset.
+        flow_storage (str): Where the state of network flows is stored.
+
+    Returns:
+        object: Simulator object.
+    """
+
+    def migrate_services(parameters: dict):
+        """Resource management algorithm that migrates every service to the next edge server in the first time step.
+
+        Args:
+            parameters (dict): Resource management algorithm parameters.
+        """
+        if parameters["current_step"] == 1:
+            servers = EdgeServer.all()
+            for service in Service.all():
+                target = servers[(servers.index(service.server) + 1) % len(servers)]
+                if target.has_capacity_to_host(service):
+                    service.provision(target_server=target)
+
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == 30,
+        resource_management_algorithm=migrate_services,
+        dump_interval=float("inf"),
+        flow_storage=flow_storage,
+    )
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+    simulator.run_model()
+    return simulator
+
+
+def test_table_storage_keeps_the_types_of_values(dataset: dict):
+    object_storage = run_with_migrations(dataset=dataset, flow_storage="objects")
+    table_storage = run_with_migrations(dataset=dataset, flow_storage="table")
+
+    # Records are compared through their JSON representation, which tells integers and floats apart
+    assert len(object_storage.agent_metrics["NetworkFlow"]) > 0
+    object_records = json.dumps(object_storage.agent_metrics["NetworkFlow"], default=str)
+    assert json.dumps(table_storage.agent_metrics["NetworkFlow"], default=str) == object_records
+
+    object_storage.activate()
+    object_demands = [repr(link["bandwidth_demand"]) for link in NetworkLink.all()]
+    table_storage.activate()
+    assert [repr(link["bandwidth_demand"]) for link in NetworkLink.all()] == object_demands
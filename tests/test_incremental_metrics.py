@@ -0,0 +1,42 @@
+""" Tests the model-level metrics maintained incrementally by the simulator."""
+# EdgeSimPy components
+from edge_sim_py import *
+
+# Python libraries
+import pytest
+
+
+def get_total_power_consumption() -> float:
+    """Computes the power consumption of the infrastructure by iterating over all edge servers and network switches.
+
+    Returns:
+        float: Total power consumption.
+    """
+    devices = EdgeServer.all() + NetworkSwitch.all()
+    return sum(device.get_power_consumption() or 0 for device in devices)
+
+
+def test_power_consumption_matches_brute_force_sum(simulator: object):
+    assert simulator.collect()["Power Consumption"] == pytest.approx(get_total_power_consumption())
+
+
+def test_power_consumption_follows_link_changes(simulator: object):
+    simulator.collect()
+
+    links = NetworkLink.all()
+    for link in links[:10]:
+        link["active"] = False
+    assert simulator.collect()["Power Consumption"] == pytest.approx(get_total_power_consumption())
+
+    for link in links[10:20]:
+        link["bandwidth"] = 25
+    assert simulator.collect()["Power Consumption"] == pytest.approx(get_total_power_consumption())
+
+    for link in links[:10]:
+        link["active"] = True
+    assert simulator.collect()["Power Consumption"] == pytest.approx(get_total_power_consumption())
+
+
+def test_power_consumption_matches_brute_force_sum_while_running(simulator: object):
+    simulator.run_model()
+    assert simulator.collect()["Power Consumption"] == pytest.approx(get_total_power_consumption())
@@ -0,0 +1,254 @@
+""" Tests the collection, storage, and reading of simulation metrics."""
+# EdgeSimPy components
+from edge_sim_py import *
+from edge_sim_py.monitoring import MetricsTable, MetricsWriter, BackgroundMetricsWriter, MetricsReader, DeltaEncoder
+from edge_sim_py.monitoring import read_metrics, read_metrics_chunks, reconstruct_records
+from edge_sim_py.monitoring.metrics_writer import get_metrics_file_path
+
+# Python libraries
+import os
+import copy
+import random
+import msgpack
+import pytest
+
+
+def random_migrations(parameters: dict):
+    """Resource management algorithm that migrates services at random time steps, which creates network flows along the way.
+
+    Args:
+        parameters (dict): Resource management algorithm parameters.
+    """
+    for service in Service.all():
+        if not service.being_provisioned and random.random() < 0.05:
+            servers = [server for server in EdgeServer.all() if server != service.server and server.has_capacity_to_host(service)]
+            if len(servers) > 0:
+                service.provision(target_server=random.choice(servers))
+
+
+def run_simulation(dataset: dict, steps: int = 30, **options) -> object:
+    """Runs a simulation in which services are randomly migrated.
+
+    Args:
+        dataset (dict): Dataset.
+        steps (int, optional): Number of time steps. Defaults to 30.
+        options (dict): Additional Simulator arguments (e.g., metrics format and monitoring settings).
+
+    Returns:
+        object: Simulator object.
+    """
+    random.seed(1)
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == steps,
+        resource_management_algorithm=random_migrations,
+        **{**{"dump_interval": float("inf")}, **options},
+    )
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+    simulator.run_model()
+    return simulator
+
+
+def test_columnar_metrics_match_records(dataset: dict):
+    records = run_simulation(dataset=dataset, metrics_format="records")
+    columnar = run_simulation(dataset=dataset, metrics_format="columnar")
+
+    assert columnar.agent_metrics.keys() == records.agent_metrics.keys()
+    for class_name, table in columnar.agent_metrics.items():
+        assert isinstance(table, MetricsTable)
+        assert table.to_records() == records.agent_metrics[class_name]
+        assert table[-1] == records.agent_metrics[class_name][-1]
+
+        # Columns hold the values of each metric in the order records were collected
+        assert list(table.column("Time Step")) == [record["Time Step"] for record in records.agent_metrics[class_name]]
+
+
+def normalize(records: list) -> list:
+    """Converts records into the values they are read back as after being written to the disk (e.g., tuples become lists).
+
+    Args:
+        records (list): List of records.
+
+    Returns:
+        list: Normalized records.
+    """
+    return msgpack.unpackb(msgpack.packb(list(records)), strict_map_key=False)
+
+
+def test_metrics_writer_appends_and_rotates_chunks(tmp_path: object):
+    chunks = [[{"Object": f"User_{index}", "Time Step": step, "Delay": step * index} for index in range(20)] for step in range(6)]
+
+    writer = MetricsWriter(logs_directory=str(tmp_path), max_file_size=1000)
+    for chunk in chunks:
+        writer.write(name="User", records=chunk)
+    writer.close()
+
+    # Files are rotated without splitting chunks, and chunks are read back in the order they were written
+    file_sizes = [os.path.getsize(get_metrics_file_path(logs_directory=str(tmp_path), name="User", file_index=index)) for index in range(3)]
+    assert all(file_size <= 1000 for file_size in file_sizes)
+    assert list(read_metrics_chunks(logs_directory=str(tmp_path), name="User")) == chunks
+    assert list(read_metrics(logs_directory=str(tmp_path), name="User")) == [record for chunk in chunks for record in chunk]
+
+    # Writers replace the files of previous executions
+    writer = MetricsWriter(logs_directory=str(tmp_path))
+    writer.write(name="User", records=chunks[0])
+    writer.close()
+    assert not os.path.exists(get_metrics_file_path(logs_directory=str(tmp_path), name="User", file_index=1))
+    assert list(read_metrics_chunks(logs_directory=str(tmp_path), name="User")) == [chunks[0]]
+
+
+@pytest.mark.parametrize("metrics_format", ["records", "columnar"])
+def test_dumped_metrics_match_metrics_kept_in_memory(dataset: dict, tmp_path: object, metrics_format: str):
+    in_memory = run_simulation(dataset=dataset, metrics_format=metrics_format)
+    dumped = run_simulation(
+        dataset=dataset,
+        metrics_format=metrics_format,
+        dump_interval=7,
+        dump_mode="synchronous",
+        logs_directory=str(tmp_path),
+        max_log_file_size=4096,
+    )
+
+    assert os.path.exists(get_metrics_file_path(logs_directory=str(tmp_path), name="User", file_index=1))
+    for class_name, records in in_memory.agent_metrics.items():
+        assert list(read_metrics(logs_directory=str(tmp_path), name=class_name)) == normalize(records=records)
+
+    # Model-level records only differ by the name of the simulator they belong to
+    model_records = [{**record, **{"Object": str(in_memory)}} for record in read_metrics(logs_directory=str(tmp_path), name="Simulator")]
+    assert model_records == normalize(records=in_memory.model_metrics["Simulator"])
+
+
+def test_background_metrics_writer_matches_synchronous_writer(dataset: dict, tmp_path: object):
+    run_simulation(dataset=dataset, dump_interval=5, dump_mode="synchronous", logs_directory=str(tmp_path / "synchronous"), max_log_file_size=4096)
+    background = run_simulation(
+        dataset=dataset, dump_interval=5, dump_mode="background", logs_directory=str(tmp_path / "background"), max_log_file_size=4096
+    )
+
+    # Files are complete once the simulation ends, as the background thread is stopped when the simulation is over
+    assert isinstance(background.metrics_writer, BackgroundMetricsWriter) and background.metrics_writer.thread is None
+    for class_name in background.agent_metrics:
+        synchronous_chunks = list(read_metrics_chunks(logs_directory=str(tmp_path / "synchronous"), name=class_name))
+        assert list(read_metrics_chunks(logs_directory=str(tmp_path / "background"), name=class_name)) == synchronous_chunks
+
+
+def test_background_metrics_writer_reports_errors(tmp_path: object):
+    writer = BackgroundMetricsWriter(logs_directory=str(tmp_path))
+    writer.write(name="User", records=[{"Object": "User_1", "Time Step": 1}])
+    writer.write(name="User", records=[{"Object": "User_1", "Time Step": 2, "Model": object()}])
+
+    with pytest.raises(TypeError):
+        writer.flush()
+
+    writer.close()
+    assert list(read_metrics(logs_directory=str(tmp_path), name="User")) == [{"Object": "User_1", "Time Step": 1}]
+
+
+def select_records(records: list, interval: int = 1, fields: list = None) -> list:
+    """Selects the records of a given monitoring interval, keeping only a given set of fields.
+
+    Args:
+        records (list): List of records.
+        interval (int, optional): Number of time steps between each selected record. Defaults to 1.
+        fields (list, optional): Names of the fields kept in each record. Defaults to None (all fields are kept).
+
+    Returns:
+        list: Selected records.
+    """
+    fields = None if fields is None else ["Object", "Time Step"] + fields
+    return [{name: value for name, value in record.items() if fields is None or name in fields} for record in records if record["Time Step"] % interval == 0]
+
+
+def test_monitoring_settings_select_classes_steps_and_fields(dataset: dict):
+    monitoring = {
+        "EdgeServer": {"interval": 4, "fields": ["CPU Demand", "Power Consumption"]},
+        "User": {"fields": ["Coordinates"]},
+        "NetworkLink": {"enabled": False},
+        "Simulator": {"interval": 10},
+    }
+    full = run_simulation(dataset=dataset)
+    monitored = run_simulation(dataset=dataset, monitoring=monitoring)
+
+    assert "NetworkLink" not in monitored.agent_metrics
+    server_fields = ["CPU Demand", "Power Consumption"]
+    assert monitored.agent_metrics["EdgeServer"] == select_records(records=full.agent_metrics["EdgeServer"], interval=4, fields=server_fields)
+    assert monitored.agent_metrics["User"] == select_records(records=full.agent_metrics["User"], fields=["Coordinates"])
+    assert monitored.agent_metrics["Service"] == full.agent_metrics["Service"]
+    assert [record["Time Step"] for record in monitored.model_metrics["Simulator"]] == [0, 10, 20, 30]
+
+    with pytest.raises(Exception, match="Unsupported monitoring option"):
+        Simulator(monitoring={"User": {"period": 2}})
+    with pytest.raises(Exception, match="must be greater than zero"):
+        Simulator(monitoring={"User": {"interval": 0}})
+
+
+def test_delta_encoder_stores_changes_as_patches():
+    encoder = DeltaEncoder(keyframe_interval=3)
+    records = [
+        {"Object": "User_1", "Time Step": 0, "Coordinates": (0, 0), "Access History": {"1": [{"start": 1, "end": 3}]}},
+        {"Object": "User_1", "Time Step": 1, "Coordinates": (0, 0), "Access History": {"1": [{"start": 1, "end": 3}, {"start": 5, "end": 8}]}},
+        {"Object": "User_1", "Time Step": 2, "Coordinates": (2, 0), "Access History": {"1": [{"start": 1, "end": 4}, {"start": 5, "end": 8}]}},
+        {"Object": "User_1", "Time Step": 3, "Coordinates": (2, 0), "Access History": {"1": [{"start": 1, "end": 4}, {"start": 5, "end": 8}]}},
+    ]
+    encoded_records = [encoder.encode(record=record) for record in records]
+
+    assert encoded_records[0] == {**records[0], **{"Keyframe": True}}
+    assert encoded_records[1] == {"Object": "User_1", "Time Step": 1, "Patches": {"Access History": [[["1"], "extend", [{"start": 5, "end": 8}]]]}}
+    assert encoded_records[2] == {"Object": "User_1", "Time Step": 2, "Coordinates": (2, 0), "Patches": {"Access History": [[["1", 0, "end"], "set", 4]]}}
+    assert encoded_records[3] == {**records[3], **{"Keyframe": True}}
+    assert list(reconstruct_records(records=encoded_records)) == records
+
+    # Records that precede the first keyframe of an object cannot be reconstructed
+    assert list(reconstruct_records(records=encoded_records[1:])) == records[3:]
+
+
+@pytest.mark.parametrize("metrics_format", ["records", "columnar"])
+def test_delta_encoded_metrics_are_reconstructed(dataset: dict, tmp_path: object, metrics_format: str):
+    full = run_simulation(dataset=dataset)
+    delta = run_simulation(dataset=dataset, metrics_format=metrics_format, metrics_encoding="delta", keyframe_interval=10)
+    dumped = run_simulation(dataset=dataset, metrics_encoding="delta", keyframe_interval=10, dump_interval=7, logs_directory=str(tmp_path))
+
+    for class_name, records in full.agent_metrics.items():
+        assert list(reconstruct_records(records=delta.agent_metrics[class_name])) == records
+        assert list(reconstruct_records(records=read_metrics(logs_directory=str(tmp_path), name=class_name))) == normalize(records=records)
+
+    # Records are smaller than full records when metrics rarely change
+    assert sum(len(record) for record in delta.agent_metrics["EdgeServer"]) < sum(len(record) for record in full.agent_metrics["EdgeServer"]) / 2
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_metrics_reader_filters_records(dataset: dict, tmp_path: object, indexed: bool):
+    simulator = run_simulation(dataset=dataset)
+    records = normalize(records=simulator.agent_metrics["User"])
+
+    # Writing records in chunks of 5 time steps, with files large enough to hold at least two chunks
+    chunks = [[record for record in records if record["Time Step"] // 5 == chunk_index] for chunk_index in range(7)]
+    writer = MetricsWriter(logs_directory=str(tmp_path), max_file_size=2 * max(len(msgpack.packb(chunk)) for chunk in chunks))
+    for chunk in chunks:
+        writer.write(name="User", records=chunk)
+    writer.close()
+
+    reader = MetricsReader(logs_directory=str(tmp_path), name="User")
+    if indexed:
+        index = reader.build_index()
+        assert len(index["chunks"]) == 7 and len(index["files"]) > 1 and any(chunk[1] > 0 for chunk in index["chunks"])
+        assert MetricsReader(logs_directory=str(tmp_path), name="User").index == index
+    else:
+        assert reader.index is None
+
+    objects = [str(user) for user in User.all()[:3]]
+    expected = [{"Time Step": record["Time Step"], "Coordinates": record["Coordinates"]} for record in records if 12 <= record["Time Step"] <= 21]
+    assert list(reader.records()) == records
+    assert list(reader.records(start_step=12, end_step=21, fields=["Time Step", "Coordinates"])) == expected
+    assert list(reader.records(start_step=26)) == [record for record in records if record["Time Step"] >= 26]
+    assert list(reader.records(start_step=31)) == []
+    assert list(reader.records(end_step=3, objects=objects)) == [record for record in records if record["Time Step"] <= 3 and record["Object"] in objects]
+
+    batches = list(reader.columns(start_step=12, end_step=21, fields=["Time Step", "Coordinates"], batch_size=50))
+    assert [len(batch["Time Step"]) for batch in batches] == [50, 50, 50, 50]
+    assert [step for batch in batches for step in batch["Time Step"]] == [record["Time Step"] for record in expected]
+
+    # Indexes are discarded once the files change
+    writer.write(name="User", records=records[:1])
+    writer.close()
+    assert MetricsReader(logs_directory=str(tmp_path), name="User").index is None
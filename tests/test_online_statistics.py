@@ -0,0 +1,119 @@
+""" Tests the online statistics updated as agents are monitored."""
+# EdgeSimPy components
+from edge_sim_py import *
+from edge_sim_py.monitoring import QuantileSketch, RunningStatistics
+
+# Python libraries
+import copy
+import math
+import random
+import statistics
+import pytest
+
+
+def random_migrations(parameters: dict):
+    """Resource management algorithm that migrates services at random time steps.
+
+    Args:
+        parameters (dict): Resource management algorithm parameters.
+    """
+    for service in Service.all():
+        if not service.being_provisioned and random.random() < 0.05:
+            servers = [server for server in EdgeServer.all() if server != service.server and server.has_capacity_to_host(service)]
+            if len(servers) > 0:
+                service.provision(target_server=random.choice(servers))
+
+
+def test_running_statistics_match_batch_statistics():
+    random.seed(1)
+    values = [random.gauss(10, 4) for _ in range(1000)]
+
+    running_statistics = RunningStatistics()
+    for value in values:
+        running_statistics.update(value=value)
+
+    assert running_statistics.count == len(values)
+    assert running_statistics.mean == pytest.approx(statistics.mean(values))
+    assert running_statistics.variance == pytest.approx(statistics.variance(values))
+    assert running_statistics.minimum == min(values) and running_statistics.maximum == max(values)
+
+
+def test_quantile_sketch_estimates_have_bounded_relative_error():
+    random.seed(1)
+    values = [random.expovariate(0.1) - 5 for _ in range(5000)] + [0] * 100
+
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.update(value=value)
+
+    values.sort()
+    for quantile in [0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 1]:
+        expected = values[math.floor(quantile * (len(values) - 1))]
+        assert abs(sketch.get_quantile(quantile=quantile) - expected) <= 0.01 * abs(expected)
+
+    # Sketches whose buckets are merged keep estimating the largest values accurately
+    small_sketch = QuantileSketch(relative_accuracy=0.01, max_buckets=64)
+    for value in values:
+        small_sketch.update(value=value)
+    assert len(small_sketch.positive_buckets) <= 64
+    assert small_sketch.get_quantile(quantile=0.99) == sketch.get_quantile(quantile=0.99)
+
+
+def test_online_statistics_match_statistics_computed_from_records(dataset: dict):
+    random.seed(1)
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == 60,
+        resource_management_algorithm=random_migrations,
+        dump_interval=float("inf"),
+        collect_statistics=True,
+    )
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+    simulator.run_model()
+
+    # Server utilization
+    for server in EdgeServer.all():
+        utilization = [record["CPU Demand"] / record["CPU"] for record in simulator.agent_metrics["EdgeServer"] if record["Object"] == str(server)]
+        summary = simulator.statistics.get_summary(name="CPU Utilization", group=server.id)
+        assert summary["Count"] == len(utilization) == 61
+        assert summary["Mean"] == pytest.approx(statistics.mean(utilization))
+        assert summary["Maximum"] == max(utilization)
+
+    # User delays and SLA violations of each application
+    delays, requests, violations = {}, {}, {}
+    for record in simulator.agent_metrics["User"]:
+        user = User.find_by_id(record["Instance ID"])
+        for app_id, making_requests in record["Making Requests"].items():
+            if making_requests.get(str(record["Time Step"]), False):
+                delay = record["Delays"][app_id]
+                requests[int(app_id)] = requests.get(int(app_id), 0) + 1
+                if delay is None or delay > user.delay_slas[app_id]:
+                    violations[int(app_id)] = violations.get(int(app_id), 0) + 1
+                if delay is not None and delay != float("inf"):
+                    delays.setdefault(int(app_id), []).append(delay)
+
+    assert sum(requests.values()) > 0 and sum(len(values) for values in delays.values()) > 0
+    for application in Application.all():
+        assert simulator.statistics.get_counter(name="Requests", group=application.id) == requests.get(application.id, 0)
+        assert simulator.statistics.get_counter(name="SLA Violations", group=application.id) == violations.get(application.id, 0)
+
+        summary = simulator.statistics.get_summary(name="User Delay", group=application.id)
+        if application.id in delays:
+            assert summary["Count"] == len(delays[application.id])
+            assert summary["Mean"] == pytest.approx(statistics.mean(delays[application.id]))
+        else:
+            assert summary is None
+
+    # Migration durations
+    durations = [
+        record["Last Migration"]["end"] - record["Last Migration"]["start"]
+        for record in simulator.agent_metrics["Service"]
+        if record["Last Migration"] is not None and record["Last Migration"]["end"] == record["Time Step"]
+    ]
+    assert len(durations) > 0
+    assert simulator.statistics.get_summary(name="Migration Duration")["Count"] == len(durations)
+    assert simulator.statistics.get_summary(name="Migration Duration")["Mean"] == pytest.approx(statistics.mean(durations))
+
+    metric_names = ["CPU Utilization", "RAM Utilization", "Disk Utilization", "User Delay", "Requests", "SLA Violations", "Migration Duration"]
+    assert set(simulator.statistics.to_dict()) == set(metric_names)
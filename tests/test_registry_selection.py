@@ -0,0 +1,105 @@
+""" Tests the container registry selections cached by the network topology."""
+# EdgeSimPy components
+from edge_sim_py import *
+
+# Python libraries
+import networkx as nx
+
+
+def select_registry_by_scanning(server: object, digest: str) -> object:
+    """Selects the container registry from which a layer would be pulled to an edge server by scanning all registries.
+
+    Args:
+        server (object): Edge server that pulls the layer.
+        digest (str): Layer digest.
+
+    Returns:
+        object: Selected registry (None if no registry has the layer).
+    """
+    topology = server.model.topology
+    registries_with_layer = []
+    for registry in [registry for registry in ContainerRegistry.all() if registry.available and registry.server]:
+        if any(layer.digest == digest for layer in registry.server.container_layers):
+            path = nx.shortest_path(G=topology, source=registry.server.base_station.network_switch, target=server.base_station.network_switch)
+            registries_with_layer.append((registry, path))
+
+    registries_with_layer = sorted(registries_with_layer, key=lambda registry_with_layer: len(registry_with_layer[1]))
+    return registries_with_layer[0][0] if len(registries_with_layer) > 0 else None
+
+
+def assert_selections_match_scan(layers: list):
+    """Checks that the cached registry selections of all edge servers match the ones found by scanning all registries.
+
+    Args:
+        layers (list): Layers whose registry selections are checked.
+    """
+    for server in EdgeServer.all():
+        for layer in layers:
+            registry, _ = server._select_container_registry(layer=layer)
+            assert registry == select_registry_by_scanning(server=server, digest=layer.digest)
+
+
+def test_selections_follow_layer_removals_from_registry_hosts(simulator: object):
+    registry_hosts = [registry.server for registry in ContainerRegistry.all()]
+    layers = list({layer.digest: layer for layer in registry_hosts[0].container_layers}.values())
+    assert_selections_match_scan(layers=layers)
+
+    # Removing layers from a registry host through the list methods (and restoring them through an assignment)
+    removed_layers = [registry_hosts[0].container_layers.pop(), registry_hosts[0].container_layers.pop(0)]
+    assert_selections_match_scan(layers=layers)
+
+    registry_hosts[0].container_layers.clear()
+    assert_selections_match_scan(layers=layers)
+
+    registry_hosts[0].container_layers = removed_layers
+    assert_selections_match_scan(layers=layers)
+
+    del registry_hosts[0].container_layers[0]
+    assert_selections_match_scan(layers=layers)
+
+
+def assert_catalog_matches_scan():
+    """Checks that the registries listed by the catalog under each layer digest match the ones found by scanning all registries."""
+    digests = {layer.digest for layer in ContainerLayer.all()}
+    for digest in digests:
+        expected_registries = [
+            registry
+            for registry in ContainerRegistry.all()
+            if registry.available and registry.server and registry.server.container_layers.has_digest(digest=digest)
+        ]
+        assert sorted(ContainerRegistry.find_by_layer(digest=digest), key=lambda registry: registry.id) == expected_registries
+
+
+def test_catalog_follows_registry_changes(simulator: object):
+    registry = ContainerRegistry.first()
+    layers = list({layer.digest: layer for layer in registry.server.container_layers}.values())
+    other_server = next(server for server in EdgeServer.all() if len(server.container_registries) == 0)
+    assert_catalog_matches_scan()
+
+    registry.available = False
+    assert_catalog_matches_scan()
+    assert_selections_match_scan(layers=layers)
+
+    registry.available = True
+    registry.server = other_server
+    assert_catalog_matches_scan()
+    assert_selections_match_scan(layers=layers)
+
+    other_server.container_layers.append(layers[0])
+    assert_catalog_matches_scan()
+    assert_selections_match_scan(layers=layers)
+
+
+def test_layer_changes_only_discard_the_selections_of_their_digests(simulator: object):
+    registry_host = ContainerRegistry.first().server
+    layers = list({layer.digest: layer for layer in registry_host.container_layers}.values())
+    assert_selections_match_scan(layers=layers)
+
+    # Removing all layers with a given digest from the registry host
+    removed_digest = layers[-1].digest
+    for layer in [layer for layer in registry_host.container_layers if layer.digest == removed_digest]:
+        registry_host.container_layers.remove(layer)
+
+    assert removed_digest not in simulator.topology._registry_routes
+    assert all(layer.digest in simulator.topology._registry_routes for layer in layers if layer.digest != removed_digest)
+    assert_selections_match_scan(layers=layers)
@@ -0,0 +1,12 @@
+""" Tests the execution of multiple simulation replicates."""
+# EdgeSimPy components
+from edge_sim_py import run_replicates
+
+# Python libraries
+import pytest
+
+
+@pytest.mark.parametrize("workers", [0, -2, 1.5])
+def test_invalid_numbers_of_workers_are_rejected(dataset: dict, workers: object):
+    with pytest.raises(Exception, match="Invalid number of workers"):
+        run_replicates(dataset=dataset, simulator_kwargs={}, seeds=[1, 2], workers=workers)
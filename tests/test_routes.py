@@ -0,0 +1,75 @@
+""" Tests the shortest paths and path delays cached by the Topology class."""
+# EdgeSimPy components
+from edge_sim_py import *
+
+# Python libraries
+import networkx as nx
+import pytest
+
+
+def assert_routes_match_networkx(topology: object, weight: str):
+    """Checks that the cached shortest paths and path delays of a topology match the ones computed from scratch by NetworkX.
+
+    Args:
+        topology (object): Topology object.
+        weight (str): Link attribute used as the path weight.
+    """
+    for source in topology.nodes:
+        for target in topology.nodes:
+            expected_path = nx.shortest_path(G=topology, source=source, target=target, weight=weight)
+            assert topology.get_shortest_path(source=source, target=target, weight=weight) == expected_path
+            assert topology.calculate_path_delay(path=expected_path) == nx.path_weight(G=topology, path=expected_path, weight="delay")
+
+
+@pytest.mark.parametrize("graph_backend", ["networkx", "compiled"])
+@pytest.mark.parametrize("weight", [None, "delay"])
+def test_cached_routes_follow_link_changes(simulator: object, monkeypatch: object, graph_backend: str, weight: str):
+    topology = simulator.topology
+    monkeypatch.setattr(topology, "graph_backend", graph_backend)
+    assert_routes_match_networkx(topology=topology, weight=weight)
+
+    # Changing link delays
+    for link in NetworkLink.all()[::3]:
+        link.delay = link.id % 5 + 2
+    assert_routes_match_networkx(topology=topology, weight=weight)
+
+    link = NetworkLink.all()[1]
+    link["delay"] = 0
+    assert_routes_match_networkx(topology=topology, weight=weight)
+
+    # Removing links (while keeping the topology connected) and adding them back
+    removed_links = []
+    for _ in range(3):
+        bridges = [set(bridge) for bridge in nx.bridges(topology)]
+        link = next(link for link in NetworkLink.all() if topology.has_edge(*link["nodes"]) and set(link["nodes"]) not in bridges)
+        topology.remove_edge(*link["nodes"])
+        removed_links.append(link)
+        assert_routes_match_networkx(topology=topology, weight=weight)
+
+    for link in removed_links:
+        topology.add_edge(link["nodes"][0], link["nodes"][1])
+        topology._adj[link["nodes"][0]][link["nodes"][1]] = link
+        topology._adj[link["nodes"][1]][link["nodes"][0]] = link
+    assert_routes_match_networkx(topology=topology, weight=weight)
+
+
+def test_cached_routes_are_not_changed_by_callers(simulator: object):
+    topology = simulator.topology
+    source, target = list(topology.nodes)[0], list(topology.nodes)[-1]
+
+    path = topology.get_shortest_path(source=source, target=target, weight="delay")
+    path.reverse()
+    assert topology.get_shortest_path(source=source, target=target, weight="delay") == list(reversed(path))
+
+
+def test_link_changes_discard_registry_selections(simulator: object):
+    topology = simulator.topology
+    server = next(server for server in EdgeServer.all() if len(server.container_registries) == 0)
+    layer = ContainerLayer.find_by(attribute_name="digest", attribute_value="sha256:base")
+
+    server._select_container_registry(layer=layer)
+    assert len(topology._registry_routes) > 0
+
+    NetworkLink.first().delay = 5
+    assert topology._registry_routes == {} and topology._routes == {} and topology._path_delays == {}
+    assert server._select_container_registry(layer=layer)[0] in ContainerRegistry.find_by_layer(digest="sha256:base")
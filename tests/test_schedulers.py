@@ -0,0 +1,126 @@
+""" Tests the agent activation schedulers."""
+# EdgeSimPy components
+from edge_sim_py import *
+from edge_sim_py.activation_schedulers import DefaultScheduler, BaseScheduler, RandomScheduler
+
+# Python libraries
+import copy
+import pytest
+import random
+
+
+class ExhaustiveScheduler(DefaultScheduler):
+    """Scheduler that activates every agent at each time step, in the same order as the DefaultScheduler."""
+
+    def step(self):
+        """Defines what happens at each step of the simulation model."""
+        for component_class in [EdgeServer, Service, Topology, NetworkFlow, User, ContainerRegistry]:
+            for agent in list(component_class.all()):
+                agent.step()
+
+        for component_class in [NetworkSwitch, NetworkLink, BaseStation, ContainerLayer, ContainerImage, Application]:
+            for agent in list(component_class.all()):
+                agent.step()
+
+        self.steps += 1
+        self.time += 1
+
+
+def random_migrations(parameters: dict):
+    """Resource management algorithm that migrates services at random.
+
+    Args:
+        parameters (dict): Resource management algorithm parameters.
+    """
+    for service in Service.all():
+        if not service.being_provisioned and random.random() < 0.05:
+            servers = [server for server in EdgeServer.all() if server != service.server and server.has_capacity_to_host(service)]
+            if len(servers) > 0:
+                service.provision(target_server=random.choice(servers))
+
+
+def run_simulation(dataset: dict, scheduler: type) -> object:
+    """Runs a simulation with a given agent activation scheduler.
+
+    Args:
+        dataset (dict): Dataset.
+        scheduler (type): Agent activation scheduler class.
+
+    Returns:
+        object: Simulator object.
+    """
+    random.seed(1)
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == 60,
+        resource_management_algorithm=random_migrations,
+        dump_interval=float("inf"),
+        scheduler=scheduler,
+    )
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+    simulator.run_model()
+    return simulator
+
+
+def test_default_scheduler_matches_activating_all_agents(dataset: dict):
+    exhaustive = run_simulation(dataset=dataset, scheduler=ExhaustiveScheduler)
+    default = run_simulation(dataset=dataset, scheduler=DefaultScheduler)
+
+    assert len(default.agent_metrics["NetworkFlow"]) > 0
+    assert default.agent_metrics == exhaustive.agent_metrics
+
+
+class CountingApplication(Application):
+    """Application that counts how many times it is activated."""
+
+    def step(self):
+        """Method that executes the events involving the object at each time step."""
+        self.activations = getattr(self, "activations", 0) + 1
+
+
+def test_default_scheduler_activates_passive_agents_that_override_step(simulator: object):
+    application = simulator.initialize_agent(agent=CountingApplication())
+    simulator.run_model()
+
+    assert application.activations == simulator.schedule.steps
+
+
+class SpawningApplication(Application):
+    """Application that logs its activations and, once activated for the first time, removes another application from the schedule
+    and adds a new one to it.
+    """
+
+    def step(self):
+        """Method that executes the events involving the object at each time step."""
+        self.model.activation_log.append(self)
+
+        if getattr(self, "victim", None) is not None:
+            self.model.schedule.remove(self.victim)
+            self.model.initialize_agent(agent=SpawningApplication())
+            self.victim = None
+
+
+@pytest.mark.parametrize("scheduler", [BaseScheduler, RandomScheduler])
+def test_schedulers_activate_each_agent_once_per_step(scheduler: type):
+    random.seed(1)
+    simulator = Simulator(scheduler=scheduler)
+    simulator.activation_log = []
+    applications = [simulator.initialize_agent(agent=SpawningApplication()) for _ in range(20)]
+    applications[0].victim = applications[-1]
+    applications[-1].victim = applications[0]
+
+    simulator.schedule.step()
+    activated_agents = simulator.activation_log
+
+    # One of the applications that remove each other is activated, the other one is not, and the application added during the step
+    # is activated in the same step
+    assert len(activated_agents) == 20 and len(set(activated_agents)) == 20
+    assert (applications[0] in activated_agents) != (applications[-1] in activated_agents)
+    assert all(application in activated_agents for application in applications[1:-1])
+    if scheduler is BaseScheduler:
+        assert activated_agents[:19] == applications[:19] and activated_agents[19] not in applications
+
+    simulator.activation_log = []
+    simulator.schedule.step()
+    assert len(simulator.activation_log) == 20 and set(simulator.activation_log) == set(simulator.schedule._agents.values())
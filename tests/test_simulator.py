@@ -0,0 +1,39 @@
+""" Tests the isolation of the component registries of simulators kept in memory at once."""
+# EdgeSimPy components
+from edge_sim_py import *
+
+# Python libraries
+import copy
+
+
+def test_simulators_get_distinct_ids(dataset: dict):
+    first_simulator = Simulator()
+    second_simulator = Simulator()
+
+    assert second_simulator.id == first_simulator.id + 1
+    assert Simulator.find_by_id(first_simulator.id) is first_simulator
+    assert Simulator.find_by_id(second_simulator.id) is second_simulator
+    assert Simulator.all()[-2:] == [first_simulator, second_simulator]
+
+
+def test_simulators_keep_separate_component_registries(dataset: dict):
+    first_simulator = Simulator()
+    first_simulator.initialize(input_file=copy.deepcopy(dataset))
+    first_servers = EdgeServer.all()
+
+    second_simulator = Simulator()
+    second_simulator.initialize(input_file=copy.deepcopy(dataset))
+    second_servers = EdgeServer.all()
+    applications = Application.count()
+    Application()
+
+    assert len(second_servers) == len(first_servers)
+    assert not any(server is other_server for server in first_servers for other_server in second_servers)
+
+    first_simulator.activate()
+    assert EdgeServer.all() == first_servers
+    assert Application.count() == applications
+
+    second_simulator.activate()
+    assert EdgeServer.all() == second_servers
+    assert Application.count() == applications + 1
@@ -0,0 +1,84 @@
+""" Tests that the "next_event" time advance mechanism produces the same results as the "fixed_increment" mechanism."""
+# EdgeSimPy components
+from edge_sim_py import *
+
+# Python libraries
+import copy
+import random
+import pytest
+
+
+def periodic_migrations(parameters: dict):
+    """Resource management algorithm that migrates services every 7 time steps and declares the steps it acts on.
+
+    Args:
+        parameters (dict): Resource management algorithm parameters.
+    """
+    current_step = parameters["current_step"]
+    simulator = EdgeServer.first().model
+    simulator.schedule_wake_up(step=(current_step // 7 + 1) * 7)
+
+    if current_step % 7 == 0:
+        for service in Service.all():
+            if not service.being_provisioned and random.random() < 0.3:
+                servers = [server for server in EdgeServer.all() if server != service.server and server.has_capacity_to_host(service)]
+                if len(servers) > 0:
+                    service.provision(target_server=random.choice(servers))
+
+
+def random_migrations(parameters: dict):
+    """Resource management algorithm that migrates services at random time steps without declaring the steps it acts on.
+
+    Args:
+        parameters (dict): Resource management algorithm parameters.
+    """
+    for service in Service.all():
+        if not service.being_provisioned and random.random() < 0.05:
+            servers = [server for server in EdgeServer.all() if server != service.server and server.has_capacity_to_host(service)]
+            if len(servers) > 0:
+                service.provision(target_server=random.choice(servers))
+
+
+def run_simulation(dataset: dict, time_advance: str, resource_management_algorithm: object, monitoring: dict = None) -> object:
+    """Runs a simulation with a given time advance mechanism.
+
+    Args:
+        dataset (dict): Dataset.
+        time_advance (str): Time advance mechanism.
+        resource_management_algorithm (object): Resource management algorithm.
+        monitoring (dict, optional): Monitoring settings of each agent class. Defaults to None.
+
+    Returns:
+        object: Simulator object.
+    """
+    random.seed(1)
+    simulator = Simulator(
+        tick_duration=1,
+        tick_unit="seconds",
+        stopping_criterion=lambda model: model.schedule.steps == 60,
+        resource_management_algorithm=resource_management_algorithm,
+        dump_interval=float("inf"),
+        time_advance=time_advance,
+        collect_statistics=True,
+        monitoring=monitoring,
+    )
+    simulator.initialize(input_file=copy.deepcopy(dataset))
+    simulator.run_model()
+    return simulator
+
+
+@pytest.mark.parametrize("algorithm", [lambda parameters: None, periodic_migrations, random_migrations])
+@pytest.mark.parametrize("monitoring", [None, {"User": {"interval": 4}, "NetworkFlow": {"enabled": False}, "Service": {"interval": 3}}])
+def test_next_event_matches_fixed_increment_records(dataset: dict, algorithm: object, monitoring: dict):
+    fixed_increment = run_simulation(dataset=dataset, time_advance="fixed_increment", resource_management_algorithm=algorithm, monitoring=monitoring)
+    next_event = run_simulation(dataset=dataset, time_advance="next_event", resource_management_algorithm=algorithm, monitoring=monitoring)
+
+    assert next_event.schedule.steps == fixed_increment.schedule.steps
+    assert next_event.agent_metrics == fixed_increment.agent_metrics
+    assert next_event.statistics.to_dict() == fixed_increment.statistics.to_dict()
+    assert next_event.collect() == fixed_increment.collect()
+
+    # Agents that were not monitored in the last skipped time steps are still brought up to date
+    next_event_histories = [access_pattern.history for user in User.all() for access_pattern in user.access_patterns.values()]
+    fixed_increment.activate()
+    assert [access_pattern.history for user in User.all() for access_pattern in user.access_patterns.values()] == next_event_histories